@@ -1,13 +1,20 @@
 from .junit import write_junit
 from .report import write_report
+from .run_artifacts import BaselineComparisonError, RunArtifacts, write_run_artifacts
 from .run_log import write_run_log
 from .summary import build_summary, create_run_dir, write_summary
+from .trace_events import build_trace_events, write_trace_events
 
 __all__ = [
+    "BaselineComparisonError",
+    "RunArtifacts",
     "build_summary",
+    "build_trace_events",
     "create_run_dir",
     "write_junit",
     "write_report",
+    "write_run_artifacts",
     "write_run_log",
     "write_summary",
+    "write_trace_events",
 ]
@@ -177,6 +177,29 @@ _REPORT_TEMPLATE = """<!doctype html>
       font-size: 12px;
       margin-right: 6px;
     }
+    .breakdown {
+      display: flex;
+      height: 16px;
+      border-radius: 8px;
+      overflow: hidden;
+      background: rgba(31, 42, 48, 0.08);
+      margin: 8px 0;
+    }
+    .breakdown span { display: block; height: 100%; }
+    .legend {
+      display: flex;
+      flex-wrap: wrap;
+      gap: 12px;
+      font-size: 12px;
+      color: var(--muted);
+    }
+    .legend i {
+      display: inline-block;
+      width: 10px;
+      height: 10px;
+      border-radius: 2px;
+      margin-right: 4px;
+    }
     @keyframes rise {
       from { opacity: 0; transform: translateY(10px); }
       to { opacity: 1; transform: translateY(0); }
@@ -196,6 +219,10 @@ _REPORT_TEMPLATE = """<!doctype html>
   </header>
   <main>
     <section class="grid" id="kpis"></section>
+    <section class="card" id="timing-section" hidden>
+      <h2 class="section-title">Time Breakdown (mean per case)</h2>
+      <div id="suite-breakdown"></div>
+    </section>
     <section class="card">
       <h2 class="section-title">Cases</h2>
       <div class="filters" id="filters"></div>
@@ -218,6 +245,7 @@ _REPORT_TEMPLATE = """<!doctype html>
         <div>
           <div id="case-meta"></div>
           <div id="case-metrics"></div>
+          <div id="case-breakdown"></div>
           <div id="case-failure"></div>
         </div>
         <div>
@@ -273,6 +301,36 @@ _REPORT_TEMPLATE = """<!doctype html>
       kpiWrap.appendChild(card);
     });
 
+    // The wall-time partition only: tool_ms and rate_limit_wait_ms fall within tool_wait_ms.
+    const timingParts = [
+      ["spawn_ms", "Spawn", "#8d99ae"],
+      ["agent_ms", "Agent", "#1f7a8c"],
+      ["tool_wait_ms", "Tools", "#e07a5f"],
+      ["assertions_ms", "Assertions", "#f2cc8f"],
+      ["harness_ms", "RunLedger", "#6d597a"],
+    ];
+
+    function renderBreakdown(values) {
+      const total = timingParts.reduce((sum, [key]) => sum + (values[key] || 0), 0);
+      if (!total) return "";
+      const segments = timingParts.map(([key, label, color]) => {
+        const value = values[key] || 0;
+        const pct = (100 * value / total).toFixed(2);
+        return `<span style="width:${pct}%;background:${color}" title="${label}: ${value.toFixed(1)} ms"></span>`;
+      }).join("");
+      const legend = timingParts.map(([key, label, color]) =>
+        `<span><i style="background:${color}"></i>${label} ${(values[key] || 0).toFixed(1)} ms</span>`
+      ).join("");
+      return `<div class="breakdown">${segments}</div><div class="legend">${legend}</div>`;
+    }
+
+    if (metrics.agent_ms) {
+      const means = {};
+      timingParts.forEach(([key]) => { means[key] = metrics[key]?.mean || 0; });
+      document.getElementById("suite-breakdown").innerHTML = renderBreakdown(means);
+      document.getElementById("timing-section").hidden = false;
+    }
+
     const statusFilters = ["all", "pass", "fail", "error", "skipped"];
     const filters = document.getElementById("filters");
     let activeFilter = "all";
@@ -352,6 +410,8 @@ _REPORT_TEMPLATE = """<!doctype html>
         <p>Tokens in/out: <strong>${item.tokens_in ?? "n/a"}</strong> / <strong>${item.tokens_out ?? "n/a"}</strong></p>
         <p>Cost USD: <strong>${item.cost_usd ?? "n/a"}</strong> • Steps: <strong>${item.steps ?? "n/a"}</strong></p>
       `;
+      document.getElementById("case-breakdown").innerHTML =
+        item.timings ? renderBreakdown(item.timings) : "";
       const failure = item.failure_reason || "None";
       document.getElementById("case-failure").innerHTML = `<p>Failure: <strong>${failure}</strong></p>`;
       renderTrace();
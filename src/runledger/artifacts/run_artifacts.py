@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from runledger.baseline.io import load_baseline
+from runledger.baseline.models import BaselineSummary
+from runledger.config.models import SuiteConfig
+from runledger.regression import compute_regression
+from runledger.runner.models import SuiteResult
+
+from .junit import write_junit
+from .report import write_report
+from .run_log import write_run_log
+from .summary import build_summary, create_run_dir, write_summary
+
+
+class BaselineComparisonError(Exception):
+    """The baseline could not be loaded or compared against the run."""
+
+
+@dataclass(frozen=True)
+class RunArtifacts:
+    run_dir: Path
+    run_id: str
+    summary: dict[str, Any]
+    regression: dict[str, Any] | None
+    passed: bool
+
+
+def write_run_artifacts(
+    base_dir: Path,
+    *,
+    suite: SuiteConfig,
+    suite_path: Path,
+    suite_result: SuiteResult,
+    baseline_path: Path | None = None,
+) -> RunArtifacts:
+    """Write run.jsonl, summary.json, junit.xml and report.html for a finished run.
+
+    With `baseline_path`, the run is also gated against that baseline; failures to load
+    or compare it raise `BaselineComparisonError` after the run directory is created.
+    """
+    run_dir, run_id = create_run_dir(base_dir, suite.suite_name)
+    generated_at = datetime.now(timezone.utc)
+
+    regression = None
+    if baseline_path is not None:
+        summary_base = build_summary(
+            suite=suite,
+            suite_path=suite_path,
+            suite_result=suite_result,
+            run_id=run_id,
+            generated_at=generated_at,
+        )
+        try:
+            regression = compute_regression(
+                baseline=load_baseline(baseline_path),
+                current=BaselineSummary.model_validate(summary_base),
+                thresholds=suite.regression,
+                baseline_path=baseline_path,
+            )
+        except Exception as exc:
+            raise BaselineComparisonError(str(exc)) from exc
+
+    summary = build_summary(
+        suite=suite,
+        suite_path=suite_path,
+        suite_result=suite_result,
+        run_id=run_id,
+        regression=regression,
+        generated_at=generated_at,
+    )
+    write_run_log(run_dir, suite_result.cases)
+    write_summary(
+        run_dir,
+        suite=suite,
+        suite_path=suite_path,
+        suite_result=suite_result,
+        run_id=run_id,
+        regression=regression,
+        generated_at=generated_at,
+    )
+    write_junit(run_dir, suite.suite_name, suite_result.cases)
+    write_report(run_dir, summary=summary, run_log_path=run_dir / "run.jsonl")
+    passed = suite_result.passed and (regression is None or regression.get("passed", True))
+    return RunArtifacts(
+        run_dir=run_dir,
+        run_id=run_id,
+        summary=summary,
+        regression=regression,
+        passed=passed,
+    )
@@ -10,8 +10,11 @@ import uuid
 from runledger import __version__ as runledger_version
 from runledger.config.models import SuiteConfig
 from runledger.runner.models import CaseResult, SuiteResult
+from runledger.runner.timings import TIMING_FIELDS
 from runledger.util.redaction import redact
 
+RESOURCE_FIELDS = ("cpu_user_s", "cpu_sys_s", "peak_rss_mb", "ctx_switches")
+
 
 def create_run_dir(base_dir: Path, suite_name: str, run_id: str | None = None) -> tuple[Path, str]:
     if run_id is None:
@@ -123,6 +126,14 @@ def build_summary(
         "cost_usd": _metric_summary([case.cost_usd for case in cases_list]),
         "steps": _metric_summary([case.steps for case in cases_list]),
     }
+    if any(case.peak_rss_mb is not None for case in cases_list):
+        for name in RESOURCE_FIELDS:
+            metrics[name] = _metric_summary([getattr(case, name) for case in cases_list])
+    if any(case.timings for case in cases_list):
+        for name in TIMING_FIELDS:
+            metrics[name] = _metric_summary(
+                [case.timings.get(name) if case.timings else None for case in cases_list]
+            )
 
     exit_status = "success"
     if cases_error:
@@ -194,6 +205,20 @@ def build_summary(
         ],
     }
 
+    for case_summary, case in zip(summary["cases"], cases_list):  # type: ignore[arg-type]
+        if case.timings is not None:
+            case_summary["timings"] = case.timings
+        if case.peak_rss_mb is not None:
+            case_summary["resources"] = {name: getattr(case, name) for name in RESOURCE_FIELDS}
+        if case.samples is not None:
+            case_summary["samples"] = case.samples
+
+    if suite_result.repeat > 1:
+        summary["run"]["repeat"] = suite_result.repeat  # type: ignore[index]
+
+    if suite_result.tool_cache is not None:
+        summary["aggregates"]["tool_cache"] = suite_result.tool_cache  # type: ignore[index]
+
     if policy_snapshot is None:
         policy_snapshot = _policy_snapshot(suite)
     if policy_snapshot is not None:
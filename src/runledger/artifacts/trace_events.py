@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from runledger.runner.models import CaseResult
+from runledger.util.redaction import redact
+
+# Chrome trace-event format (loadable in Perfetto / chrome://tracing). The runner is one
+# process with a "cases" track, one track per tool worker and one for cassette replies;
+# each agent subprocess gets its own process track.
+_RUNNER_PID = 1
+_CASES_TID = 1
+_CASSETTE_TRACK = "cassette"
+_CASE_INSTANTS = {"task_error", "assertion_failure", "budget_failure", "cassette_append"}
+
+
+def _us(seconds: float) -> int:
+    return int(round(seconds * 1_000_000))
+
+
+class _TraceBuilder:
+    def __init__(self, origin: float):
+        self.origin = origin
+        self.events: list[dict[str, Any]] = []
+        self._runner_tracks: dict[str, int] = {}
+        self._named_processes: set[int] = set()
+        self._process_meta(_RUNNER_PID, "runledger", sort_index=0)
+        self._thread_meta(_RUNNER_PID, _CASES_TID, "cases")
+
+    def _process_meta(self, pid: int, name: str, *, sort_index: int) -> None:
+        self._named_processes.add(pid)
+        self.events.append(
+            {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": name}}
+        )
+        self.events.append(
+            {
+                "ph": "M",
+                "name": "process_sort_index",
+                "pid": pid,
+                "tid": 0,
+                "args": {"sort_index": sort_index},
+            }
+        )
+
+    def _thread_meta(self, pid: int, tid: int, name: str) -> None:
+        self.events.append(
+            {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}}
+        )
+
+    def runner_track(self, name: str) -> int:
+        tid = self._runner_tracks.get(name)
+        if tid is None:
+            tid = _CASES_TID + 1 + len(self._runner_tracks)
+            self._runner_tracks[name] = tid
+            self._thread_meta(_RUNNER_PID, tid, name)
+        return tid
+
+    def agent_track(self, pid: int, case_id: str) -> tuple[int, int]:
+        if pid not in self._named_processes:
+            sort_index = len(self._named_processes)
+            self._process_meta(pid, f"agent {pid} ({case_id})", sort_index=sort_index)
+            self._thread_meta(pid, pid, "agent")
+        return pid, pid
+
+    def span(
+        self,
+        track: tuple[int, int],
+        name: str,
+        start: float,
+        duration_s: float,
+        args: dict[str, Any] | None = None,
+        category: str = "runledger",
+    ) -> None:
+        event: dict[str, Any] = {
+            "ph": "X",
+            "name": name,
+            "cat": category,
+            "pid": track[0],
+            "tid": track[1],
+            "ts": _us(start - self.origin),
+            "dur": max(_us(duration_s), 0),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(
+        self,
+        track: tuple[int, int],
+        name: str,
+        at: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        event: dict[str, Any] = {
+            "ph": "i",
+            "s": "t",
+            "name": name,
+            "pid": track[0],
+            "tid": track[1],
+            "ts": _us(at - self.origin),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+
+def _case_bounds(case: CaseResult) -> tuple[float, float] | None:
+    # case_end is stamped when the case finishes, so wall_ms locates the start precisely.
+    stamps = [event["timestamp"] for event in case.trace if "timestamp" in event]
+    if not stamps:
+        return None
+    end = max(stamps)
+    return min(min(stamps), end - case.wall_ms / 1000), end
+
+
+def build_trace_events(cases: Iterable[CaseResult]) -> dict[str, Any]:
+    cases = list(cases)
+    bounds = {case.case_id: _case_bounds(case) for case in cases}
+    starts = [bound[0] for bound in bounds.values() if bound is not None]
+    builder = _TraceBuilder(min(starts) if starts else 0.0)
+    cases_track = (_RUNNER_PID, _CASES_TID)
+
+    for case in cases:
+        bound = bounds[case.case_id]
+        if bound is None:
+            continue
+        start, end = bound
+        builder.span(
+            cases_track,
+            case.case_id,
+            start,
+            end - start,
+            {
+                "passed": case.passed,
+                "failure": case.failure.type if case.failure else None,
+                "timings": case.timings,
+            },
+            category="case",
+        )
+
+        agent_pid = next(
+            (e.get("agent_pid") for e in case.trace if e.get("type") == "task_start"),
+            None,
+        )
+        agent_track = builder.agent_track(agent_pid, case.case_id) if agent_pid else cases_track
+        calls: dict[str, dict[str, Any]] = {}
+        for event in case.trace:
+            event_type = event.get("type")
+            at = event.get("timestamp")
+            if at is None:
+                continue
+            if event.get("agent_ms") is not None:
+                name = f"turn -> {event_type}"
+                if event_type == "tool_call":
+                    name = f"turn -> {event.get('name')}"
+                builder.span(
+                    agent_track,
+                    name,
+                    at - event["agent_ms"] / 1000,
+                    event["agent_ms"] / 1000,
+                    {"case_id": case.case_id},
+                    category="agent",
+                )
+            if event_type == "tool_call":
+                calls[str(event.get("call_id"))] = event
+            elif event_type == "tool_result":
+                call = calls.get(str(event.get("call_id")), {})
+                args = {
+                    key: event[key]
+                    for key in ("call_id", "ok", "error", "error_type", "rate_limit_wait_ms")
+                    if event.get(key) is not None
+                }
+                args["case_id"] = case.case_id
+                if event.get("duration_ms") is not None:
+                    track = builder.runner_track(event.get("worker") or "tools")
+                    duration_s = event["duration_ms"] / 1000
+                    span_start = at - duration_s
+                else:
+                    track = builder.runner_track(_CASSETTE_TRACK)
+                    span_start = call.get("timestamp", at)
+                    duration_s = at - span_start
+                builder.span(
+                    (_RUNNER_PID, track),
+                    str(call.get("name", "tool")),
+                    span_start,
+                    duration_s,
+                    redact(args),
+                    category="tool",
+                )
+            elif event_type == "log":
+                builder.instant(
+                    agent_track,
+                    f"log: {event.get('level', 'info')}",
+                    at,
+                    redact({"message": event.get("message"), "data": event.get("data")}),
+                )
+            elif event_type in _CASE_INSTANTS:
+                builder.instant(cases_track, str(event_type), at, {"case_id": case.case_id})
+
+    return {"traceEvents": builder.events, "displayTimeUnit": "ms"}
+
+
+def write_trace_events(path: Path, cases: Iterable[CaseResult]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(build_trace_events(cases), separators=(",", ":"), ensure_ascii=False),
+        encoding="utf-8",
+    )
+    return path
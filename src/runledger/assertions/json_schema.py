@@ -2,19 +2,38 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import threading
 from typing import Any
 
 import jsonschema
 
 from .base import AssertionFailure
 
+# Compiled validators by schema path, rebuilt when the file's mtime or size changes, so
+# cases (and, under `runledger serve`, whole runs) sharing a schema compile it once.
+_VALIDATORS: dict[Path, tuple[int, int, jsonschema.Draft202012Validator]] = {}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _validator_for(path: Path) -> jsonschema.Draft202012Validator:
+    stat = path.stat()
+    with _VALIDATORS_LOCK:
+        cached = _VALIDATORS.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    schema = json.loads(path.read_text(encoding="utf-8"))
+    validator = jsonschema.Draft202012Validator(schema)
+    with _VALIDATORS_LOCK:
+        _VALIDATORS[path] = (stat.st_mtime_ns, stat.st_size, validator)
+    return validator
+
 
 def apply_json_schema(output: dict[str, Any], schema_path: str) -> list[AssertionFailure]:
     try:
         resolved = Path(schema_path)
         if not resolved.is_absolute():
             resolved = (Path.cwd() / resolved).resolve()
-        schema = json.loads(resolved.read_text(encoding="utf-8"))
+        validator = _validator_for(resolved)
     except Exception as exc:
         return [
             AssertionFailure(
@@ -23,7 +42,6 @@ def apply_json_schema(output: dict[str, Any], schema_path: str) -> list[Assertio
             )
         ]
 
-    validator = jsonschema.Draft202012Validator(schema)
     errors = sorted(validator.iter_errors(output), key=lambda err: list(err.path))
     if not errors:
         return []
@@ -7,7 +7,7 @@ from pydantic import BaseModel, ConfigDict
 
 class RunInfo(BaseModel):
     run_id: str
-    mode: Literal["replay", "record", "live"]
+    mode: Literal["replay", "record", "live", "hybrid"]
     exit_status: Literal["success", "failed", "error"]
     git_sha: str | None = None
     ci: dict[str, Any] | None = None
@@ -19,7 +19,7 @@ class SuiteInfo(BaseModel):
     name: str
     suite_path: str
     agent_command: list[str]
-    tool_mode: Literal["replay", "record", "live"]
+    tool_mode: Literal["replay", "record", "live", "hybrid"]
     suite_config_hash: str | None = None
     cases_total: int | None = None
 
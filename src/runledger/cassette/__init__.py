@@ -1,6 +1,17 @@
 from .loader import load_cassette
-from .match import find_match, format_mismatch_error
+from .match import CassetteIndex, find_match, format_mismatch_error
 from .models import CassetteEntry
-from .writer import append_entry
+from .rules import CompiledMatchRule, compile_match_rules
+from .writer import CassetteWriter, append_entry
 
-__all__ = ["CassetteEntry", "append_entry", "find_match", "format_mismatch_error", "load_cassette"]
+__all__ = [
+    "CassetteEntry",
+    "CassetteIndex",
+    "CassetteWriter",
+    "CompiledMatchRule",
+    "append_entry",
+    "compile_match_rules",
+    "find_match",
+    "format_mismatch_error",
+    "load_cassette",
+]
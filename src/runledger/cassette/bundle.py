@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Any, Iterable, Mapping
+
+from .codec import open_cassette
+from .loader import parse_entry
+from .match import CassetteIndex, match_key
+from .models import CassetteEntry
+from .rules import CompiledMatchRule, rules_fingerprint
+
+BUNDLE_MAGIC = b"RLCBNDL1"
+BUNDLE_VERSION = 1
+# magic, format version, index length in bytes
+_HEADER = struct.Struct("<8sIQ")
+
+
+def _bundle_key(cassette_path: Path, base_dir: Path) -> str:
+    return Path(os.path.relpath(cassette_path, start=base_dir)).as_posix()
+
+
+def write_bundle(
+    path: Path,
+    cassette_paths: Iterable[Path],
+    rules: Mapping[str, CompiledMatchRule] | None = None,
+) -> int:
+    """Pack cassettes and their match keys into one file; returns the number of cassettes."""
+    rules = dict(rules or {})
+    base_dir = path.parent.resolve()
+    payload = bytearray()
+    cassettes: dict[str, dict[str, Any]] = {}
+    for cassette_path in sorted({Path(item).resolve() for item in cassette_paths}):
+        info = cassette_path.stat()
+        digest = hashlib.sha256(cassette_path.read_bytes()).hexdigest()
+        records: list[list[Any]] = []
+        with open_cassette(cassette_path, "r") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    raw = json.loads(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSON in {cassette_path} line {line_number}") from exc
+                entry = parse_entry(raw, line_number=line_number, path=cassette_path)
+                data = stripped.encode("utf-8")
+                key = match_key(entry.args, rules.get(entry.tool))
+                records.append([len(payload), len(data), entry.tool, key])
+                payload.extend(data)
+        cassettes[_bundle_key(cassette_path, base_dir)] = {
+            "sha256": digest,
+            "mtime_ns": info.st_mtime_ns,
+            "size": info.st_size,
+            "entries": records,
+        }
+
+    index = json.dumps(
+        {"rules_fingerprint": rules_fingerprint(rules), "cassettes": cassettes},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)))
+        handle.write(index)
+        handle.write(payload)
+    os.replace(tmp_path, path)
+    return len(cassettes)
+
+
+class BundledCassette(CassetteIndex):
+    """A cassette served from a bundle; entries are decoded from the mmap on first use."""
+
+    def __init__(
+        self,
+        bundle: CassetteBundle,
+        records: list[list[Any]],
+        rules: Mapping[str, CompiledMatchRule],
+        *,
+        sha256: str,
+        track_hits: bool = False,
+    ):
+        self.sha256 = sha256
+        self._bundle = bundle
+        self._records = records
+        self._decoded: dict[int, CassetteEntry] = {}
+        self.rules = dict(rules)
+        self.hits = set() if track_hits else None
+        self._by_key = {}
+        reuse_keys = bundle.rules_fingerprint == rules_fingerprint(self.rules)
+        for position, (_, _, tool, key) in enumerate(records):
+            if not reuse_keys:
+                key = match_key(self.entry_at(position).args, self.rules.get(tool))
+            self._by_key.setdefault((tool, key), []).append(position)
+
+    @property  # type: ignore[override]
+    def entries(self) -> list[CassetteEntry]:
+        return [self.entry_at(position) for position in range(len(self._records))]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def entry_at(self, position: int) -> CassetteEntry:
+        entry = self._decoded.get(position)
+        if entry is None:
+            offset, length = self._records[position][0], self._records[position][1]
+            raw = json.loads(self._bundle.read(offset, length))
+            entry = parse_entry(raw, line_number=position + 1, path=self._bundle.path)
+            self._decoded[position] = entry
+        return entry
+
+
+class CassetteBundle:
+    """Cassettes packed by `write_bundle`, served from an mmap.
+
+    Lookups trust the bundle and never touch the per-case files. With `check_stale`, a
+    cassette whose file changed since bundling (by size and mtime, then sha256) is left
+    to the caller to read from disk instead.
+    """
+
+    def __init__(self, path: Path, *, check_stale: bool = False):
+        self.path = path
+        self.check_stale = check_stale
+        self._handle = path.open("rb")
+        try:
+            self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                raise ValueError(f"Not a RunLedger cassette bundle (v{BUNDLE_VERSION}): {path}")
+            index_start = _HEADER.size
+            index = json.loads(self._mmap[index_start : index_start + index_length])
+        except Exception:
+            self.close()
+            raise
+        self._payload_start = index_start + index_length
+        self.rules_fingerprint: str = index["rules_fingerprint"]
+        base_dir = str(path.parent.resolve())
+        # normpath keeps per-case lookups free of filesystem calls, unlike Path.resolve().
+        self._cassettes: dict[str, dict[str, Any]] = {
+            os.path.normpath(os.path.join(base_dir, key)): value
+            for key, value in index["cassettes"].items()
+        }
+        self._current: dict[str, bool] = {}
+
+    def __enter__(self) -> CassetteBundle:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        mapped = getattr(self, "_mmap", None)
+        if mapped is not None:
+            mapped.close()
+            self._mmap = None
+        self._handle.close()
+
+    def __contains__(self, cassette_path: object) -> bool:
+        return os.path.normpath(str(cassette_path)) in self._cassettes
+
+    def _is_current(self, key: str, info: dict[str, Any]) -> bool:
+        """False once the cassette on disk no longer matches what was bundled.
+
+        A missing file is fine: that is what bundles are for.
+        """
+        current = self._current.get(key)
+        if current is None:
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                current = True
+            else:
+                current = (stat.st_mtime_ns, stat.st_size) == (
+                    info.get("mtime_ns"),
+                    info.get("size"),
+                ) or hashlib.sha256(Path(key).read_bytes()).hexdigest() == info["sha256"]
+            self._current[key] = current
+        return current
+
+    def read(self, offset: int, length: int) -> bytes:
+        start = self._payload_start + offset
+        return self._mmap[start : start + length]
+
+    def index_for(
+        self,
+        cassette_path: Path,
+        rules: Mapping[str, CompiledMatchRule] | None = None,
+        *,
+        track_hits: bool = False,
+    ) -> BundledCassette | None:
+        key = os.path.normpath(str(cassette_path))
+        info = self._cassettes.get(key)
+        if info is None or (self.check_stale and not self._is_current(key, info)):
+            return None
+        return BundledCassette(
+            self,
+            info["entries"],
+            rules or {},
+            sha256=info["sha256"],
+            track_hits=track_hits,
+        )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import gzip
+import lzma
+import os
+from pathlib import Path
+import shutil
+from typing import IO
+
+COMPRESSION_SUFFIXES = {"gz": ".gz", "xz": ".xz"}
+_OPENERS = {".gz": gzip.open, ".xz": lzma.open}
+
+
+def is_compressed(path: Path) -> bool:
+    return path.suffix in _OPENERS
+
+
+def open_cassette(path: Path, mode: str = "r") -> IO[str]:
+    """Open a cassette as text, transparently (de)compressing `.gz`/`.xz` files."""
+    opener = _OPENERS.get(path.suffix)
+    if opener is None:
+        return path.open(mode, encoding="utf-8")
+    return opener(path, f"{mode}t", encoding="utf-8")
+
+
+def compressed_path(path: Path, fmt: str) -> Path:
+    suffix = COMPRESSION_SUFFIXES.get(fmt)
+    if suffix is None:
+        raise ValueError(f"Unsupported cassette compression: {fmt}")
+    base = path.with_suffix("") if is_compressed(path) else path
+    return base.with_name(base.name + suffix)
+
+
+def compress_cassette(path: Path, fmt: str) -> Path:
+    target = compressed_path(path, fmt)
+    if target == path:
+        return path
+    tmp_path = target.with_name(target.name + ".tmp")
+    with open_cassette(path, "r") as source, _OPENERS[target.suffix](
+        tmp_path, "wt", encoding="utf-8"
+    ) as dest:
+        shutil.copyfileobj(source, dest)
+    os.replace(tmp_path, target)
+    path.unlink()
+    return target
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+
+from .codec import open_cassette
+
+
+@dataclass(frozen=True)
+class PruneResult:
+    path: Path
+    entries_total: int
+    entries_removed: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def prune_cassette(path: Path, used: set[int], *, dry_run: bool = False) -> PruneResult:
+    """Keep only the entries at positions in `used`, preserving the recorded lines verbatim."""
+    kept: list[str] = []
+    entries_total = 0
+    with open_cassette(path, "r") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            if entries_total in used:
+                kept.append(line if line.endswith("\n") else line + "\n")
+            entries_total += 1
+
+    bytes_before = path.stat().st_size
+    bytes_after = bytes_before
+    if len(kept) < entries_total and not dry_run:
+        tmp_path = path.with_name(path.name + ".tmp" + path.suffix)
+        with open_cassette(tmp_path, "w") as handle:
+            handle.writelines(kept)
+        os.replace(tmp_path, path)
+        bytes_after = path.stat().st_size
+    return PruneResult(
+        path=path,
+        entries_total=entries_total,
+        entries_removed=entries_total - len(kept),
+        bytes_before=bytes_before,
+        bytes_after=bytes_after,
+    )
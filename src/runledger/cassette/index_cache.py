@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import threading
+from typing import Mapping
+
+from .loader import load_cassette
+from .match import CassetteIndex
+from .rules import CompiledMatchRule, rules_fingerprint
+
+_Key = tuple[str, int, int, str]
+
+
+class CassetteIndexCache:
+    """Replay indexes kept across runs by a long-lived process such as `runledger serve`.
+
+    Entries are keyed by path, mtime, size and match-rule fingerprint, so an edited
+    cassette or changed `match` options build a fresh index. Only replay may share an
+    index: hybrid mode appends to it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._indexes: dict[str, tuple[_Key, CassetteIndex, str]] = {}
+
+    def get(
+        self, cassette_path: Path, rules: Mapping[str, CompiledMatchRule]
+    ) -> tuple[CassetteIndex, str]:
+        """Return the index and content sha256 for `cassette_path`, building it if stale."""
+        path = os.path.normpath(os.path.abspath(cassette_path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise FileNotFoundError(f"Cassette file not found: {cassette_path}") from None
+        key = (path, stat.st_mtime_ns, stat.st_size, rules_fingerprint(rules))
+        with self._lock:
+            cached = self._indexes.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        index = CassetteIndex(load_cassette(Path(path)), rules)
+        sha256 = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        with self._lock:
+            self._indexes[path] = (key, index, sha256)
+        return index, sha256
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import lzma
 from pathlib import Path
 from typing import Any
 
+from .codec import open_cassette
 from .models import CassetteEntry
 
 
@@ -13,41 +15,46 @@ def _require_mapping(value: Any, *, line_number: int, path: Path) -> dict[str, A
     return value
 
 
+def parse_entry(raw: Any, *, line_number: int, path: Path) -> CassetteEntry:
+    data = _require_mapping(raw, line_number=line_number, path=path)
+    tool = data.get("tool")
+    args = data.get("args")
+    ok = data.get("ok")
+    result = data.get("result")
+    error = data.get("error")
+
+    if not isinstance(tool, str):
+        raise ValueError(f"Cassette entry missing tool in {path} line {line_number}")
+    if not isinstance(args, dict):
+        raise ValueError(f"Cassette entry missing args in {path} line {line_number}")
+    if not isinstance(ok, bool):
+        raise ValueError(f"Cassette entry missing ok in {path} line {line_number}")
+
+    return CassetteEntry(
+        tool=tool,
+        args=args,
+        ok=ok,
+        result=result,
+        error=error if isinstance(error, str) else None,
+    )
+
+
 def load_cassette(path: Path) -> list[CassetteEntry]:
     if not path.is_file():
         raise FileNotFoundError(f"Cassette file not found: {path}")
 
     entries: list[CassetteEntry] = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        try:
-            raw = json.loads(stripped)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in {path} line {line_number}") from exc
-
-        data = _require_mapping(raw, line_number=line_number, path=path)
-        tool = data.get("tool")
-        args = data.get("args")
-        ok = data.get("ok")
-        result = data.get("result")
-        error = data.get("error")
-
-        if not isinstance(tool, str):
-            raise ValueError(f"Cassette entry missing tool in {path} line {line_number}")
-        if not isinstance(args, dict):
-            raise ValueError(f"Cassette entry missing args in {path} line {line_number}")
-        if not isinstance(ok, bool):
-            raise ValueError(f"Cassette entry missing ok in {path} line {line_number}")
-
-        entries.append(
-            CassetteEntry(
-                tool=tool,
-                args=args,
-                ok=ok,
-                result=result,
-                error=error if isinstance(error, str) else None,
-            )
-        )
+    try:
+        with open_cassette(path, "r") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    raw = json.loads(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSON in {path} line {line_number}") from exc
+                entries.append(parse_entry(raw, line_number=line_number, path=path))
+    except (EOFError, lzma.LZMAError, OSError) as exc:
+        raise ValueError(f"Unable to read cassette {path}: {exc}") from exc
     return entries
@@ -1,30 +1,136 @@
 from __future__ import annotations
 
 from difflib import SequenceMatcher
-from typing import Iterable
+from typing import Iterable, Iterator, Mapping
 
 from runledger.util.canonical_json import canonical_dumps
 from runledger.util.redaction import redact
 
 from .models import CassetteEntry
+from .rules import CompiledMatchRule
+
+MatchRules = Mapping[str, CompiledMatchRule]
+
+
+def normalize_args(args: dict[str, object], rule: CompiledMatchRule | None = None) -> object:
+    value = redact(args)
+    if rule is not None:
+        value = rule.apply(value)
+    return value
+
+
+def match_key(args: dict[str, object], rule: CompiledMatchRule | None = None) -> str:
+    """Index key for a call; with a numeric tolerance, entries sharing it are only candidates."""
+    value = normalize_args(args, rule)
+    if rule is not None:
+        value = rule.bucket(value)
+    return canonical_dumps(value)
+
+
+class CassetteIndex:
+    """Cassette entries keyed by tool name and normalized args for O(1) replay lookups."""
+
+    def __init__(
+        self,
+        entries: Iterable[CassetteEntry],
+        rules: MatchRules | None = None,
+        *,
+        track_hits: bool = False,
+    ):
+        self.entries = list(entries)
+        self.rules: dict[str, CompiledMatchRule] = dict(rules or {})
+        self.hits: set[int] | None = set() if track_hits else None
+        # Positions in recording order, so the first matching entry wins as in find_match.
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        for position, entry in enumerate(self.entries):
+            key = (entry.tool, match_key(entry.args, self.rules.get(entry.tool)))
+            self._by_key.setdefault(key, []).append(position)
+
+    def __iter__(self) -> Iterator[CassetteEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup_position(self, tool_name: str, args: dict[str, object]) -> int | None:
+        rule = self.rules.get(tool_name)
+        candidates = self._by_key.get((tool_name, match_key(args, rule)), ())
+        position = next(iter(candidates), None)
+        if rule is not None and rule.numeric_tolerance is not None:
+            target = normalize_args(args, rule)
+            position = next(
+                (
+                    candidate
+                    for candidate in candidates
+                    if rule.same(target, normalize_args(self.entry_at(candidate).args, rule))
+                ),
+                None,
+            )
+        if position is not None and self.hits is not None:
+            self.hits.add(position)
+        return position
+
+    def add(self, entry: CassetteEntry) -> int:
+        position = len(self.entries)
+        self.entries.append(entry)
+        key = (entry.tool, match_key(entry.args, self.rules.get(entry.tool)))
+        self._by_key.setdefault(key, []).append(position)
+        return position
+
+    def entry_at(self, position: int) -> CassetteEntry:
+        return self.entries[position]
+
+    def lookup(self, tool_name: str, args: dict[str, object]) -> CassetteEntry | None:
+        position = self.lookup_position(tool_name, args)
+        return None if position is None else self.entry_at(position)
 
 
 def find_match(
-    entries: Iterable[CassetteEntry], tool_name: str, args: dict[str, object]
+    entries: Iterable[CassetteEntry] | CassetteIndex,
+    tool_name: str,
+    args: dict[str, object],
+    rules: MatchRules | None = None,
+    hits: set[int] | None = None,
 ) -> CassetteEntry | None:
-    target_args = canonical_dumps(redact(args))
-    for entry in entries:
-        if entry.tool != tool_name:
+    """Return the first entry matching the tool call.
+
+    When `hits` is given, the position of the matched entry is added to it so callers
+    can tell which recorded entries a replay actually used.
+    """
+    if isinstance(entries, CassetteIndex):
+        position = entries.lookup_position(tool_name, args)
+        if position is None:
+            return None
+        if hits is not None:
+            hits.add(position)
+        return entries.entry_at(position)
+    rule = rules.get(tool_name) if rules else None
+    target_key = match_key(args, rule)
+    target_args = normalize_args(args, rule)
+    for position, entry in enumerate(entries):
+        if entry.tool != tool_name or match_key(entry.args, rule) != target_key:
             continue
-        if canonical_dumps(redact(entry.args)) == target_args:
+        if (
+            rule is None
+            or rule.numeric_tolerance is None
+            or rule.same(target_args, normalize_args(entry.args, rule))
+        ):
+            if hits is not None:
+                hits.add(position)
             return entry
     return None
 
 
 def format_mismatch_error(
-    entries: Iterable[CassetteEntry], tool_name: str, args: dict[str, object]
+    entries: Iterable[CassetteEntry] | CassetteIndex,
+    tool_name: str,
+    args: dict[str, object],
+    rules: MatchRules | None = None,
 ) -> str:
-    target_args = canonical_dumps(redact(args))
+    if rules is None and isinstance(entries, CassetteIndex):
+        rules = entries.rules
+    rule = rules.get(tool_name) if rules else None
+    target_args = canonical_dumps(normalize_args(args, rule))
     all_entries = list(entries)
     if not all_entries:
         return (
@@ -40,7 +146,9 @@ def format_mismatch_error(
 
     scored = []
     for entry in candidates:
-        preview = canonical_dumps(redact(entry.args))
+        preview = canonical_dumps(
+            normalize_args(entry.args, rules.get(entry.tool) if rules else None)
+        )
         score = SequenceMatcher(None, target_args, preview).ratio()
         scored.append((score, entry, preview))
 
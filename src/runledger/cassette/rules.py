@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import re
+from typing import Any, Mapping
+
+from runledger.config.models import MatchRuleSpec, ToolOptionsSpec
+from runledger.util.canonical_json import canonical_dumps
+
+_INDEX_SEGMENT = re.compile(r"\[(\*|\d+)\]")
+_KEY_VERSION = 2
+
+
+# Stands in for every number in an index key when a rule has a numeric tolerance; the
+# recorded entries sharing that key are then compared value by value with `same`.
+_NUMBER = "<number>"
+
+
+@dataclass(frozen=True)
+class CompiledMatchRule:
+    ignore_paths: tuple[tuple[str, ...], ...] = ()
+    normalizers: tuple[tuple[re.Pattern[str], str], ...] = ()
+    numeric_tolerance: float | None = None
+
+    def apply(self, args: Any) -> Any:
+        value = args
+        for path in self.ignore_paths:
+            value = _drop_path(value, path)
+        if self.normalizers:
+            value = self._normalize(value)
+        return value
+
+    def bucket(self, value: Any) -> Any:
+        """`value` (already `apply`-ed) with numbers blanked out if a tolerance is set."""
+        if self.numeric_tolerance is None:
+            return value
+        if isinstance(value, dict):
+            return {key: self.bucket(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.bucket(item) for item in value]
+        if _is_number(value):
+            return _NUMBER
+        return value
+
+    def same(self, left: Any, right: Any) -> bool:
+        """Whether two `apply`-ed values match, numbers within `numeric_tolerance`."""
+        if isinstance(left, dict) and isinstance(right, dict):
+            return left.keys() == right.keys() and all(
+                self.same(item, right[key]) for key, item in left.items()
+            )
+        if isinstance(left, list) and isinstance(right, list):
+            return len(left) == len(right) and all(map(self.same, left, right))
+        if self.numeric_tolerance is not None and _is_number(left) and _is_number(right):
+            # The relative slack absorbs float error, e.g. 1.1 - 1.0 with a tolerance of 0.1.
+            return abs(left - right) <= self.numeric_tolerance * (1 + 1e-9)
+        return type(left) is type(right) and left == right
+
+    def _normalize(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self._normalize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._normalize(item) for item in value]
+        if isinstance(value, str):
+            for pattern, replacement in self.normalizers:
+                value = pattern.sub(replacement, value)
+        return value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_path(path: str) -> tuple[str, ...]:
+    text = path.strip()
+    if text.startswith("$"):
+        text = text[1:]
+    text = _INDEX_SEGMENT.sub(r".\1", text)
+    segments = tuple(segment for segment in text.split(".") if segment)
+    if not segments:
+        raise ValueError(f"Invalid ignore path: {path!r}")
+    return segments
+
+
+def _drop_path(value: Any, path: tuple[str, ...]) -> Any:
+    head, rest = path[0], path[1:]
+    if isinstance(value, dict):
+        if head == "*":
+            keys = list(value)
+        elif head in value:
+            keys = [head]
+        else:
+            return value
+        updated = dict(value)
+        for key in keys:
+            if rest:
+                updated[key] = _drop_path(updated[key], rest)
+            else:
+                del updated[key]
+        return updated
+    if isinstance(value, list):
+        if head == "*":
+            indexes = set(range(len(value)))
+        elif head.isdigit() and int(head) < len(value):
+            indexes = {int(head)}
+        else:
+            return value
+        if not rest:
+            return [item for index, item in enumerate(value) if index not in indexes]
+        return [
+            _drop_path(item, rest) if index in indexes else item
+            for index, item in enumerate(value)
+        ]
+    return value
+
+
+def compile_match_rule(spec: MatchRuleSpec) -> CompiledMatchRule:
+    return CompiledMatchRule(
+        ignore_paths=tuple(_parse_path(path) for path in spec.ignore_paths),
+        normalizers=tuple(
+            (re.compile(normalizer.pattern), normalizer.replacement)
+            for normalizer in spec.normalizers
+        ),
+        numeric_tolerance=spec.numeric_tolerance,
+    )
+
+
+def compile_match_rules(
+    tool_options: Mapping[str, ToolOptionsSpec],
+) -> dict[str, CompiledMatchRule]:
+    return {
+        name: compile_match_rule(options.match)
+        for name, options in tool_options.items()
+        if options.match is not None
+    }
+
+
+def rules_fingerprint(rules: Mapping[str, CompiledMatchRule]) -> str:
+    rule_payload = {
+        name: {
+            "ignore_paths": [list(path) for path in rule.ignore_paths],
+            "normalizers": [
+                [pattern.pattern, replacement] for pattern, replacement in rule.normalizers
+            ],
+            "numeric_tolerance": rule.numeric_tolerance,
+        }
+        for name, rule in rules.items()
+    }
+    # Bumped when the shape of match keys changes, so stored keys are rebuilt.
+    payload = {"key_version": _KEY_VERSION, "rules": rule_payload}
+    return hashlib.sha256(canonical_dumps(payload).encode("utf-8")).hexdigest()
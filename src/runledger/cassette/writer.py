@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any, Iterable
 
+from .codec import is_compressed, open_cassette
 from .models import CassetteEntry
 from runledger.util.redaction import redact
 
 
-def append_entry(path: Path, entry: CassetteEntry) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
+def _entry_line(entry: CassetteEntry) -> str:
+    payload: dict[str, Any] = {
         "tool": entry.tool,
         "args": entry.args,
         "ok": entry.ok,
@@ -18,5 +19,53 @@ def append_entry(path: Path, entry: CassetteEntry) -> None:
     if entry.error is not None:
         payload["error"] = entry.error
     payload = redact(payload)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def reset_cassette(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open_cassette(path, "w"):
+        pass
+
+
+def append_entry(path: Path, entry: CassetteEntry) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open_cassette(path, "a") as handle:
+        handle.write(_entry_line(entry))
+
+
+class CassetteWriter:
+    """Records a case's tool calls, truncating the cassette first when `reset` is set.
+
+    Plain cassettes get each entry as it is appended. Compressed ones are buffered and
+    written by `close()`, so the file holds one compression member rather than one per entry.
+    """
+
+    def __init__(self, path: Path, *, reset: bool) -> None:
+        self.path = path
+        self._reset = reset
+        self._buffer: list[str] | None = [] if is_compressed(path) else None
+        if reset and self._buffer is None:
+            reset_cassette(path)
+
+    def append(self, entry: CassetteEntry) -> None:
+        if self._buffer is None:
+            append_entry(self.path, entry)
+        else:
+            self._buffer.append(_entry_line(entry))
+
+    def close(self) -> None:
+        if self._buffer is None or (not self._reset and not self._buffer):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open_cassette(self.path, "w" if self._reset else "a") as handle:
+            handle.writelines(self._buffer)
+        self._reset = False
+        self._buffer.clear()
+
+
+def write_cassette(path: Path, entries: Iterable[CassetteEntry]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open_cassette(path, "w") as handle:
+        for entry in entries:
+            handle.write(_entry_line(entry))
@@ -5,28 +5,36 @@ import json
 import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import typer
-import yaml
-from rich.console import Console
-from rich.table import Table
-
-from runledger.artifacts.junit import write_junit
-from runledger.artifacts.report import write_report
-from runledger.artifacts.run_log import write_run_log
-from runledger.artifacts.summary import build_summary, create_run_dir, write_summary
-from runledger.baseline.io import load_baseline, write_baseline
-from runledger.baseline.models import BaselineSummary
-from runledger.config.loader import load_cases, load_suite
-from runledger.config.models import RegressionSpec
-from runledger.regression import compute_regression
-from runledger.runner.engine import run_suite
+
+if TYPE_CHECKING:
+    from runledger.config.models import RegressionSpec
+
+# Heavy dependencies (rich, yaml, jinja2, jsonschema, the runner) are imported inside the
+# commands that use them, so `--help`, `diff` and `baseline promote` start quickly.
+
+
+class _LazyConsole:
+    """Creates the rich console on first use."""
+
+    _console: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
-console = Console()
+console = _LazyConsole()
 baseline_app = typer.Typer(add_completion=False, no_args_is_help=True)
 app.add_typer(baseline_app, name="baseline")
+cassette_app = typer.Typer(add_completion=False, no_args_is_help=True)
+app.add_typer(cassette_app, name="cassette")
 
 
 def _display_path(path: Path, *, base_dir: Path) -> str:
@@ -54,6 +62,8 @@ def _resolve_summary_path(run_path: Path) -> Path:
 
 
 def _regression_from_policy(policy_snapshot: object) -> RegressionSpec | None:
+    from runledger.config.models import RegressionSpec
+
     if not isinstance(policy_snapshot, dict):
         return None
     payload: dict[str, object] = {}
@@ -69,11 +79,20 @@ def _regression_from_policy(policy_snapshot: object) -> RegressionSpec | None:
 
 
 def _print_regression(regression: dict[str, object]) -> None:
+    from rich.table import Table
+
     table = Table(title="Regression Checks", show_lines=False)
     table.add_column("Check")
     table.add_column("Status")
     table.add_column("Details")
 
+    top_cases = Table(title="Top Regressing Cases", show_lines=False)
+    top_cases.add_column("Check")
+    top_cases.add_column("Case")
+    top_cases.add_column("Baseline", justify="right")
+    top_cases.add_column("Current", justify="right")
+    top_cases.add_column("Change")
+
     def _fmt(value: object) -> str:
         if value is None:
             return "n/a"
@@ -101,11 +120,40 @@ def _print_regression(regression: dict[str, object]) -> None:
             details = f"{details} delta={_fmt(delta)}"
         if threshold is not None:
             details = f"{details} threshold={_fmt(threshold)}"
+        if check.get("max_abs") is not None:
+            details = f"{details} max_abs={_fmt(check['max_abs'])}"
+        interval = check.get("ci")
+        if interval:
+            details = f"{details} ci=[{_fmt(interval[0])}, {_fmt(interval[1])}]"
+        regressed = check.get("regressed")
+        if isinstance(regressed, list):
+            compared = check.get("cases_compared", check.get("cases_tested"))
+            total = check.get("regressed_total", len(regressed))
+            details = f"cases={compared} regressed={total}"
+            if threshold is not None:
+                details = f"{details} threshold={_fmt(threshold)}"
+            for item in regressed:
+                case_label = item["id"] if "tool" not in item else f"{item['id']} ({item['tool']})"
+                if "delta_pct" in item:
+                    change = f"delta_pct={_fmt(item['delta_pct'])}"
+                else:
+                    change = f"delta=+{item['delta']}"
+                if "q_value" in item:
+                    change = f"{change}, q={_fmt(item['q_value'])}"
+                top_cases.add_row(
+                    str(check.get("id")),
+                    case_label,
+                    _fmt(item.get("baseline", item.get("baseline_median"))),
+                    _fmt(item.get("current", item.get("current_median"))),
+                    change,
+                )
         note = check.get("note")
         if note:
             details = f"{details} ({note})"
         table.add_row(str(check.get("id")), status, details)
     console.print(table)
+    if top_cases.row_count:
+        console.print(top_cases)
     warnings = regression.get("warnings")
     if isinstance(warnings, list):
         for warning in warnings:
@@ -125,6 +173,14 @@ def init(
     language: str = typer.Option("python", help="Agent language (python only in v0.1)"),
 ) -> None:
     """Initialize an example eval suite."""
+    import yaml
+
+    from runledger.artifacts.summary import build_summary
+    from runledger.baseline.io import write_baseline
+    from runledger.baseline.models import BaselineSummary
+    from runledger.config.loader import load_cases, load_suite
+    from runledger.runner.engine import run_suite
+
     if template != "support-triage":
         console.print(f"[red]Unknown template:[/red] {template}")
         raise typer.Exit(code=1)
@@ -335,7 +391,7 @@ def run(
     ),
     mode: Optional[str] = typer.Option(
         None,
-        help="Run mode (replay, record, live)",
+        help="Run mode (replay, record, live, hybrid)",
     ),
     output_dir: Optional[str] = typer.Option(
         None,
@@ -349,8 +405,57 @@ def run(
         None,
         help="Run a single case by id",
     ),
+    select: Optional[List[str]] = typer.Option(
+        None,
+        "--select",
+        help="Only run cases whose id matches this glob, or `tag:<name>` (repeatable)",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Skip cases whose id matches this glob, or `tag:<name>` (repeatable)",
+    ),
+    tags: Optional[str] = typer.Option(
+        None,
+        "--tags",
+        help="Tag expression, e.g. 'smoke and not slow'",
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only run cases whose file, cassette or schema changed since this git ref",
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        min=1,
+        help="Run the selection N times and keep per-case samples for significance gating",
+    ),
+    cassette_bundle: Optional[str] = typer.Option(
+        None,
+        "--cassette-bundle",
+        help="Serve replay cassettes from a bundle built by `runledger cassette bundle`",
+    ),
+    check_stale: bool = typer.Option(
+        False,
+        "--check-stale",
+        help="With a cassette bundle, read cassettes edited since bundling from disk",
+    ),
+    trace_events: Optional[str] = typer.Option(
+        None,
+        "--trace-events",
+        help="Also write a Chrome trace-event JSON file (open in Perfetto or chrome://tracing)",
+    ),
 ) -> None:
     """Run a suite against an agent."""
+    from rich.table import Table
+
+    from runledger.artifacts.run_artifacts import BaselineComparisonError, write_run_artifacts
+    from runledger.artifacts.trace_events import write_trace_events
+    from runledger.config.loader import iter_cases, load_suite
+    from runledger.config.selection import build_case_filter
+    from runledger.runner.engine import run_suite
+
     suite_path = Path(suite_dir)
     suite_dir_path = suite_path if suite_path.is_dir() else suite_path.parent
 
@@ -361,83 +466,73 @@ def run(
         raise typer.Exit(code=1)
 
     if mode is not None:
-        if mode not in {"replay", "record", "live"}:
+        if mode not in {"replay", "record", "live", "hybrid"}:
             console.print(f"[red]Unsupported mode:[/red] {mode}")
             raise typer.Exit(code=1)
         suite = suite.model_copy(update={"mode": mode})
+    if cassette_bundle is not None:
+        suite = suite.model_copy(update={"cassette_bundle": str(Path(cassette_bundle).resolve())})
+    if check_stale:
+        suite = suite.model_copy(update={"cassette_bundle_check_stale": True})
 
     try:
-        cases = load_cases(suite_dir_path, suite.cases_path)
+        case_filter = build_case_filter(
+            suite,
+            suite_dir_path,
+            select=select or (),
+            exclude=exclude or (),
+            tags=tags,
+            changed_since=changed_since,
+        )
+    except ValueError as exc:
+        console.print(f"[red]Invalid case selection:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    try:
+        # Streamed: large datasets start running before the last case is parsed.
+        cases = iter_cases(suite_dir_path, suite.cases_path, case_filter=case_filter)
     except Exception as exc:
         console.print(f"[red]Failed to load cases:[/red] {exc}")
         raise typer.Exit(code=1)
 
     if case is not None:
-        filtered = [item for item in cases if item.id == case]
-        if not filtered:
-            console.print(f"[red]Case not found:[/red] {case}")
-            raise typer.Exit(code=1)
-        cases = filtered
+        cases = (item for item in cases if item.id == case)
 
-    suite_result = run_suite(suite, cases)
+    try:
+        suite_result = run_suite(suite, cases, repeat=repeat)
+    except Exception as exc:
+        console.print(f"[red]Failed to run suite:[/red] {exc}")
+        raise typer.Exit(code=1)
+    if case is not None and not suite_result.cases:
+        console.print(f"[red]Case not found:[/red] {case}")
+        raise typer.Exit(code=1)
+    if case_filter is not None and not suite_result.cases:
+        console.print("[yellow]No cases matched the selection.[/yellow]")
+        raise typer.Exit(code=0)
     results = suite_result.cases
 
     base_dir = Path(output_dir) if output_dir else Path(suite.output_dir or "runledger_out")
-    run_dir, run_id = create_run_dir(base_dir, suite.suite_name)
     suite_file_path = suite_path if suite_path.is_file() else suite_path / "suite.yaml"
-    generated_at = datetime.now(timezone.utc)
-
-    summary_base = build_summary(
-        suite=suite,
-        suite_path=suite_file_path,
-        suite_result=suite_result,
-        run_id=run_id,
-        generated_at=generated_at,
-    )
-
-    regression = None
     baseline_path = (
         Path(baseline)
         if baseline
         else (Path(suite.baseline_path) if suite.baseline_path else None)
     )
-    if baseline_path:
-        try:
-            baseline = load_baseline(baseline_path)
-            current = BaselineSummary.model_validate(summary_base)
-            regression = compute_regression(
-                baseline=baseline,
-                current=current,
-                thresholds=suite.regression,
-                baseline_path=baseline_path,
-            )
-        except Exception as exc:
-            console.print(f"[red]Failed to load baseline or compute diff:[/red] {exc}")
-            raise typer.Exit(code=1)
-
-    summary_data = build_summary(
-        suite=suite,
-        suite_path=suite_file_path,
-        suite_result=suite_result,
-        run_id=run_id,
-        regression=regression,
-        generated_at=generated_at,
-    )
-
-    write_run_log(run_dir, results)
-    write_summary(
-        run_dir,
-        suite=suite,
-        suite_path=suite_file_path,
-        suite_result=suite_result,
-        run_id=run_id,
-        regression=regression,
-        generated_at=generated_at,
-    )
-    write_junit(run_dir, suite.suite_name, results)
-    write_report(run_dir, summary=summary_data, run_log_path=run_dir / "run.jsonl")
+    try:
+        artifacts = write_run_artifacts(
+            base_dir,
+            suite=suite,
+            suite_path=suite_file_path,
+            suite_result=suite_result,
+            baseline_path=baseline_path,
+        )
+    except BaselineComparisonError as exc:
+        console.print(f"[red]Failed to load baseline or compute diff:[/red] {exc}")
+        raise typer.Exit(code=1)
+    regression = artifacts.regression
+    if trace_events:
+        write_trace_events(Path(trace_events), results)
 
-    passed = suite_result.passed and (regression is None or regression.get("passed", True))
     table = Table(title="RunLedger Results", show_lines=False)
     table.add_column("Case")
     table.add_column("Status")
@@ -448,9 +543,170 @@ def run(
     console.print(table)
     if regression is not None:
         _print_regression(regression)
-    console.print(f"Artifacts written to: {run_dir}")
+    console.print(f"Artifacts written to: {artifacts.run_dir}")
+    if trace_events:
+        console.print(f"Trace events written to: {trace_events}")
+
+    raise typer.Exit(code=0 if artifacts.passed else 1)
+
+
+@app.command()
+def serve(
+    suites: List[str] = typer.Argument(
+        ...,
+        help="Suite directories (or suite.yaml files) the server may run; others are refused",
+    ),
+    host: str = typer.Option("127.0.0.1", help="Interface to listen on"),
+    port: int = typer.Option(8765, help="TCP port to listen on"),
+    socket_path: Optional[str] = typer.Option(
+        None,
+        "--socket",
+        help="Listen on this Unix socket instead of TCP",
+    ),
+    pool_size: int = typer.Option(
+        1,
+        "--pool-size",
+        help="Agents to keep started ahead of the next case, per suite (0 disables)",
+    ),
+) -> None:
+    """Keep suites warm and run them on request over a local HTTP API."""
+    from runledger.serve import ServeState, make_server
+
+    state = ServeState([Path(suite) for suite in suites], pool_size=pool_size)
+    try:
+        server = make_server(
+            state,
+            host=host,
+            port=port,
+            socket_path=Path(socket_path) if socket_path else None,
+        )
+    except OSError as exc:
+        console.print(f"[red]Failed to start server:[/red] {exc}")
+        raise typer.Exit(code=1)
+    address = socket_path or f"http://{host}:{server.server_address[1]}"
+    console.print(f"Serving on {address} (POST /run, GET /health); Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        state.close()
+        if socket_path:
+            Path(socket_path).unlink(missing_ok=True)
+
+
+@app.command()
+def watch(
+    suite_dir: str = typer.Argument(
+        ...,
+        help="Path to a suite directory containing suite.yaml",
+    ),
+    mode: Optional[str] = typer.Option(
+        None,
+        help="Run mode (replay, record, live, hybrid)",
+    ),
+    select: Optional[List[str]] = typer.Option(
+        None,
+        "--select",
+        help="Only run cases whose id matches this glob, or `tag:<name>` (repeatable)",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Skip cases whose id matches this glob, or `tag:<name>` (repeatable)",
+    ),
+    tags: Optional[str] = typer.Option(
+        None,
+        "--tags",
+        help="Tag expression, e.g. 'smoke and not slow'",
+    ),
+    watch_paths: Optional[List[str]] = typer.Option(
+        None,
+        "--watch",
+        help="Extra file or directory whose changes re-run every case (repeatable)",
+    ),
+    interval: float = typer.Option(
+        0.5,
+        "--interval",
+        help="Seconds between mtime scans when polling",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll mtimes even where inotify is available",
+    ),
+) -> None:
+    """Re-run the affected cases whenever suite, case, cassette or agent files change."""
+    from runledger.serve import SuiteSession
+    from runledger.watch import SuiteWatch, open_watcher
 
-    raise typer.Exit(code=0 if passed else 1)
+    if mode is not None and mode not in {"replay", "record", "live", "hybrid"}:
+        console.print(f"[red]Unsupported mode:[/red] {mode}")
+        raise typer.Exit(code=1)
+    session = SuiteSession(Path(suite_dir))
+    suite_watch = SuiteWatch(
+        session,
+        mode=mode,
+        select=select or (),
+        exclude=exclude or (),
+        tags=tags,
+        extra_paths=[Path(path) for path in watch_paths or ()],
+    )
+    try:
+        roots = suite_watch.roots()
+    except Exception as exc:
+        console.print(f"[red]Failed to load suite:[/red] {exc}")
+        session.close()
+        raise typer.Exit(code=1)
+    watcher = open_watcher(roots, interval_s=interval, force_poll=poll)
+    console.print(f"Watching {suite_dir} ({watcher.kind}); Ctrl+C to stop")
+
+    def print_case(result: Any) -> None:
+        status = "[green]PASS[/green]" if result.passed else "[red]FAIL[/red]"
+        line = f"  {status} {result.case_id} ({result.wall_ms} ms)"
+        if result.failure is not None:
+            line = f"{line} {result.failure.type}: {result.failure.message}"
+        console.print(line, highlight=False)
+
+    changed: Optional[set[Path]] = None
+    try:
+        while True:
+            stamp = datetime.now().strftime("%H:%M:%S")
+            if changed is None:
+                console.print(f"[dim]{stamp}[/dim] Running all cases")
+            else:
+                console.print(f"[dim]{stamp}[/dim] {len(changed)} file(s) changed")
+            written: set[Path] = set()
+            try:
+                iteration = suite_watch.run(changed, on_case=print_case)
+            except Exception as exc:
+                console.print(f"[red]Run failed:[/red] {exc}")
+            else:
+                written = iteration.written
+                failing = sorted(
+                    case_id for case_id, result in suite_watch.latest.items() if not result.passed
+                )
+                total = len(suite_watch.latest)
+                summary = f"{total - len(failing)}/{total} passing"
+                if not iteration.results:
+                    summary = f"no affected cases; {summary}"
+                if failing:
+                    summary = f"{summary} (failing: {', '.join(failing)})"
+                console.print(f"  {summary}", highlight=False)
+                # suite.yaml may now name other agent or tool files, and new cassette dirs.
+                for root in [*suite_watch.roots(), *suite_watch.cassette_dirs()]:
+                    watcher.add(root)
+            # Writes made by the run itself (recorded cassettes) are not edits.
+            pending = watcher.poll(0) - written
+            while not pending:
+                pending = watcher.poll(1.0)
+            changed = pending
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        session.close()
 
 
 @app.command()
@@ -459,6 +715,10 @@ def diff(
     run: str = typer.Option(..., "--run", help="Run directory or summary.json to compare"),
 ) -> None:
     """Compare a run summary against a baseline and report regressions."""
+    from runledger.baseline.io import load_baseline
+    from runledger.baseline.models import BaselineSummary
+    from runledger.regression import compute_regression
+
     baseline_path = Path(baseline)
     run_path = Path(run)
     try:
@@ -496,6 +756,9 @@ def promote(
     ),
 ) -> None:
     """Promote a run summary to a baseline file."""
+    from runledger.baseline.io import write_baseline
+    from runledger.baseline.models import BaselineSummary
+
     run_path = Path(source)
     baseline_path = Path(destination)
     try:
@@ -519,3 +782,176 @@ def promote(
         console.print(f"[red]Failed to promote baseline:[/red] {exc}")
         raise typer.Exit(code=1)
     console.print(f"Baseline written to: {baseline_path}")
+
+
+@cassette_app.command("compress")
+def cassette_compress(
+    suite_dir: str = typer.Argument(
+        ...,
+        help="Path to a suite directory containing suite.yaml",
+    ),
+    fmt: str = typer.Option("gz", "--format", help="Compression format (gz, xz)"),
+) -> None:
+    """Compress a suite's cassettes in place and update case cassette paths."""
+    import yaml
+
+    from runledger.cassette.codec import COMPRESSION_SUFFIXES, compress_cassette, compressed_path
+    from runledger.config.loader import case_files, load_suite, update_case_cassette
+
+    if fmt not in COMPRESSION_SUFFIXES:
+        console.print(f"[red]Unsupported format:[/red] {fmt}")
+        raise typer.Exit(code=1)
+    suite_path = Path(suite_dir)
+    suite_dir_path = suite_path if suite_path.is_dir() else suite_path.parent
+
+    converted: dict[Path, Path] = {}
+    bytes_before = 0
+    bytes_after = 0
+    try:
+        suite = load_suite(suite_path)
+        for case_file in case_files(suite_dir_path, suite.cases_path):
+            if case_file.suffix == ".jsonl":
+                console.print(f"[yellow]Skipping dataset file:[/yellow] {case_file}")
+                continue
+            documents = [
+                data
+                for data in yaml.safe_load_all(case_file.read_text(encoding="utf-8"))
+                if data is not None
+            ]
+            if len(documents) != 1:
+                console.print(f"[yellow]Skipping multi-case file:[/yellow] {case_file}")
+                continue
+            data = documents[0]
+            cassette_value = data.get("cassette") if isinstance(data, dict) else None
+            if not isinstance(cassette_value, str):
+                continue
+            cassette_ref = Path(cassette_value)
+            source = cassette_ref if cassette_ref.is_absolute() else suite_dir_path / cassette_ref
+            source = source.resolve()
+            if source not in converted:
+                target = compressed_path(source, fmt)
+                if target == source:
+                    continue
+                if not source.is_file():
+                    console.print(f"[yellow]Missing cassette:[/yellow] {source}")
+                    continue
+                bytes_before += source.stat().st_size
+                converted[source] = compress_cassette(source, fmt)
+                bytes_after += converted[source].stat().st_size
+            new_ref = compressed_path(cassette_ref, fmt)
+            update_case_cassette(case_file, new_ref.as_posix())
+    except Exception as exc:
+        console.print(f"[red]Failed to compress cassettes:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"Compressed {len(converted)} cassette(s): {bytes_before} -> {bytes_after} bytes"
+    )
+
+
+@cassette_app.command("gc")
+def cassette_gc(
+    suite_dir: str = typer.Argument(
+        ...,
+        help="Path to a suite directory containing suite.yaml",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report without rewriting cassettes"),
+    top: int = typer.Option(10, "--top", help="Number of cases to list by unused entries"),
+) -> None:
+    """Replay a suite and drop cassette entries that no case requested."""
+    from rich.table import Table
+
+    from runledger.cassette.gc import PruneResult, prune_cassette
+    from runledger.config.loader import load_cases, load_suite
+    from runledger.runner.engine import run_suite
+
+    suite_path = Path(suite_dir)
+    suite_dir_path = suite_path if suite_path.is_dir() else suite_path.parent
+    try:
+        suite = load_suite(suite_path).model_copy(
+            update={"mode": "replay", "cassette_bundle": None}
+        )
+        cases = load_cases(suite_dir_path, suite.cases_path)
+    except Exception as exc:
+        console.print(f"[red]Failed to load suite:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    hits: dict[str, set[int]] = {}
+    suite_result = run_suite(suite, cases, cassette_hits=hits)
+
+    # A failing case may have stopped before requesting every entry it needs.
+    cases_by_cassette: dict[str, list[str]] = {}
+    unsafe: set[str] = set()
+    for case_config, result in zip(cases, suite_result.cases):
+        cassette_key = str(Path(case_config.cassette))
+        cases_by_cassette.setdefault(cassette_key, []).append(result.case_id)
+        if not result.passed:
+            unsafe.add(cassette_key)
+
+    pruned: list[tuple[str, PruneResult]] = []
+    try:
+        for cassette_key, case_ids in sorted(cases_by_cassette.items()):
+            if cassette_key in unsafe:
+                failing = ", ".join(case_ids)
+                console.print(f"[yellow]Skipped:[/yellow] {cassette_key} (failing case: {failing})")
+                continue
+            used = hits.get(cassette_key, set())
+            result = prune_cassette(Path(cassette_key), used, dry_run=dry_run)
+            pruned.append((", ".join(case_ids), result))
+    except Exception as exc:
+        console.print(f"[red]Failed to rewrite cassettes:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    table = Table(title="Unused Cassette Entries", show_lines=False)
+    table.add_column("Case")
+    table.add_column("Unused", justify="right")
+    table.add_column("Total", justify="right")
+    ranked = sorted(pruned, key=lambda item: item[1].entries_removed, reverse=True)
+    for case_ids, result in ranked[:top]:
+        if result.entries_removed:
+            table.add_row(case_ids, str(result.entries_removed), str(result.entries_total))
+    console.print(table)
+
+    removed = sum(result.entries_removed for _, result in pruned)
+    if dry_run:
+        console.print(f"Would remove {removed} unused entries (dry run)")
+    else:
+        reclaimed = sum(result.bytes_reclaimed for _, result in pruned)
+        console.print(f"Removed {removed} unused entries, reclaimed {reclaimed} bytes")
+    raise typer.Exit(code=1 if unsafe else 0)
+
+
+@cassette_app.command("bundle")
+def cassette_bundle_command(
+    suite_dir: str = typer.Argument(
+        ...,
+        help="Path to a suite directory containing suite.yaml",
+    ),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        help="Bundle path (default: <suite>/cassettes.rlbundle)",
+    ),
+) -> None:
+    """Pack a suite's cassettes and match index into a single replay bundle."""
+    from runledger.cassette.bundle import write_bundle
+    from runledger.cassette.rules import compile_match_rules
+    from runledger.config.loader import load_cases, load_suite
+
+    suite_path = Path(suite_dir)
+    suite_dir_path = suite_path if suite_path.is_dir() else suite_path.parent
+    bundle_path = Path(output) if output else suite_dir_path / "cassettes.rlbundle"
+    try:
+        suite = load_suite(suite_path)
+        cases = load_cases(suite_dir_path, suite.cases_path)
+        count = write_bundle(
+            bundle_path,
+            [Path(item.cassette) for item in cases],
+            compile_match_rules(suite.tool_options),
+        )
+    except Exception as exc:
+        console.print(f"[red]Failed to build bundle:[/red] {exc}")
+        raise typer.Exit(code=1)
+    console.print(
+        f"Bundled {count} cassette(s) into {bundle_path} ({bundle_path.stat().st_size} bytes)"
+    )
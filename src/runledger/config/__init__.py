@@ -1,3 +1,25 @@
-from .models import AssertionSpec, BudgetSpec, CaseConfig, RegressionSpec, SuiteConfig
+from .models import (
+    ArgNormalizerSpec,
+    AssertionSpec,
+    BudgetSpec,
+    CaseConfig,
+    MatchRuleSpec,
+    RateLimitSpec,
+    RegressionSpec,
+    SuiteConfig,
+    ToolCacheSpec,
+    ToolOptionsSpec,
+)
 
-__all__ = ["AssertionSpec", "BudgetSpec", "CaseConfig", "RegressionSpec", "SuiteConfig"]
+__all__ = [
+    "ArgNormalizerSpec",
+    "AssertionSpec",
+    "BudgetSpec",
+    "CaseConfig",
+    "MatchRuleSpec",
+    "RateLimitSpec",
+    "RegressionSpec",
+    "SuiteConfig",
+    "ToolCacheSpec",
+    "ToolOptionsSpec",
+]
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
 from pathlib import Path
-from typing import Any
+import re
+from typing import Any, Iterable, Iterator
 
 import yaml
 
+from .matrix import expand_matrix
 from .models import CaseConfig, SuiteConfig
+from .selection import CaseFilter
+
+# libyaml's loader is several times faster; fall back to pure Python when it is missing.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CASE_CACHE_DIR = ".runledger_cache"
+_CASE_CACHE_FILE = "cases.json"
+_CASE_CACHE_VERSION = 2
+# Below this many files to parse, starting worker processes costs more than it saves.
+_PARALLEL_MIN_FILES = 256
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
     except yaml.YAMLError as exc:
         raise ValueError(f"Invalid YAML in {path}") from exc
     except OSError as exc:
@@ -21,6 +36,43 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
+def _load_yaml_documents(path: Path) -> list[dict[str, Any]]:
+    """Parse a case file that may hold several `---`-separated case documents."""
+    try:
+        documents = list(yaml.load_all(path.read_text(encoding="utf-8"), Loader=_SafeLoader))
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Invalid YAML in {path}") from exc
+    except OSError as exc:
+        raise FileNotFoundError(f"Unable to read {path}") from exc
+
+    cases: list[dict[str, Any]] = []
+    for number, data in enumerate(documents, start=1):
+        if data is None:
+            continue
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a YAML mapping in {path} (document {number})")
+        cases.append(data)
+    return cases
+
+
+def _iter_jsonl_cases(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        with path.open(encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    data = json.loads(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSON in {path} (line {line_number})") from exc
+                if not isinstance(data, dict):
+                    raise ValueError(f"Expected a JSON object in {path} (line {line_number})")
+                yield data
+    except OSError as exc:
+        raise FileNotFoundError(f"Unable to read {path}") from exc
+
+
 def _resolve_schema_paths(assertions: list[object], base_dir: Path) -> None:
     for entry in assertions:
         if not isinstance(entry, dict):
@@ -56,30 +108,198 @@ def load_suite(path: Path) -> SuiteConfig:
     baseline_path = data.get("baseline_path")
     if isinstance(baseline_path, str) and not Path(baseline_path).is_absolute():
         data["baseline_path"] = str((suite_path.parent / baseline_path).resolve())
-    output_dir = data.get("output_dir")
-    if isinstance(output_dir, str) and not Path(output_dir).is_absolute():
-        data["output_dir"] = str((suite_path.parent / output_dir).resolve())
+    for key in ("output_dir", "cassette_bundle"):
+        value = data.get(key)
+        if isinstance(value, str) and not Path(value).is_absolute():
+            data[key] = str((suite_path.parent / value).resolve())
+    tool_cache = data.get("tool_cache")
+    if isinstance(tool_cache, dict):
+        cache_path = tool_cache.get("path")
+        if isinstance(cache_path, str) and not Path(cache_path).is_absolute():
+            tool_cache["path"] = str((suite_path.parent / cache_path).resolve())
     return SuiteConfig.model_validate(data)
 
 
-def load_cases(suite_dir: Path, cases_path: str) -> list[CaseConfig]:
-    """Load cases with cassette paths resolved relative to the suite directory."""
+_CASSETTE_LINE = re.compile(r"^cassette:[ \t]*(?P<value>.*?)[ \t]*$", re.MULTILINE)
+_PLAIN_SCALAR = re.compile(r"^[A-Za-z0-9_./-]+$")
+
+
+CASE_FILE_SUFFIXES = (".yaml", ".jsonl")
+
+
+def case_files(suite_dir: Path, cases_path: str) -> list[Path]:
+    """Case sources: `cases_path` itself if it is a case file, else its `*.yaml`/`*.jsonl`."""
     cases_dir = (suite_dir / cases_path).resolve()
+    if cases_dir.is_file() and cases_dir.suffix in CASE_FILE_SUFFIXES:
+        return [cases_dir]
     if not cases_dir.is_dir():
         raise FileNotFoundError(f"Cases directory not found: {cases_dir}")
 
-    case_files = sorted(cases_dir.glob("*.yaml"))
-    if not case_files:
+    files = sorted(
+        (path for path in cases_dir.iterdir() if path.suffix in CASE_FILE_SUFFIXES),
+        key=lambda path: path.name,
+    )
+    if not files:
         raise FileNotFoundError(f"No case files found in {cases_dir}")
+    return files
 
-    cases: list[CaseConfig] = []
-    for case_file in case_files:
-        data = _load_yaml(case_file)
-        cassette_value = data.get("cassette")
-        if isinstance(cassette_value, str) and not Path(cassette_value).is_absolute():
-            data["cassette"] = str((suite_dir / cassette_value).resolve())
-        assertions = data.get("assertions")
-        if isinstance(assertions, list):
-            _resolve_schema_paths(assertions, suite_dir)
-        cases.append(CaseConfig.model_validate(data))
-    return cases
+
+def update_case_cassette(case_file: Path, cassette: str) -> None:
+    """Rewrite the top-level `cassette` value in place, keeping comments and layout."""
+    text = case_file.read_text(encoding="utf-8")
+    value = cassette if _PLAIN_SCALAR.match(cassette) else json.dumps(cassette)
+    updated, count = _CASSETTE_LINE.subn(lambda _: f"cassette: {value}", text, count=1)
+    if count == 0:
+        raise ValueError(f"No top-level cassette key in {case_file}")
+    case_file.write_text(updated, encoding="utf-8")
+
+
+def _file_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_case_cache(cache_file: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _CASE_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_case_cache(cache_file: Path, entries: dict[str, Any]) -> None:
+    # Best effort: a read-only checkout just parses every time.
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": _CASE_CACHE_VERSION, "entries": entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _parse_case_files(paths: list[Path]) -> list[list[dict[str, Any]]]:
+    workers = min(os.cpu_count() or 1, 8)
+    if len(paths) < _PARALLEL_MIN_FILES or workers < 2:
+        return [_load_yaml_documents(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_yaml_documents, paths, chunksize=64))
+
+
+def _load_case_data(
+    suite_dir: Path, files: list[Path], *, use_cache: bool
+) -> list[list[dict[str, Any]]]:
+    """Parse case files, reusing results cached by path, mtime and size."""
+    cache_file = suite_dir / CASE_CACHE_DIR / _CASE_CACHE_FILE
+    cached = _read_case_cache(cache_file) if use_cache else {}
+    keys = {path: _file_key(path) for path in files}
+    parsed: dict[Path, list[dict[str, Any]]] = {}
+    for path in files:
+        entry = cached.get(str(path))
+        if isinstance(entry, dict) and (entry.get("mtime_ns"), entry.get("size")) == keys[path]:
+            parsed[path] = entry["data"]
+    stale = [path for path in files if path not in parsed]
+    parsed.update(zip(stale, _parse_case_files(stale)))
+
+    if use_cache and (stale or len(cached) != len(files)):
+        entries: dict[str, Any] = {}
+        for path in files:
+            mtime_ns, size = keys[path]
+            try:
+                # Round-trip so values JSON cannot represent (e.g. YAML dates) stay uncached.
+                data = json.loads(json.dumps(parsed[path]))
+            except (TypeError, ValueError):
+                continue
+            if data == parsed[path]:
+                entries[str(path)] = {"mtime_ns": mtime_ns, "size": size, "data": data}
+        _write_case_cache(cache_file, entries)
+    return [parsed[path] for path in files]
+
+
+def _resolve_case_paths(suite_dir: Path, data: dict[str, Any]) -> None:
+    cassette_value = data.get("cassette")
+    if isinstance(cassette_value, str) and not Path(cassette_value).is_absolute():
+        data["cassette"] = str((suite_dir / cassette_value).resolve())
+    assertions = data.get("assertions")
+    if isinstance(assertions, list):
+        _resolve_schema_paths(assertions, suite_dir)
+
+
+def _case_entries(
+    suite_dir: Path,
+    path: Path,
+    documents: list[dict[str, Any]],
+    case_filter: CaseFilter | None,
+) -> list[CaseConfig | Iterator[dict[str, Any]]]:
+    """Validate a YAML file's plain cases now; matrix cases stay as lazy expansions."""
+    entries: list[CaseConfig | Iterator[dict[str, Any]]] = []
+    for data in documents:
+        if "matrix" in data:
+            entries.append(expand_matrix(data))
+            continue
+        _resolve_case_paths(suite_dir, data)
+        # Filter on raw data so unselected cases are never validated.
+        if case_filter is None or case_filter.matches(data, source=path):
+            entries.append(CaseConfig.model_validate(data))
+    return entries
+
+
+def _iter_case_files(
+    suite_dir: Path,
+    files: list[Path],
+    loaded: dict[Path, list[CaseConfig | Iterator[dict[str, Any]]]],
+    case_filter: CaseFilter | None,
+) -> Iterator[CaseConfig]:
+    for path in files:
+        entries: Iterable[CaseConfig | Iterator[dict[str, Any]]]
+        if path.suffix == ".jsonl":
+            entries = (expand_matrix(data) for data in _iter_jsonl_cases(path))
+        else:
+            entries = loaded[path]
+        for entry in entries:
+            if isinstance(entry, CaseConfig):
+                yield entry
+                continue
+            for expanded in entry:
+                _resolve_case_paths(suite_dir, expanded)
+                if case_filter is not None and not case_filter.matches(expanded, source=path):
+                    continue
+                yield CaseConfig.model_validate(expanded)
+
+
+def iter_cases(
+    suite_dir: Path,
+    cases_path: str,
+    *,
+    use_cache: bool = True,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[CaseConfig]:
+    """Yield cases in file order, streaming `.jsonl` datasets line by line.
+
+    YAML files (one or more `---`-separated cases each) are parsed and validated before
+    this returns, reusing `<suite_dir>/.runledger_cache`; pass `use_cache=False` to bypass
+    it. So a broken case file fails the load before any case runs. Only `.jsonl` lines and
+    `matrix` combinations are read and validated as they are reached.
+    """
+    files = case_files(suite_dir, cases_path)
+    if case_filter is not None:
+        # Drop files that cannot hold a selected case before paying to parse them.
+        files = [path for path in files if case_filter.may_match_file(path)]
+    yaml_files = [path for path in files if path.suffix != ".jsonl"]
+    parsed = _load_case_data(suite_dir, yaml_files, use_cache=use_cache)
+    loaded = {
+        path: _case_entries(suite_dir, path, documents, case_filter)
+        for path, documents in zip(yaml_files, parsed)
+    }
+    return _iter_case_files(suite_dir, files, loaded, case_filter)
+
+
+def load_cases(suite_dir: Path, cases_path: str, *, use_cache: bool = True) -> list[CaseConfig]:
+    """Load cases with cassette paths resolved relative to the suite directory."""
+    return list(iter_cases(suite_dir, cases_path, use_cache=use_cache))
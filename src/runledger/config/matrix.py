@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import itertools
+import json
+import re
+from typing import Any, Iterator
+
+from pydantic import ValidationError
+
+from .models import CaseConfig
+
+_PLACEHOLDER = re.compile(r"\$\{(\w+)\}")
+
+
+def _substitute(value: Any, params: dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        whole = _PLACEHOLDER.fullmatch(value)
+        if whole is not None and whole.group(1) in params:
+            # A bare placeholder keeps the parameter's type (numbers, lists, objects).
+            return params[whole.group(1)]
+        return _PLACEHOLDER.sub(
+            lambda match: (
+                _format(params[match.group(1)]) if match.group(1) in params else match.group(0)
+            ),
+            value,
+        )
+    if isinstance(value, dict):
+        return {key: _substitute(item, params) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, params) for item in value]
+    return value
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _check_id(data: dict[str, Any]) -> None:
+    # The error a plain case gets for the same id; expansion would otherwise stringify it.
+    if "id" not in data:
+        error = {"type": "missing", "loc": ("id",), "input": data}
+    elif not isinstance(data["id"], str):
+        error = {"type": "string_type", "loc": ("id",), "input": data["id"]}
+    else:
+        return
+    raise ValidationError.from_exception_data(CaseConfig.__name__, [error])
+
+
+def _check_matrix(matrix: Any, data: dict[str, Any]) -> dict[str, list[Any]]:
+    case_id = data.get("id")
+    if not isinstance(matrix, dict) or not matrix:
+        raise ValueError(f"Case {case_id}: matrix must be a non-empty mapping of lists")
+    for name, values in matrix.items():
+        if not isinstance(name, str) or not re.fullmatch(r"\w+", name):
+            raise ValueError(f"Case {case_id}: invalid matrix parameter name {name!r}")
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"Case {case_id}: matrix parameter {name} needs a non-empty list")
+    cassette = data.get("cassette")
+    if isinstance(cassette, str):
+        missing = sorted(set(matrix) - set(_PLACEHOLDER.findall(cassette)))
+        if missing:
+            # Otherwise expanded cases would share, and in record mode overwrite, one cassette.
+            placeholders = ", ".join(f"${{{name}}}" for name in missing)
+            raise ValueError(f"Case {case_id}: cassette template must use {placeholders}")
+    return matrix
+
+
+def expand_matrix(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield one case document per combination of a `matrix` declaration.
+
+    Parameters are substituted as `${name}` in every string value. Combinations follow
+    declaration order; parameters the id does not use are appended as `[name=value,...]`.
+    A document without `matrix` is yielded unchanged. The declaration is checked when
+    this is called; combinations are produced lazily.
+    """
+    if "matrix" not in data:
+        return iter((data,))
+    _check_id(data)
+    template = dict(data)
+    matrix = _check_matrix(template.pop("matrix"), template)
+    return _expand(template, matrix)
+
+
+def _expand(template: dict[str, Any], matrix: dict[str, list[Any]]) -> Iterator[dict[str, Any]]:
+    names = list(matrix)
+    template_id = str(template.get("id"))
+    # Parameters the id leaves out go in a suffix, so every combination gets its own id.
+    unused = [name for name in names if name not in _PLACEHOLDER.findall(template_id)]
+    for combination in itertools.product(*(matrix[name] for name in names)):
+        params = dict(zip(names, combination))
+        case = _substitute(template, params)
+        case_id = _format(case["id"]) if len(unused) < len(names) else template_id
+        if unused:
+            suffix = ",".join(f"{name}={_format(params[name])}" for name in unused)
+            case_id = f"{case_id}[{suffix}]"
+        case["id"] = case_id
+        yield case
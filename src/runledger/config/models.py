@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import re
 from typing import Literal
 
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class AssertionSpec(BaseModel):
@@ -17,10 +18,62 @@ class BudgetSpec(BaseModel):
     max_tool_errors: int | None = None
     max_tokens_out: int | None = None
     max_cost_usd: float | None = None
+    max_rss_mb: float | None = None
+    max_cpu_ms: int | None = None
 
     model_config = ConfigDict(extra="forbid")
 
 
+class SignificanceSpec(BaseModel):
+    """Gate wall-time regressions on statistical significance instead of point deltas."""
+
+    alpha: float = Field(default=0.05, gt=0, lt=1)
+    resamples: int = Field(default=1000, ge=100)
+    seed: int = 0
+    # Per-case flags also need the median to have moved at least this much.
+    min_case_delta_pct: float = Field(default=0.1, ge=0)
+    min_samples: int = Field(default=5, ge=2)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CaseRegressionSpec(BaseModel):
+    """Per-case thresholds, checked for every case present in both the baseline and the run."""
+
+    max_wall_ms_delta_pct: float | None = None
+    # Ignore wall-time growth smaller than this many ms, so tiny cases do not trip the pct gate.
+    min_wall_ms_delta: float = Field(default=0, ge=0)
+    max_tool_calls_delta: int | None = None
+    max_tool_calls_by_name_delta: int | None = None
+    top_n: int = Field(default=10, ge=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class MetricGateSpec(BaseModel):
+    """Gate one statistic of an `aggregates.metrics` entry against the baseline."""
+
+    metric: str
+    stat: Literal["min", "p50", "p95", "mean", "max"] = "mean"
+    # Largest allowed relative increase, e.g. 0.1 for +10%.
+    max_delta_pct: float | None = None
+    # Largest allowed increase in the metric's own unit.
+    max_abs: float | None = None
+    id: str | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def _check_threshold(self) -> MetricGateSpec:
+        if self.max_delta_pct is None and self.max_abs is None:
+            raise ValueError(f"Gate on {self.metric} needs max_delta_pct or max_abs")
+        return self
+
+    @property
+    def check_id(self) -> str:
+        return self.id or f"gates.{self.metric}.{self.stat}"
+
+
 class RegressionSpec(BaseModel):
     min_pass_rate: float | None = Field(
         default=None,
@@ -34,22 +87,105 @@ class RegressionSpec(BaseModel):
         default=None,
         validation_alias=AliasChoices("max_p95_wall_ms_delta_pct", "max_p95_wall_ms_increase_pct"),
     )
+    max_p95_timing_delta_pct: dict[str, float] | None = None
+    max_avg_tokens_out_delta_pct: float | None = None
+    max_avg_cost_usd_delta_pct: float | None = None
+    significance: SignificanceSpec | None = None
+    per_case: CaseRegressionSpec | None = None
+    gates: list[MetricGateSpec] = Field(default_factory=list)
 
     model_config = ConfigDict(extra="allow")
 
+    def metric_gates(self) -> list[MetricGateSpec]:
+        """`gates` preceded by the legacy threshold fields, as gates keeping their check ids."""
+        legacy: list[tuple[str, str, str, float | None]] = [
+            (field_name, metric, stat, getattr(self, field_name))
+            for field_name, metric, stat in (
+                ("max_avg_wall_ms_delta_pct", "wall_ms", "mean"),
+                ("max_p95_wall_ms_delta_pct", "wall_ms", "p95"),
+            )
+        ]
+        for name, threshold in sorted((self.max_p95_timing_delta_pct or {}).items()):
+            legacy.append((f"max_p95_timing_delta_pct.{name}", name, "p95", threshold))
+        for field_name, metric in (
+            ("max_avg_tokens_out_delta_pct", "tokens_out"),
+            ("max_avg_cost_usd_delta_pct", "cost_usd"),
+        ):
+            legacy.append((field_name, metric, "mean", getattr(self, field_name)))
+        gates = [
+            MetricGateSpec(id=check_id, metric=metric, stat=stat, max_delta_pct=threshold)
+            for check_id, metric, stat, threshold in legacy
+            if threshold is not None
+        ]
+        return gates + list(self.gates)
+
+
+class ArgNormalizerSpec(BaseModel):
+    pattern: str
+    replacement: str = "<normalized>"
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("pattern")
+    @classmethod
+    def _check_pattern(cls, value: str) -> str:
+        try:
+            re.compile(value)
+        except re.error as exc:
+            raise ValueError(f"Invalid normalizer pattern {value!r}: {exc}") from exc
+        return value
+
+
+class MatchRuleSpec(BaseModel):
+    ignore_paths: list[str] = Field(default_factory=list)
+    normalizers: list[ArgNormalizerSpec] = Field(default_factory=list)
+    numeric_tolerance: float | None = Field(default=None, gt=0)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RateLimitSpec(BaseModel):
+    rps: float | None = Field(default=None, gt=0)
+    burst: int = Field(default=1, ge=1)
+    max_in_flight: int | None = Field(default=None, ge=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ToolOptionsSpec(BaseModel):
+    match: MatchRuleSpec | None = None
+    cache_ttl_s: float | None = Field(default=None, ge=0)
+    timeout_ms: int | None = Field(default=None, gt=0)
+    rate_limit: RateLimitSpec | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ToolCacheSpec(BaseModel):
+    max_bytes: int = Field(default=64 * 1024 * 1024, gt=0)
+    default_ttl_s: float | None = Field(default=None, ge=0)
+    path: str | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
 
 class SuiteConfig(BaseModel):
     suite_name: str
     agent_command: list[str]
-    mode: Literal["replay", "record", "live"]
+    mode: Literal["replay", "record", "live", "hybrid"]
     cases_path: str
     tool_registry: list[str]
     tool_module: str | None = None
+    tool_options: dict[str, ToolOptionsSpec] = Field(default_factory=dict)
+    tool_cache: ToolCacheSpec | None = None
+    max_parallel_tool_calls: int = Field(default=8, ge=1)
     assertions: list[AssertionSpec] = Field(default_factory=list)
     budgets: BudgetSpec | None = None
     regression: RegressionSpec | None = None
     baseline_path: str | None = None
     output_dir: str | None = None
+    cassette_bundle: str | None = None
+    cassette_bundle_check_stale: bool = False
 
     model_config = ConfigDict(extra="forbid")
 
@@ -61,5 +197,6 @@ class CaseConfig(BaseModel):
     cassette: str
     assertions: list[AssertionSpec] | None = None
     budgets: BudgetSpec | None = None
+    tags: list[str] = Field(default_factory=list)
 
     model_config = ConfigDict(extra="forbid")
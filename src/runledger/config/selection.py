@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import cached_property
+from pathlib import Path
+import re
+import subprocess
+from typing import Any, Callable, Iterable, Sequence
+
+from .models import SuiteConfig
+
+_TAG_PREFIX = "tag:"
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+)")
+
+TagPredicate = Callable[[frozenset[str]], bool]
+
+
+def compile_tag_expression(expression: str) -> TagPredicate:
+    """Compile e.g. `smoke and not (slow or flaky)` into a predicate over a case's tags."""
+    tokens = _TOKEN.findall(expression)
+    position = 0
+
+    def peek() -> str | None:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of tag expression: {expression!r}")
+        position += 1
+        return token
+
+    def parse_or() -> TagPredicate:
+        left = parse_and()
+        while peek() == "or":
+            take()
+            right = parse_and()
+            left = (lambda a, b: lambda tags: a(tags) or b(tags))(left, right)
+        return left
+
+    def parse_and() -> TagPredicate:
+        left = parse_not()
+        while peek() == "and":
+            take()
+            right = parse_not()
+            left = (lambda a, b: lambda tags: a(tags) and b(tags))(left, right)
+        return left
+
+    def parse_not() -> TagPredicate:
+        if peek() == "not":
+            take()
+            inner = parse_not()
+            return lambda tags: not inner(tags)
+        token = take()
+        if token == "(":
+            inner = parse_or()
+            if take() != ")":
+                raise ValueError(f"Unbalanced parentheses in tag expression: {expression!r}")
+            return inner
+        if token in {")", "and", "or"}:
+            raise ValueError(f"Unexpected {token!r} in tag expression: {expression!r}")
+        return lambda tags: token in tags
+
+    if not tokens:
+        raise ValueError("Empty tag expression")
+    predicate = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Unexpected {peek()!r} in tag expression: {expression!r}")
+    return predicate
+
+
+def git_changed_paths(ref: str, cwd: Path) -> frozenset[Path]:
+    """Files that differ from `ref` in the working tree, plus untracked ones."""
+
+    def git(*args: str, root: Path) -> list[str]:
+        try:
+            completed = subprocess.run(
+                ["git", *args], cwd=root, capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            stderr = getattr(exc, "stderr", "") or str(exc)
+            raise ValueError(f"git {' '.join(args)} failed: {stderr.strip()}") from exc
+        return [line for line in completed.stdout.splitlines() if line]
+
+    if ref.startswith("-"):
+        # Would be parsed as a git option (e.g. `--output=<file>`), not a revision.
+        raise ValueError(f"Invalid git ref: {ref!r}")
+    top = Path(git("rev-parse", "--show-toplevel", root=cwd)[0])
+    names = git("diff", "--name-only", ref, "--", root=top)
+    names += git("ls-files", "--others", "--exclude-standard", root=top)
+    return frozenset((top / name).resolve() for name in names)
+
+
+def _matches_pattern(pattern: str, case_id: str, tags: frozenset[str]) -> bool:
+    if pattern.startswith(_TAG_PREFIX):
+        return pattern[len(_TAG_PREFIX) :] in tags
+    return fnmatchcase(case_id, pattern)
+
+
+@dataclass(frozen=True)
+class CaseFilter:
+    """Which cases to run, judged on raw case data before it is validated.
+
+    `select`/`exclude` hold id globs or `tag:<name>` patterns; `changed` holds absolute
+    paths from `git_changed_paths`, matched against the case file, its cassette and any
+    schema its assertions reference (`suite_schemas` covers suite-level assertions).
+    """
+
+    select: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    tags: TagPredicate | None = None
+    changed: frozenset[Path] | None = None
+    suite_schemas: tuple[Path, ...] = ()
+
+    def matches(self, data: dict[str, Any], *, source: Path) -> bool:
+        case_id = str(data.get("id"))
+        raw_tags = data.get("tags")
+        tags = frozenset(map(str, raw_tags)) if isinstance(raw_tags, list) else frozenset()
+        if self.select and not any(_matches_pattern(p, case_id, tags) for p in self.select):
+            return False
+        if any(_matches_pattern(pattern, case_id, tags) for pattern in self.exclude):
+            return False
+        if self.tags is not None and not self.tags(tags):
+            return False
+        if self.changed is not None:
+            return any(path in self.changed for path in self._inputs(data, source))
+        return True
+
+    def may_match_file(self, path: Path) -> bool:
+        """False only when no case in `path` can match `changed`; checked without parsing.
+
+        A file is kept if it changed itself, or if its text names a changed file or holds
+        a `${...}` template (a matrix cassette that may expand to one).
+        """
+        if self.changed is None or path.resolve() in self.changed:
+            return True
+        if any(schema in self.changed for schema in self.suite_schemas):
+            return True
+        if not self.changed:
+            return False
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return True  # Let the loader report it.
+        return "${" in text or self._changed_names.search(text) is not None
+
+    @cached_property
+    def _changed_names(self) -> re.Pattern[str]:
+        names = sorted({path.name for path in self.changed or ()})
+        return re.compile("|".join(map(re.escape, names)))
+
+    def _inputs(self, data: dict[str, Any], source: Path) -> Iterable[Path]:
+        yield source.resolve()
+        yield from self.suite_schemas
+        cassette = data.get("cassette")
+        if isinstance(cassette, str):
+            yield Path(cassette).resolve()
+        assertions = data.get("assertions")
+        for entry in assertions if isinstance(assertions, list) else []:
+            schema_path = entry.get("schema_path") if isinstance(entry, dict) else None
+            if isinstance(schema_path, str):
+                yield Path(schema_path).resolve()
+
+
+def build_case_filter(
+    suite: SuiteConfig,
+    suite_dir: Path,
+    *,
+    select: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    tags: str | None = None,
+    changed_since: str | None = None,
+    changed: frozenset[Path] | None = None,
+) -> CaseFilter | None:
+    """The filter for command-line style selection options, or None to run everything.
+
+    `changed` is an already known set of changed paths, used when `changed_since` is not
+    given. Raises ValueError for a malformed tag expression or a failing git diff.
+    """
+    if changed_since is not None:
+        changed = git_changed_paths(changed_since, suite_dir)
+    if not select and not exclude and tags is None and changed is None:
+        return None
+    return CaseFilter(
+        select=tuple(select),
+        exclude=tuple(exclude),
+        tags=compile_tag_expression(tags) if tags is not None else None,
+        changed=changed,
+        suite_schemas=tuple(
+            Path(str(item.schema_path))
+            for item in suite.assertions
+            if getattr(item, "schema_path", None)
+        ),
+    )
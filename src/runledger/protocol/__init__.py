@@ -7,6 +7,8 @@ from .messages import (
     TaskStartMessage,
     ToolCallMessage,
     ToolResultMessage,
+    Usage,
+    UsageMessage,
     parse_message,
 )
 
@@ -19,6 +21,8 @@ __all__ = [
     "TaskStartMessage",
     "ToolCallMessage",
     "ToolResultMessage",
+    "Usage",
+    "UsageMessage",
     "iter_jsonl",
     "parse_message",
     "write_jsonl_line",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskStartMessage(BaseModel):
@@ -32,9 +32,25 @@ class ToolCallMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class Usage(BaseModel):
+    """Model usage since the agent's previous report; the runner sums reports per case."""
+
+    tokens_in: int | None = Field(default=None, ge=0)
+    tokens_out: int | None = Field(default=None, ge=0)
+    cost_usd: float | None = Field(default=None, ge=0)
+    steps: int | None = Field(default=None, ge=0)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class UsageMessage(Usage):
+    type: Literal["usage"]
+
+
 class FinalOutputMessage(BaseModel):
     type: Literal["final_output"]
     output: dict[str, Any]
+    usage: Usage | None = None
 
     model_config = ConfigDict(extra="forbid")
 
@@ -63,6 +79,7 @@ ProtocolMessage = Union[
     FinalOutputMessage,
     LogMessage,
     TaskErrorMessage,
+    UsageMessage,
 ]
 
 _MESSAGE_TYPES: dict[str, type[BaseModel]] = {
@@ -72,6 +89,7 @@ _MESSAGE_TYPES: dict[str, type[BaseModel]] = {
     "final_output": FinalOutputMessage,
     "log": LogMessage,
     "task_error": TaskErrorMessage,
+    "usage": UsageMessage,
 }
 
 
@@ -4,8 +4,17 @@ import os
 from pathlib import Path
 from typing import Any
 
-from runledger.baseline.models import BaselineSummary
-from runledger.config.models import RegressionSpec
+from runledger.baseline.models import BaselineSummary, CaseSummary
+from runledger.config.models import (
+    CaseRegressionSpec,
+    MetricGateSpec,
+    RegressionSpec,
+    SignificanceSpec,
+)
+from runledger.runner.timings import TIMING_FIELDS
+from runledger.runner.usage import USAGE_FIELDS
+
+from .stats import benjamini_hochberg, bootstrap_delta_cis, mann_whitney_greater, median
 
 
 def _stable_path(path: Path, *, base_dir: Path) -> str:
@@ -33,6 +42,258 @@ def _metric_value(summary: BaselineSummary, metric: str, field: str) -> float |
     return getattr(metric_summary, field, None)
 
 
+def _delta_check(
+    check_id: str,
+    threshold: float | None,
+    baseline_value: float | None,
+    current_value: float | None,
+) -> dict[str, Any]:
+    delta_pct = _delta_pct(baseline_value, current_value)
+    check: dict[str, Any] = {
+        "id": check_id,
+        "status": "skipped",
+        "threshold": threshold,
+        "baseline": baseline_value,
+        "current": current_value,
+        "delta_pct": delta_pct,
+    }
+    if threshold is None:
+        check["note"] = f"No {check_id} configured."
+    elif delta_pct is None:
+        check["note"] = "Baseline metric missing or zero."
+    else:
+        check["status"] = "pass" if delta_pct <= threshold else "fail"
+    return check
+
+
+def _gate_check(
+    gate: MetricGateSpec,
+    baseline_value: float | None,
+    current_value: float | None,
+    *,
+    significance: bool = False,
+    interval: tuple[float, float] | None = None,
+) -> dict[str, Any]:
+    """Judge one metric gate. Under `significance`, the relative threshold is held against
+    the low end of the confidence interval, so the gate fails only on a credible increase."""
+    delta_pct = _delta_pct(baseline_value, current_value)
+    check: dict[str, Any] = {
+        "id": gate.check_id,
+        "status": "skipped",
+        "metric": gate.metric,
+        "stat": gate.stat,
+        "threshold": gate.max_delta_pct,
+        "baseline": baseline_value,
+        "current": current_value,
+        "delta_pct": delta_pct,
+    }
+    failed = False
+    if gate.max_delta_pct is not None:
+        if delta_pct is None:
+            check["note"] = "Baseline metric missing or zero."
+            return check
+        if significance and interval is not None:
+            check["method"] = "bootstrap"
+            check["ci"] = [interval[0], interval[1]]
+            failed = interval[0] > gate.max_delta_pct
+        else:
+            if significance:
+                check["note"] = "No per-case confidence interval; gated on the point delta."
+            failed = delta_pct > gate.max_delta_pct
+    if gate.max_abs is not None:
+        check["max_abs"] = gate.max_abs
+        if baseline_value is None or current_value is None:
+            check["delta"] = None
+            check["note"] = "Metric missing from the baseline or the run."
+            return check
+        check["delta"] = current_value - baseline_value
+        failed = failed or check["delta"] > gate.max_abs
+    check["status"] = "fail" if failed else "pass"
+    return check
+
+
+def _paired_intervals(
+    baseline_cases: dict[str, CaseSummary],
+    current_cases: dict[str, CaseSummary],
+    metric: str,
+    spec: SignificanceSpec,
+) -> dict[str, tuple[float, float] | None]:
+    """Bootstrap intervals for a metric every shared case reports, e.g. wall_ms or cost_usd.
+
+    Metrics not recorded per case (such as timings) get no interval.
+    """
+    baseline_values: list[float] = []
+    current_values: list[float] = []
+    for case_id in sorted(set(baseline_cases) & set(current_cases)):
+        before = getattr(baseline_cases[case_id], metric, None)
+        after = getattr(current_cases[case_id], metric, None)
+        if not isinstance(before, (int, float)) or not isinstance(after, (int, float)):
+            return {}
+        baseline_values.append(float(before))
+        current_values.append(float(after))
+    return bootstrap_delta_cis(
+        baseline_values,
+        current_values,
+        alpha=spec.alpha,
+        resamples=spec.resamples,
+        seed=spec.seed,
+    )
+
+
+def _wall_samples(case: CaseSummary) -> list[float] | None:
+    samples = getattr(case, "samples", None)
+    if not isinstance(samples, dict):
+        return None
+    values = samples.get("wall_ms")
+    return [float(value) for value in values] if isinstance(values, list) else None
+
+
+def _case_significance_check(
+    baseline_cases: dict[str, CaseSummary],
+    current_cases: dict[str, CaseSummary],
+    spec: SignificanceSpec,
+) -> dict[str, Any]:
+    tested: list[tuple[str, float, float, float | None, float]] = []
+    for case_id in sorted(set(baseline_cases) & set(current_cases)):
+        before = _wall_samples(baseline_cases[case_id])
+        after = _wall_samples(current_cases[case_id])
+        if not before or not after:
+            continue
+        if len(before) < spec.min_samples or len(after) < spec.min_samples:
+            continue
+        before_median, after_median = median(before), median(after)
+        tested.append(
+            (
+                case_id,
+                before_median,
+                after_median,
+                _delta_pct(before_median, after_median),
+                mann_whitney_greater(before, after),
+            )
+        )
+    check: dict[str, Any] = {
+        "id": "case_wall_ms_significance",
+        "status": "skipped",
+        "alpha": spec.alpha,
+        "min_case_delta_pct": spec.min_case_delta_pct,
+        "cases_tested": len(tested),
+        "regressed": [],
+    }
+    if not tested:
+        check["note"] = (
+            f"No case has {spec.min_samples}+ wall_ms samples in both runs; run with --repeat."
+        )
+        return check
+    qvalues = benjamini_hochberg([item[4] for item in tested])
+    for (case_id, before_median, after_median, delta_pct, pvalue), qvalue in zip(
+        tested, qvalues
+    ):
+        if qvalue < spec.alpha and delta_pct is not None and delta_pct >= spec.min_case_delta_pct:
+            check["regressed"].append(
+                {
+                    "id": case_id,
+                    "baseline_median": before_median,
+                    "current_median": after_median,
+                    "delta_pct": delta_pct,
+                    "p_value": pvalue,
+                    "q_value": qvalue,
+                }
+            )
+    check["status"] = "fail" if check["regressed"] else "pass"
+    return check
+
+
+def _tool_counts(case: CaseSummary) -> dict[str, int]:
+    counts = getattr(case, "tool_calls_by_name", None)
+    return counts if isinstance(counts, dict) else {}
+
+
+def _ranked_check(
+    check_id: str,
+    threshold: float,
+    regressed: list[dict[str, Any]],
+    cases_compared: int,
+    top_n: int,
+) -> dict[str, Any]:
+    regressed.sort(key=lambda item: (-item["rank_value"], item["id"]))
+    for item in regressed:
+        del item["rank_value"]
+    return {
+        "id": check_id,
+        "status": "fail" if regressed else "pass",
+        "threshold": threshold,
+        "cases_compared": cases_compared,
+        "regressed_total": len(regressed),
+        "regressed": regressed[:top_n],
+    }
+
+
+def _per_case_checks(
+    baseline_cases: dict[str, CaseSummary],
+    current_cases: dict[str, CaseSummary],
+    spec: CaseRegressionSpec,
+) -> list[dict[str, Any]]:
+    """One check per configured threshold, each listing its worst `top_n` cases first."""
+    common = sorted(set(baseline_cases) & set(current_cases))
+    wall: list[dict[str, Any]] = []
+    calls: list[dict[str, Any]] = []
+    calls_by_name: list[dict[str, Any]] = []
+    for case_id in common:
+        before, after = baseline_cases[case_id], current_cases[case_id]
+        if spec.max_wall_ms_delta_pct is not None:
+            delta_pct = _delta_pct(before.wall_ms, after.wall_ms)
+            if (
+                delta_pct is not None
+                and delta_pct > spec.max_wall_ms_delta_pct
+                and after.wall_ms - before.wall_ms >= spec.min_wall_ms_delta
+            ):
+                wall.append(
+                    {
+                        "id": case_id,
+                        "baseline": before.wall_ms,
+                        "current": after.wall_ms,
+                        "delta_pct": delta_pct,
+                        "rank_value": delta_pct,
+                    }
+                )
+        if spec.max_tool_calls_delta is not None:
+            delta = after.tool_calls - before.tool_calls
+            if delta > spec.max_tool_calls_delta:
+                calls.append(
+                    {
+                        "id": case_id,
+                        "baseline": before.tool_calls,
+                        "current": after.tool_calls,
+                        "delta": delta,
+                        "rank_value": delta,
+                    }
+                )
+        if spec.max_tool_calls_by_name_delta is not None:
+            before_counts, after_counts = _tool_counts(before), _tool_counts(after)
+            for tool in sorted(set(before_counts) | set(after_counts)):
+                delta = after_counts.get(tool, 0) - before_counts.get(tool, 0)
+                if delta > spec.max_tool_calls_by_name_delta:
+                    calls_by_name.append(
+                        {
+                            "id": case_id,
+                            "tool": tool,
+                            "baseline": before_counts.get(tool, 0),
+                            "current": after_counts.get(tool, 0),
+                            "delta": delta,
+                            "rank_value": delta,
+                        }
+                    )
+    checks = []
+    for check_id, threshold, regressed in (
+        ("case_wall_ms_delta_pct", spec.max_wall_ms_delta_pct, wall),
+        ("case_tool_calls_delta", spec.max_tool_calls_delta, calls),
+        ("case_tool_calls_by_name_delta", spec.max_tool_calls_by_name_delta, calls_by_name),
+    ):
+        if threshold is not None:
+            checks.append(_ranked_check(check_id, threshold, regressed, len(common), spec.top_n))
+    return checks
+
+
 def compute_regression(
     *,
     baseline: BaselineSummary,
@@ -100,82 +361,47 @@ def compute_regression(
             }
         )
 
-    max_avg_wall_delta = thresholds.max_avg_wall_ms_delta_pct if thresholds else None
-    avg_wall_delta_pct = _delta_pct(baseline_wall_mean, current_wall_mean)
-    if max_avg_wall_delta is None:
-        add_check(
-            {
-                "id": "max_avg_wall_ms_delta_pct",
-                "status": "skipped",
-                "threshold": None,
-                "baseline": baseline_wall_mean,
-                "current": current_wall_mean,
-                "delta_pct": avg_wall_delta_pct,
-                "note": "No max_avg_wall_ms_delta_pct configured.",
-            }
-        )
-    elif avg_wall_delta_pct is None:
-        add_check(
-            {
-                "id": "max_avg_wall_ms_delta_pct",
-                "status": "skipped",
-                "threshold": max_avg_wall_delta,
-                "baseline": baseline_wall_mean,
-                "current": current_wall_mean,
-                "delta_pct": None,
-                "note": "Baseline metric missing or zero.",
-            }
-        )
-    else:
-        add_check(
-            {
-                "id": "max_avg_wall_ms_delta_pct",
-                "status": "pass" if avg_wall_delta_pct <= max_avg_wall_delta else "fail",
-                "threshold": max_avg_wall_delta,
-                "baseline": baseline_wall_mean,
-                "current": current_wall_mean,
-                "delta_pct": avg_wall_delta_pct,
-            }
-        )
+    gates = thresholds.metric_gates() if thresholds else []
+    gate_ids = {gate.check_id for gate in gates}
+    # The wall-time checks are always reported, as skipped when not configured.
+    for check_id, baseline_value, current_value in (
+        ("max_avg_wall_ms_delta_pct", baseline_wall_mean, current_wall_mean),
+        ("max_p95_wall_ms_delta_pct", baseline_wall_p95, current_wall_p95),
+    ):
+        if check_id not in gate_ids:
+            add_check(_delta_check(check_id, None, baseline_value, current_value))
 
-    max_p95_wall_delta = thresholds.max_p95_wall_ms_delta_pct if thresholds else None
-    p95_wall_delta_pct = _delta_pct(baseline_wall_p95, current_wall_p95)
-    if max_p95_wall_delta is None:
+    significance = thresholds.significance if thresholds else None
+    intervals: dict[str, dict[str, tuple[float, float] | None]] = {}
+    known_metrics = baseline.aggregates.metrics.keys() | current.aggregates.metrics.keys()
+    for gate in gates:
+        if gate.metric not in known_metrics:
+            warnings.append(f"Gate {gate.check_id}: no {gate.metric!r} metric in either summary.")
+        interval = None
+        if significance is not None and gate.max_delta_pct is not None:
+            if gate.metric not in intervals:
+                intervals[gate.metric] = _paired_intervals(
+                    baseline_cases, current_cases, gate.metric, significance
+                )
+            interval = intervals[gate.metric].get(gate.stat)
         add_check(
-            {
-                "id": "max_p95_wall_ms_delta_pct",
-                "status": "skipped",
-                "threshold": None,
-                "baseline": baseline_wall_p95,
-                "current": current_wall_p95,
-                "delta_pct": p95_wall_delta_pct,
-                "note": "No max_p95_wall_ms_delta_pct configured.",
-            }
-        )
-    elif p95_wall_delta_pct is None:
-        add_check(
-            {
-                "id": "max_p95_wall_ms_delta_pct",
-                "status": "skipped",
-                "threshold": max_p95_wall_delta,
-                "baseline": baseline_wall_p95,
-                "current": current_wall_p95,
-                "delta_pct": None,
-                "note": "Baseline metric missing or zero.",
-            }
-        )
-    else:
-        add_check(
-            {
-                "id": "max_p95_wall_ms_delta_pct",
-                "status": "pass" if p95_wall_delta_pct <= max_p95_wall_delta else "fail",
-                "threshold": max_p95_wall_delta,
-                "baseline": baseline_wall_p95,
-                "current": current_wall_p95,
-                "delta_pct": p95_wall_delta_pct,
-            }
+            _gate_check(
+                gate,
+                _metric_value(baseline, gate.metric, gate.stat),
+                _metric_value(current, gate.metric, gate.stat),
+                significance=significance is not None,
+                interval=interval,
+            )
         )
 
+    if significance is not None:
+        add_check(_case_significance_check(baseline_cases, current_cases, significance))
+
+    per_case = thresholds.per_case if thresholds else None
+    if per_case is not None:
+        for check in _per_case_checks(baseline_cases, current_cases, per_case):
+            add_check(check)
+
     metrics = {
         "pass_rate": {
             "baseline": baseline_pass_rate,
@@ -186,16 +412,50 @@ def compute_regression(
             "mean": {
                 "baseline": baseline_wall_mean,
                 "current": current_wall_mean,
-                "delta_pct": avg_wall_delta_pct,
+                "delta_pct": _delta_pct(baseline_wall_mean, current_wall_mean),
             },
             "p95": {
                 "baseline": baseline_wall_p95,
                 "current": current_wall_p95,
-                "delta_pct": p95_wall_delta_pct,
+                "delta_pct": _delta_pct(baseline_wall_p95, current_wall_p95),
             },
         },
     }
 
+    timing_metrics = {}
+    for name in TIMING_FIELDS:
+        if name not in baseline.aggregates.metrics and name not in current.aggregates.metrics:
+            continue
+        timing_metrics[name] = {
+            field: {
+                "baseline": _metric_value(baseline, name, field),
+                "current": _metric_value(current, name, field),
+                "delta_pct": _delta_pct(
+                    _metric_value(baseline, name, field),
+                    _metric_value(current, name, field),
+                ),
+            }
+            for field in ("mean", "p95")
+        }
+    if timing_metrics:
+        metrics["timings"] = timing_metrics
+
+    usage_metrics = {}
+    for name in USAGE_FIELDS:
+        baseline_mean = _metric_value(baseline, name, "mean")
+        current_mean = _metric_value(current, name, "mean")
+        if baseline_mean is None and current_mean is None:
+            continue
+        usage_metrics[name] = {
+            "mean": {
+                "baseline": baseline_mean,
+                "current": current_mean,
+                "delta_pct": _delta_pct(baseline_mean, current_mean),
+            }
+        }
+    if usage_metrics:
+        metrics["usage"] = usage_metrics
+
     base_dir = Path.cwd()
     return {
         "baseline_path": _stable_path(baseline_path, base_dir=base_dir),
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+import math
+import random
+from typing import Literal, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Statistic = Literal["mean", "p95"]
+
+# The bootstrap is vectorized in chunks of about this many drawn values when NumPy is
+# installed (`pip install runledger[stats]`); the stdlib path needs no extra memory.
+_NUMPY_CHUNK_VALUES = 2_000_000
+# Both paths turn the same `random.Random(seed)` bytes into case indexes, one unsigned
+# int per draw, so a seed gives the same resamples with or without NumPy.
+_DRAW = array("I")
+
+
+def percentile_rank(count: int, pct: float) -> int:
+    """Nearest-rank index, matching the percentiles in `summary.json`."""
+    rank = math.ceil((pct / 100.0) * count) - 1
+    return max(0, min(rank, count - 1))
+
+
+def median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return float(ordered[middle])
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def _bootstrap_stdlib(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    resamples: int,
+    seed: int,
+) -> dict[Statistic, list[float]]:
+    count = len(baseline)
+    rng = random.Random(seed)
+    itemsize = _DRAW.itemsize
+    # The p95 of a resample is found by walking each side from its largest value down,
+    # adding up how often each case was drawn, instead of sorting every resample.
+    from_top = count - percentile_rank(count, 95)
+    baseline_desc = sorted(range(count), key=baseline.__getitem__, reverse=True)
+    current_desc = sorted(range(count), key=current.__getitem__, reverse=True)
+
+    def p95(order: list[int], values: Sequence[float], drawn: Counter[int]) -> float:
+        seen = 0
+        for index in order:
+            seen += drawn.get(index, 0)
+            if seen >= from_top:
+                return values[index]
+        return values[order[-1]]
+
+    deltas: dict[Statistic, list[float]] = {"mean": [], "p95": []}
+    for _ in range(resamples):
+        # 32 random bits per draw; the modulo bias is negligible for any realistic suite.
+        indexes = [draw % count for draw in array(_DRAW.typecode, rng.randbytes(itemsize * count))]
+        base_sum = sum(map(baseline.__getitem__, indexes))
+        if base_sum:
+            deltas["mean"].append(sum(map(current.__getitem__, indexes)) / base_sum - 1)
+        drawn = Counter(indexes)
+        base_p95 = p95(baseline_desc, baseline, drawn)
+        if base_p95:
+            deltas["p95"].append(p95(current_desc, current, drawn) / base_p95 - 1)
+    return deltas
+
+
+def _bootstrap_numpy(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    resamples: int,
+    seed: int,
+) -> dict[Statistic, list[float]]:
+    rng = random.Random(seed)
+    draw_type = np.dtype(f"u{_DRAW.itemsize}")
+    base = np.asarray(baseline, dtype=float)
+    cur = np.asarray(current, dtype=float)
+    count = len(base)
+    rank = percentile_rank(count, 95)
+    chunk = max(1, _NUMPY_CHUNK_VALUES // count)
+    deltas: dict[Statistic, list[float]] = {"mean": [], "p95": []}
+    for start in range(0, resamples, chunk):
+        rows = min(chunk, resamples - start)
+        draws = np.frombuffer(rng.randbytes(draw_type.itemsize * rows * count), dtype=draw_type)
+        indexes = (draws % count).reshape(rows, count)
+        base_draws = base[indexes]
+        current_draws = cur[indexes]
+        pairs = {
+            "mean": (base_draws.sum(axis=1), current_draws.sum(axis=1)),
+            "p95": (
+                np.partition(base_draws, rank, axis=1)[:, rank],
+                np.partition(current_draws, rank, axis=1)[:, rank],
+            ),
+        }
+        for stat, (base_stat, current_stat) in pairs.items():
+            usable = base_stat != 0
+            deltas[stat].extend((current_stat[usable] / base_stat[usable] - 1).tolist())
+    return deltas
+
+
+def bootstrap_delta_cis(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    *,
+    alpha: float = 0.05,
+    resamples: int = 1000,
+    seed: int = 0,
+) -> dict[Statistic, tuple[float, float] | None]:
+    """Percentile confidence intervals for the relative change in mean and p95.
+
+    `baseline[i]` and `current[i]` belong to the same case. Cases are resampled with
+    replacement and kept paired, so an interval shows how consistently a change holds
+    across cases; a single slow outlier widens it instead of moving it. Only the cases
+    are resampled: each contributes the one value given for it, not its repetitions.
+    An interval is None with fewer than two cases or when the baseline statistic is
+    always zero.
+    """
+    if len(baseline) != len(current):
+        raise ValueError("baseline and current must be paired per case")
+    if len(baseline) < 2:
+        return {"mean": None, "p95": None}
+    bootstrap = _bootstrap_numpy if np is not None else _bootstrap_stdlib
+    intervals: dict[Statistic, tuple[float, float] | None] = {}
+    for stat, deltas in bootstrap(baseline, current, resamples, seed).items():
+        if not deltas:
+            intervals[stat] = None
+            continue
+        deltas.sort()
+        last = len(deltas) - 1
+        intervals[stat] = (
+            deltas[int(math.floor(alpha / 2 * last))],
+            deltas[int(math.ceil((1 - alpha / 2) * last))],
+        )
+    return intervals
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U p-value for `current` tending to exceed `baseline`.
+
+    Uses the normal approximation with tie and continuity corrections, which is accurate
+    from about five samples per side.
+    """
+    n_base, n_current = len(baseline), len(current)
+    total = n_base + n_current
+    if not n_base or not n_current:
+        raise ValueError("Mann-Whitney U needs samples on both sides")
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    current_rank_sum = 0.0
+    tie_term = 0
+    start = 0
+    while start < total:
+        end = start
+        in_current = 0
+        while end < total and combined[end][0] == combined[start][0]:
+            in_current += combined[end][1]
+            end += 1
+        # Tied values share the average of ranks start+1 .. end.
+        current_rank_sum += in_current * (start + end + 1) / 2
+        ties = end - start
+        tie_term += ties**3 - ties
+        start = end
+    u_current = current_rank_sum - n_current * (n_current + 1) / 2
+    variance = n_base * n_current / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_current - n_base * n_current / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def benjamini_hochberg(pvalues: Sequence[float]) -> list[float]:
+    """Benjamini-Hochberg adjusted p-values (q-values), controlling the false discovery
+    rate when many cases are tested at once."""
+    count = len(pvalues)
+    adjusted = [1.0] * count
+    running = 1.0
+    order = sorted(range(count), key=pvalues.__getitem__, reverse=True)
+    for position, index in enumerate(order):
+        running = min(running, pvalues[index] * count / (count - position))
+        adjusted[index] = running
+    return adjusted
@@ -1,7 +1,27 @@
-from .budgets import check_budgets, merge_budgets
-from .engine import run_case, run_suite
-from .models import CaseResult, Failure, SuiteResult
-from .subprocess import AgentProcess, AgentProcessError
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .budgets import check_budgets, merge_budgets
+    from .engine import run_case, run_suite
+    from .models import CaseResult, Failure, SuiteResult
+    from .subprocess import AgentProcess, AgentProcessError
+
+# Resolved on first access so importing a light submodule (e.g. `runner.timings` from the
+# regression engine) does not pull in the engine, assertions and tool machinery.
+_EXPORTS = {
+    "AgentProcess": ".subprocess",
+    "AgentProcessError": ".subprocess",
+    "CaseResult": ".models",
+    "Failure": ".models",
+    "SuiteResult": ".models",
+    "check_budgets": ".budgets",
+    "merge_budgets": ".budgets",
+    "run_case": ".engine",
+    "run_suite": ".engine",
+}
 
 __all__ = [
     "AgentProcess",
@@ -14,3 +34,12 @@ __all__ = [
     "run_case",
     "run_suite",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
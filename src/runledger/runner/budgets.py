@@ -24,12 +24,35 @@ def check_budgets(
     wall_ms: int,
     tool_calls: int,
     tool_errors: int,
-) -> list[dict[str, int]]:
-    failures: list[dict[str, int]] = []
+    tokens_out: int | None = None,
+    cost_usd: float | None = None,
+    peak_rss_mb: float | None = None,
+    cpu_ms: float | None = None,
+) -> list[dict[str, Any]]:
+    failures: list[dict[str, Any]] = []
     if budget.max_wall_ms is not None and wall_ms > budget.max_wall_ms:
         failures.append({"field": "max_wall_ms", "limit": budget.max_wall_ms, "actual": wall_ms})
     if budget.max_tool_calls is not None and tool_calls > budget.max_tool_calls:
         failures.append({"field": "max_tool_calls", "limit": budget.max_tool_calls, "actual": tool_calls})
     if budget.max_tool_errors is not None and tool_errors > budget.max_tool_errors:
         failures.append({"field": "max_tool_errors", "limit": budget.max_tool_errors, "actual": tool_errors})
+    if budget.max_tokens_out is not None and tokens_out is not None:
+        if tokens_out > budget.max_tokens_out:
+            failures.append(
+                {"field": "max_tokens_out", "limit": budget.max_tokens_out, "actual": tokens_out}
+            )
+    if budget.max_cost_usd is not None and cost_usd is not None:
+        if cost_usd > budget.max_cost_usd:
+            failures.append(
+                {"field": "max_cost_usd", "limit": budget.max_cost_usd, "actual": cost_usd}
+            )
+    if budget.max_rss_mb is not None and peak_rss_mb is not None:
+        if peak_rss_mb > budget.max_rss_mb:
+            failures.append(
+                {"field": "max_rss_mb", "limit": budget.max_rss_mb, "actual": peak_rss_mb}
+            )
+    if budget.max_cpu_ms is not None and cpu_ms is not None and cpu_ms > budget.max_cpu_ms:
+        failures.append(
+            {"field": "max_cpu_ms", "limit": budget.max_cpu_ms, "actual": round(cpu_ms)}
+        )
     return failures
@@ -3,14 +3,18 @@ from __future__ import annotations
 from dataclasses import asdict
 import hashlib
 import time
+import warnings
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 from runledger.assertions.engine import apply_assertions, count_assertions
+from runledger.cassette.bundle import CassetteBundle
+from runledger.cassette.index_cache import CassetteIndexCache
 from runledger.cassette.loader import load_cassette
-from runledger.cassette.match import find_match, format_mismatch_error
+from runledger.cassette.match import CassetteIndex, find_match, format_mismatch_error
 from runledger.cassette.models import CassetteEntry
-from runledger.cassette.writer import append_entry
+from runledger.cassette.rules import CompiledMatchRule, compile_match_rules
+from runledger.cassette.writer import CassetteWriter
 from runledger.config.models import CaseConfig, SuiteConfig
 from runledger.protocol.messages import (
     FinalOutputMessage,
@@ -19,13 +23,49 @@ from runledger.protocol.messages import (
     TaskStartMessage,
     ToolCallMessage,
     ToolResultMessage,
+    UsageMessage,
 )
 from runledger.runner.subprocess import AgentProcess, AgentProcessError
-from runledger.tools.registry import resolve_tools
+from runledger.tools.cache import (
+    ToolResultCache,
+    diff_stats,
+    get_tool_cache,
+    wrap_cached_tools,
+)
+from runledger.tools.registry import Tool, resolve_tools, setup_tools, teardown_tools
 
 from .budgets import check_budgets, merge_budgets
+from .executor import ToolExecutor, ToolJob, rate_limit_blocked_s
+from .pool import AgentPool
+from .ratelimit import RateLimiter, build_rate_limiters
+from .repeat import merge_repeats
+from .timings import CaseTimer, ms
+from .usage import UsageTotals
 from .models import CaseResult, Failure, SuiteResult
 
+# Upper bound on a single wait while tool calls are in flight; completions wake it sooner.
+_POLL_INTERVAL_S = 1.0
+# How long a case that ended without a failure waits for calls the agent left running.
+_DRAIN_GRACE_S = 1.0
+_ABANDONED_ERROR = "Tool call abandoned: the case ended before it returned"
+
+
+def _poll_timeout(jobs: list[ToolJob]) -> float:
+    deadlines = [job.deadline for job in jobs if job.deadline is not None]
+    if not deadlines:
+        return _POLL_INTERVAL_S
+    return max(0.0, min(_POLL_INTERVAL_S, min(deadlines) - time.monotonic()))
+
+
+def _expire_overdue(executor: ToolExecutor | None, jobs: list[ToolJob]) -> None:
+    if executor is None:
+        return
+    now = time.monotonic()
+    for job in jobs:
+        deadline = job.deadline
+        if deadline is not None and deadline <= now and not job.done.is_set():
+            executor.expire(job)
+
 
 def _event(case_id: str, event_type: str, **fields: Any) -> dict[str, Any]:
     payload = {
@@ -37,8 +77,68 @@ def _event(case_id: str, event_type: str, **fields: Any) -> dict[str, Any]:
     return payload
 
 
-def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
-    if suite.mode not in {"replay", "record", "live"}:
+def _budget_failure(
+    case_id: str, failures: list[dict[str, Any]], **fields: Any
+) -> tuple[Failure, dict[str, Any]]:
+    message = "; ".join(
+        f"{item['field']} limit={item['limit']} actual={item['actual']}" for item in failures
+    )
+    failure = Failure(type="budget_exceeded", message=f"Budget exceeded: {message}")
+    return failure, _event(case_id, "budget_failure", failures=failures, **fields)
+
+
+def _early_failure(
+    suite: SuiteConfig,
+    case: CaseConfig,
+    failure: Failure,
+    *,
+    start: float,
+    cassette_path: Path,
+) -> CaseResult:
+    wall_ms = int((time.monotonic() - start) * 1000)
+    return CaseResult(
+        case_id=case.id,
+        passed=False,
+        output=None,
+        trace=[_event(case.id, "case_end", passed=False, wall_ms=wall_ms)],
+        wall_ms=wall_ms,
+        tool_calls=0,
+        tool_errors=0,
+        tool_calls_by_name={},
+        tool_errors_by_name={},
+        assertions_total=count_assertions(suite.assertions, case.assertions),
+        assertions_failed=0,
+        failed_assertions=None,
+        replay_cassette_path=(
+            str(cassette_path) if suite.mode in {"replay", "record", "hybrid"} else None
+        ),
+        replay_cassette_sha256=None,
+        failure=failure,
+    )
+
+
+def run_case(
+    suite: SuiteConfig,
+    case: CaseConfig,
+    *,
+    match_rules: dict[str, CompiledMatchRule] | None = None,
+    cassette_hits: dict[str, set[int]] | None = None,
+    bundle: CassetteBundle | None = None,
+    tool_cache: ToolResultCache | None = None,
+    tool_executor: ToolExecutor | None = None,
+    tools: Mapping[str, Tool] | None = None,
+    rate_limiters: Mapping[str, RateLimiter] | None = None,
+    agent_pool: AgentPool | None = None,
+    cassette_indexes: CassetteIndexCache | None = None,
+) -> CaseResult:
+    """Run one case.
+
+    `run_suite` passes `tools` already resolved, set up and cache-wrapped so every case
+    shares them; when omitted, the case resolves its own registry and runs the tool
+    lifecycle hooks around itself. `agent_pool` and `cassette_indexes` let a long-lived
+    caller reuse pre-started agents and replay indexes across runs.
+    """
+    if suite.mode not in {"replay", "record", "live", "hybrid"}:
         raise ValueError(f"Unsupported mode: {suite.mode}")
 
     trace: list[dict[str, Any]] = []
@@ -54,70 +154,229 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
     failed_assertions: list[dict[str, str]] | None = None
 
     cassette_path = Path(case.cassette)
-    cassette_entries: list[CassetteEntry] = []
+    cassette_entries = CassetteIndex([])
+    case_hits: set[int] | None = set() if cassette_hits is not None else None
     cassette_sha256: str | None = None
+    cassette_writer: CassetteWriter | None = None
     allowed_tools = set(suite.tool_registry)
     tool_registry = None
+    timer = CaseTimer()
+    usage_totals = UsageTotals()
+    if rate_limiters is None:
+        rate_limiters = build_rate_limiters(suite.tool_options)
+    effective_budget = merge_budgets(suite.budgets, case.budgets)
 
-    if suite.mode == "replay":
+    if suite.mode in {"replay", "hybrid"}:
         try:
-            cassette_entries = load_cassette(cassette_path)
+            if match_rules is None:
+                match_rules = compile_match_rules(suite.tool_options)
+            bundled = bundle.index_for(cassette_path, match_rules) if bundle else None
+            if bundled is not None:
+                cassette_entries = bundled
+                cassette_sha256 = bundled.sha256
+            elif suite.mode == "hybrid" and not cassette_path.exists():
+                cassette_entries = CassetteIndex([], match_rules)
+            elif suite.mode == "replay" and cassette_indexes is not None:
+                cassette_entries, cassette_sha256 = cassette_indexes.get(
+                    cassette_path, match_rules
+                )
+            else:
+                cassette_entries = CassetteIndex(load_cassette(cassette_path), match_rules)
         except Exception as exc:
-            failure = Failure(type="cassette_error", message=str(exc))
-            wall_ms = int((time.monotonic() - start) * 1000)
-            trace.append(_event(case.id, "case_end", passed=False, wall_ms=wall_ms))
-            return CaseResult(
-                case_id=case.id,
-                passed=False,
-                output=None,
-                trace=trace,
-                wall_ms=wall_ms,
-                tool_calls=tool_calls,
-                tool_errors=tool_errors,
-                tool_calls_by_name=tool_calls_by_name,
-                tool_errors_by_name=tool_errors_by_name,
-                assertions_total=assertions_total,
-                assertions_failed=assertions_failed,
-                failed_assertions=failed_assertions,
-                replay_cassette_path=str(cassette_path),
-                replay_cassette_sha256=cassette_sha256,
-                failure=failure,
+            return _early_failure(
+                suite,
+                case,
+                Failure(type="cassette_error", message=str(exc)),
+                start=start,
+                cassette_path=cassette_path,
             )
-    else:
+    owns_tools = tools is None and suite.mode != "replay"
+    if owns_tools:
         try:
-            tool_registry = resolve_tools(allowed_tools, suite.tool_module)
+            tools = resolve_tools(allowed_tools, suite.tool_module)
+            setup_tools(tools)
         except Exception as exc:
-            failure = Failure(type="tool_registry_error", message=str(exc))
-            wall_ms = int((time.monotonic() - start) * 1000)
-            trace.append(_event(case.id, "case_end", passed=False, wall_ms=wall_ms))
-            return CaseResult(
-                case_id=case.id,
-                passed=False,
-                output=None,
-                trace=trace,
-                wall_ms=wall_ms,
-                tool_calls=tool_calls,
-                tool_errors=tool_errors,
-                tool_calls_by_name=tool_calls_by_name,
-                tool_errors_by_name=tool_errors_by_name,
-                assertions_total=assertions_total,
-                assertions_failed=assertions_failed,
-                failed_assertions=failed_assertions,
-                replay_cassette_path=str(cassette_path) if suite.mode == "record" else None,
-                replay_cassette_sha256=cassette_sha256,
-                failure=failure,
+            return _early_failure(
+                suite,
+                case,
+                Failure(type="tool_registry_error", message=str(exc)),
+                start=start,
+                cassette_path=cassette_path,
+            )
+    if tools is not None:
+        tool_registry = dict(tools)
+        if owns_tools and tool_cache is not None and suite.tool_cache is not None:
+            tool_registry = wrap_cached_tools(
+                tool_registry, tool_cache, suite.tool_cache, suite.tool_options
             )
-        if suite.mode == "record":
-            cassette_path.parent.mkdir(parents=True, exist_ok=True)
-            cassette_path.write_text("", encoding="utf-8")
+        if suite.mode in {"record", "hybrid"}:
+            cassette_writer = CassetteWriter(cassette_path, reset=suite.mode == "record")
     task_start = TaskStartMessage(type="task_start", task_id=case.id, input=case.input)
-    trace.append(_event(case.id, "task_start", task_id=case.id, input=case.input))
+    task_start_event = _event(case.id, "task_start", task_id=case.id, input=case.input)
+    trace.append(task_start_event)
 
+    # Live calls in flight, and the same calls in request order for cassette writes.
+    pending: list[ToolJob] = []
+    unrecorded: list[ToolJob] = []
+    submitted: list[ToolJob] = []
+    teardown_errors: list[str] = []
+    owns_executor = tool_executor is None and tool_registry is not None
+    if owns_executor:
+        tool_executor = ToolExecutor(suite.max_parallel_tool_calls)
+
+    def send_result(
+        agent: AgentProcess,
+        call_id: str,
+        name: str,
+        ok: bool,
+        result: Any,
+        error: str | None,
+        error_type: str | None = None,
+        rate_limit_wait_s: float | None = None,
+        duration_s: float | None = None,
+        worker: str | None = None,
+    ) -> None:
+        nonlocal tool_errors, turn_start
+        if not ok:
+            tool_errors += 1
+            tool_errors_by_name[name] = tool_errors_by_name.get(name, 0) + 1
+        tool_result = ToolResultMessage(
+            type="tool_result",
+            call_id=call_id,
+            ok=ok,
+            result=result,
+            error=error,
+        )
+        agent.send(tool_result)
+        turn_start = time.monotonic()
+        event = _event(
+            case.id,
+            "tool_result",
+            call_id=tool_result.call_id,
+            ok=tool_result.ok,
+            result=tool_result.result,
+            error=tool_result.error,
+        )
+        if error_type is not None:
+            event["error_type"] = error_type
+        if rate_limit_wait_s is not None:
+            event["rate_limit_wait_ms"] = int(rate_limit_wait_s * 1000)
+        if duration_s is not None:
+            event["duration_ms"] = ms(duration_s)
+        if worker is not None:
+            event["worker"] = worker
+        trace.append(event)
+
+    def rate_limit_wait_s() -> float:
+        # Calls still queued on a limiter count as waiting, so they cannot trip max_wall_ms.
+        return rate_limit_blocked_s(submitted, time.monotonic())
+
+    def wall_budget_left_s() -> float | None:
+        if effective_budget is None or effective_budget.max_wall_ms is None:
+            return None
+        elapsed = time.monotonic() - start - rate_limit_wait_s()
+        # Wake just past the limit so the check sees it exceeded.
+        return max(0.0, effective_budget.max_wall_ms / 1000 - elapsed) + 0.002
+
+    def stop_over_budget() -> bool:
+        """Check budgets mid-run; on a breach record it so the caller can stop the agent."""
+        nonlocal failure
+        if effective_budget is None:
+            return False
+        budget_failures = check_budgets(
+            effective_budget,
+            wall_ms=max(0, int((time.monotonic() - start - rate_limit_wait_s()) * 1000)),
+            tool_calls=tool_calls,
+            tool_errors=tool_errors,
+            tokens_out=usage_totals.tokens_out,
+            cost_usd=usage_totals.cost_usd,
+        )
+        if not budget_failures:
+            return False
+        failure, event = _budget_failure(case.id, budget_failures, terminated=True)
+        trace.append(event)
+        return True
+
+    def record_completed() -> None:
+        # Append in request order so concurrent completions never reorder the cassette.
+        while unrecorded and unrecorded[0].done.is_set():
+            job = unrecorded.pop(0)
+            recorded = CassetteEntry(
+                tool=job.name,
+                args=job.args,
+                ok=job.ok,
+                result=job.result,
+                error=job.error,
+            )
+            if cassette_writer is not None:
+                cassette_writer.append(recorded)
+            if suite.mode == "hybrid":
+                # Serve repeats of this call from the cassette too.
+                cassette_entries.add(recorded)
+                trace.append(
+                    _event(case.id, "cassette_append", name=job.name, call_id=job.call_id)
+                )
+
+    turn_start = spawn_start = time.monotonic()
+    if agent_pool is not None:
+        agent_process = agent_pool.acquire()
+    else:
+        agent_process = AgentProcess(suite.agent_command)
     try:
-        with AgentProcess(suite.agent_command) as agent:
+        with agent_process as agent:
+            timer.spawn_s = time.monotonic() - spawn_start
+            task_start_event["agent_pid"] = agent.pid
             agent.send(task_start)
+            task_sent = turn_start = time.monotonic()
             while True:
-                message = agent.recv()
+                if stop_over_budget():
+                    break
+                wall_left_s = wall_budget_left_s()
+                timer.begin_wait(tools_in_flight=bool(pending))
+                if pending:
+                    poll_timeout = _poll_timeout(pending)
+                    if wall_left_s is not None:
+                        poll_timeout = min(poll_timeout, wall_left_s)
+                    message = agent.poll(poll_timeout)
+                    timer.end_wait()
+                    _expire_overdue(tool_executor, pending)
+                    for job in [job for job in pending if job.done.is_set()]:
+                        pending.remove(job)
+                        duration_s = None
+                        if job.started_at is not None and job.finished_at is not None:
+                            duration_s = job.finished_at - job.started_at
+                            timer.tool_s += duration_s
+                        send_result(
+                            agent,
+                            job.call_id,
+                            job.name,
+                            job.ok,
+                            job.result,
+                            job.error,
+                            error_type="tool_timeout" if job.timed_out else None,
+                            rate_limit_wait_s=(
+                                job.rate_limit_wait_s if job.name in rate_limiters else None
+                            ),
+                            duration_s=duration_s,
+                            worker=job.worker_name,
+                        )
+                    if suite.mode in {"record", "hybrid"}:
+                        record_completed()
+                    if message is None:
+                        continue
+                else:
+                    message = agent.recv(
+                        time.monotonic() + wall_left_s if wall_left_s is not None else None
+                    )
+                    timer.end_wait()
+                    if message is None:
+                        continue
+                received = time.monotonic()
+                if timer.first_message_s is None:
+                    timer.first_message_s = received - task_sent
+                # Time the agent took to produce this message since it last heard from us.
+                agent_ms = ms(received - max(turn_start, task_sent))
+                turn_start = received
 
                 if isinstance(message, ToolCallMessage):
                     trace.append(
@@ -127,10 +386,14 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                             name=message.name,
                             call_id=message.call_id,
                             args=message.args,
+                            agent_ms=agent_ms,
                         )
                     )
                     tool_calls += 1
                     tool_calls_by_name[message.name] = tool_calls_by_name.get(message.name, 0) + 1
+                    if stop_over_budget():
+                        # Refuse the call that broke the budget rather than pay for it.
+                        break
                     if message.name not in allowed_tools:
                         allowed_list = ", ".join(sorted(allowed_tools)) or "<none>"
                         failure = Failure(
@@ -141,9 +404,15 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                             ),
                         )
                         break
-                    if suite.mode == "replay":
-                        entry = find_match(cassette_entries, message.name, message.args)
-                        if entry is None:
+                    entry = None
+                    if suite.mode in {"replay", "hybrid"}:
+                        entry = find_match(
+                            cassette_entries,
+                            message.name,
+                            message.args,
+                            hits=case_hits,
+                        )
+                        if entry is None and suite.mode == "replay":
                             failure = Failure(
                                 type="cassette_mismatch",
                                 message=format_mismatch_error(
@@ -153,72 +422,71 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                                 ),
                             )
                             break
-                        ok = entry.ok
-                        result = entry.result
-                        error = entry.error
-                    else:
-                        assert tool_registry is not None
-                        tool = tool_registry.get(message.name)
-                        if tool is None:
-                            allowed_list = ", ".join(sorted(tool_registry)) or "<none>"
-                            failure = Failure(
-                                type="tool_not_registered",
-                                message=(
-                                    f"Tool not registered: {message.name}. "
-                                    f"Registered tools: {allowed_list}"
-                                ),
-                            )
-                            break
-                        try:
-                            result = tool.call(message.args)
-                            ok = True
-                            error = None
-                        except Exception as exc:
-                            result = None
-                            ok = False
-                            error = str(exc)
-                        if suite.mode == "record":
-                            append_entry(
-                                cassette_path,
-                                CassetteEntry(
-                                    tool=message.name,
-                                    args=message.args,
-                                    ok=ok,
-                                    result=result,
-                                    error=error,
-                                ),
-                            )
-
-                    if not ok:
-                        tool_errors += 1
-                        tool_errors_by_name[message.name] = (
-                            tool_errors_by_name.get(message.name, 0) + 1
+                    if entry is not None:
+                        send_result(
+                            agent,
+                            message.call_id,
+                            message.name,
+                            entry.ok,
+                            entry.result,
+                            entry.error,
+                        )
+                        continue
+                    assert tool_registry is not None and tool_executor is not None
+                    tool = tool_registry.get(message.name)
+                    if tool is None:
+                        allowed_list = ", ".join(sorted(tool_registry)) or "<none>"
+                        failure = Failure(
+                            type="tool_not_registered",
+                            message=(
+                                f"Tool not registered: {message.name}. "
+                                f"Registered tools: {allowed_list}"
+                            ),
                         )
-                    tool_result = ToolResultMessage(
-                        type="tool_result",
+                        break
+                    options = suite.tool_options.get(message.name)
+                    timeout_ms = options.timeout_ms if options is not None else None
+                    job = ToolJob(
                         call_id=message.call_id,
-                        ok=ok,
-                        result=result,
-                        error=error,
+                        name=message.name,
+                        args=message.args,
+                        timeout_s=timeout_ms / 1000 if timeout_ms is not None else None,
                     )
-                    agent.send(tool_result)
-                    trace.append(
-                        _event(
-                            case.id,
-                            "tool_result",
-                            call_id=tool_result.call_id,
-                            ok=tool_result.ok,
-                            result=tool_result.result,
-                            error=tool_result.error,
-                        )
+                    pending.append(job)
+                    submitted.append(job)
+                    if suite.mode in {"record", "hybrid"}:
+                        unrecorded.append(job)
+                    tool_executor.submit(
+                        job,
+                        tool,
+                        agent.wake,
+                        limiter=rate_limiters.get(message.name),
                     )
                     continue
 
                 if isinstance(message, FinalOutputMessage):
                     output = message.output
-                    trace.append(_event(case.id, "final_output", output=output))
+                    final_event = _event(
+                        case.id, "final_output", output=output, agent_ms=agent_ms
+                    )
+                    if message.usage is not None:
+                        usage_totals.add(message.usage)
+                        final_event["usage"] = message.usage.model_dump(exclude_none=True)
+                    trace.append(final_event)
                     break
 
+                if isinstance(message, UsageMessage):
+                    usage_totals.add(message)
+                    trace.append(
+                        _event(
+                            case.id,
+                            "usage",
+                            **message.model_dump(exclude={"type"}, exclude_none=True),
+                            agent_ms=agent_ms,
+                        )
+                    )
+                    continue
+
                 if isinstance(message, LogMessage):
                     trace.append(
                         _event(
@@ -227,6 +495,7 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                             level=message.level,
                             message=message.message,
                             data=message.data,
+                            agent_ms=agent_ms,
                         )
                     )
                     continue
@@ -238,15 +507,47 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                             "task_error",
                             message=message.message,
                             data=message.data,
+                            agent_ms=agent_ms,
                         )
                     )
                     failure = Failure(type="task_error", message=message.message)
                     break
     except AgentProcessError as exc:
+        timer.end_wait()
         failure = Failure(type="agent_error", message=str(exc))
+    finally:
+        # Calls the agent issued but stopped waiting for still belong in the cassette,
+        # otherwise replaying this case would hit a mismatch on them. A failed case (budget
+        # breach, agent error) does not wait for them; any other gets a short grace period.
+        # Calls still running after that are recorded as errors instead of waited on.
+        drain_until = time.monotonic() + (_DRAIN_GRACE_S if failure is None else 0.0)
+        for job in unrecorded:
+            while not job.done.is_set():
+                left_s = drain_until - time.monotonic()
+                if left_s <= 0:
+                    if tool_executor is not None:
+                        tool_executor.abandon(job, _ABANDONED_ERROR)
+                    else:
+                        job.complete(False, error=_ABANDONED_ERROR)
+                    break
+                if not job.done.wait(min(_poll_timeout([job]), left_s)):
+                    _expire_overdue(tool_executor, [job])
+        record_completed()
+        if cassette_writer is not None:
+            cassette_writer.close()
+        if owns_executor and tool_executor is not None:
+            tool_executor.close()
+        if owns_tools and tools is not None:
+            teardown_errors = teardown_tools(tools)
+
+    resources = agent_process.resource_usage
+    if failure is None and teardown_errors:
+        failure = Failure(type="tool_teardown_error", message="; ".join(teardown_errors))
 
     if failure is None and output is not None:
+        assertions_start = time.monotonic()
         assertion_failures = apply_assertions(output, trace, suite, case)
+        timer.assertions_s = time.monotonic() - assertions_start
         if assertion_failures:
             assertions_failed = len(assertion_failures)
             failed_assertions = [
@@ -265,32 +566,36 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
                 )
             )
 
-    wall_ms = int((time.monotonic() - start) * 1000)
-    effective_budget = merge_budgets(suite.budgets, case.budgets)
+    wall_s = time.monotonic() - start
+    wall_ms = int(wall_s * 1000)
+    timer.rate_limit_wait_s = rate_limit_blocked_s(submitted, time.monotonic())
+    timings = timer.as_dict(wall_s)
+    rate_limit_wait_ms = int(timer.rate_limit_wait_s * 1000)
     if failure is None and effective_budget is not None:
         budget_failures = check_budgets(
             effective_budget,
-            wall_ms=wall_ms,
+            # Time spent queued behind a rate limit is the provider's, not the agent's.
+            wall_ms=max(0, wall_ms - rate_limit_wait_ms),
             tool_calls=tool_calls,
             tool_errors=tool_errors,
+            tokens_out=usage_totals.tokens_out,
+            cost_usd=usage_totals.cost_usd,
+            peak_rss_mb=resources.peak_rss_mb if resources is not None else None,
+            cpu_ms=resources.cpu_ms if resources is not None else None,
         )
         if budget_failures:
-            message = "; ".join(
-                f"{item['field']} limit={item['limit']} actual={item['actual']}"
-                for item in budget_failures
-            )
-            failure = Failure(type="budget_exceeded", message=f"Budget exceeded: {message}")
-            trace.append(
-                _event(
-                    case.id,
-                    "budget_failure",
-                    failures=budget_failures,
-                )
-            )
+            failure, event = _budget_failure(case.id, budget_failures)
+            trace.append(event)
     passed = failure is None
-    trace.append(_event(case.id, "case_end", passed=passed, wall_ms=wall_ms))
+    case_end = _event(case.id, "case_end", passed=passed, wall_ms=wall_ms)
+    if rate_limit_wait_ms:
+        case_end["rate_limit_wait_ms"] = rate_limit_wait_ms
+    trace.append(case_end)
 
-    if cassette_path.is_file():
+    if cassette_hits is not None and case_hits is not None:
+        cassette_hits.setdefault(str(cassette_path), set()).update(case_hits)
+
+    if cassette_sha256 is None and cassette_path.is_file():
         try:
             cassette_sha256 = hashlib.sha256(cassette_path.read_bytes()).hexdigest()
         except OSError:
@@ -309,14 +614,130 @@ def run_case(suite: SuiteConfig, case: CaseConfig) -> CaseResult:
         assertions_total=assertions_total,
         assertions_failed=assertions_failed,
         failed_assertions=failed_assertions,
-        replay_cassette_path=str(cassette_path) if suite.mode in {"replay", "record"} else None,
+        rate_limit_wait_ms=rate_limit_wait_ms,
+        timings=timings,
+        tokens_in=usage_totals.tokens_in,
+        tokens_out=usage_totals.tokens_out,
+        cost_usd=usage_totals.cost_usd,
+        steps=usage_totals.steps,
+        cpu_user_s=resources.cpu_user_s if resources is not None else None,
+        cpu_sys_s=resources.cpu_sys_s if resources is not None else None,
+        peak_rss_mb=resources.peak_rss_mb if resources is not None else None,
+        ctx_switches=resources.ctx_switches if resources is not None else None,
+        replay_cassette_path=(
+            str(cassette_path) if suite.mode in {"replay", "record", "hybrid"} else None
+        ),
         replay_cassette_sha256=cassette_sha256,
         failure=failure,
     )
 
 
-def run_suite(suite: SuiteConfig, cases: list[CaseConfig]) -> SuiteResult:
-    results = [run_case(suite, case) for case in cases]
+def run_suite(
+    suite: SuiteConfig,
+    cases: Iterable[CaseConfig],
+    *,
+    cassette_hits: dict[str, set[int]] | None = None,
+    tools: Mapping[str, Tool] | None = None,
+    agent_pool: AgentPool | None = None,
+    cassette_indexes: CassetteIndexCache | None = None,
+    on_case: Callable[[CaseResult], None] | None = None,
+    repeat: int = 1,
+) -> SuiteResult:
+    """Run every case in order.
+
+    Passing `tools` hands over a registry the caller has already set up and will tear
+    down; `on_case` is called with each result as soon as its case finishes. With
+    `repeat` > 1 the whole selection runs that many times over and each case's
+    repetitions are merged into one result with per-run `samples`; `on_case` then gets
+    that merged result once the case's last repetition finishes.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    expected_runs: dict[str, int] = {}
+    runs_by_case: dict[str, list[CaseResult]] = {}
+    if repeat > 1:
+        # Whole passes rather than back-to-back repetitions, so drift over the run
+        # (warm caches, a busy host) spreads across every case's samples.
+        case_list = list(cases)
+        for case in case_list:
+            expected_runs[case.id] = expected_runs.get(case.id, 0) + repeat
+        cases = (case for _ in range(repeat) for case in case_list)
+    match_rules = compile_match_rules(suite.tool_options)
+    bundle = None
+    if suite.mode == "replay" and suite.cassette_bundle:
+        bundle = CassetteBundle(
+            Path(suite.cassette_bundle), check_stale=suite.cassette_bundle_check_stale
+        )
+    tool_cache = None
+    if suite.mode != "replay" and suite.tool_cache is not None:
+        tool_cache = get_tool_cache(suite.tool_cache)
+    cache_stats_before = tool_cache.stats() if tool_cache is not None else {}
+    tool_executor = None
+    # Shared across cases so a limit holds for the whole run, not per case.
+    rate_limiters = build_rate_limiters(suite.tool_options)
+    owns_tools = tools is None
+    registry_failure: Failure | None = None
+    if suite.mode == "replay":
+        tools = None
+    else:
+        tool_executor = ToolExecutor(suite.max_parallel_tool_calls)
+        if owns_tools:
+            # Resolve and set up tools once so expensive resources are shared by every case.
+            try:
+                tools = resolve_tools(suite.tool_registry, suite.tool_module)
+                setup_tools(tools)
+            except Exception as exc:
+                tools = None
+                registry_failure = Failure(type="tool_registry_error", message=str(exc))
+    shared_tools = tools
+    if tools is not None and tool_cache is not None and suite.tool_cache is not None:
+        shared_tools = wrap_cached_tools(tools, tool_cache, suite.tool_cache, suite.tool_options)
+    results: list[CaseResult] = []
+    try:
+        for case in cases:
+            if registry_failure is not None:
+                result = _early_failure(
+                    suite,
+                    case,
+                    registry_failure,
+                    start=time.monotonic(),
+                    cassette_path=Path(case.cassette),
+                )
+            else:
+                result = run_case(
+                    suite,
+                    case,
+                    match_rules=match_rules,
+                    cassette_hits=cassette_hits,
+                    bundle=bundle,
+                    tool_cache=tool_cache,
+                    tool_executor=tool_executor,
+                    tools=shared_tools,
+                    rate_limiters=rate_limiters,
+                    agent_pool=agent_pool,
+                    cassette_indexes=cassette_indexes,
+                )
+            results.append(result)
+            if on_case is None:
+                continue
+            if repeat == 1:
+                on_case(result)
+                continue
+            runs = runs_by_case.setdefault(result.case_id, [])
+            runs.append(result)
+            if len(runs) == expected_runs[result.case_id]:
+                on_case(merge_repeats(runs)[0])
+    finally:
+        if bundle is not None:
+            bundle.close()
+        if tool_executor is not None:
+            tool_executor.close()
+        if tools is not None and owns_tools:
+            # The cases have already finished; a failed teardown must not discard them.
+            for error in teardown_tools(tools):
+                warnings.warn(f"Tool teardown failed: {error}", RuntimeWarning, stacklevel=2)
+    if repeat > 1:
+        results = merge_repeats(results)
     total_cases = len(results)
     passed_cases = sum(1 for result in results if result.passed)
     failed_cases = total_cases - passed_cases
@@ -337,4 +758,8 @@ def run_suite(suite: SuiteConfig, cases: list[CaseConfig]) -> SuiteResult:
         total_tool_calls=total_tool_calls,
         total_tool_errors=total_tool_errors,
         total_wall_ms=total_wall_ms,
+        tool_cache=(
+            diff_stats(cache_stats_before, tool_cache.stats()) if tool_cache is not None else None
+        ),
+        repeat=repeat,
     )
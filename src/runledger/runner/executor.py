@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from runledger.tools.registry import Tool, async_handler, call_tool
+
+from .ratelimit import RateLimiter
+
+_ASYNC_WORKER_NAME = "runledger-tool-async"
+_WORKER_IDS = itertools.count(1)
+
+
+@dataclass
+class ToolJob:
+    """One live tool call in flight; filled in by the executor when it completes."""
+
+    call_id: str
+    name: str
+    args: dict[str, Any]
+    timeout_s: float | None = None
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    ok: bool = False
+    result: Any = None
+    error: str | None = None
+    timed_out: bool = False
+    rate_limit_started_at: float | None = None
+    rate_limit_wait_s: float = 0.0
+    done: threading.Event = field(default_factory=threading.Event)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _future: Future[Any] | None = field(default=None, repr=False)
+    _worker: threading.Thread | None = field(default=None, repr=False)
+    _release: Callable[[], None] | None = field(default=None, repr=False)
+
+    @property
+    def worker_name(self) -> str | None:
+        if self._future is not None:
+            return _ASYNC_WORKER_NAME
+        return self._worker.name if self._worker is not None else None
+
+    @property
+    def deadline(self) -> float | None:
+        if self.timeout_s is None or self.started_at is None:
+            return None
+        return self.started_at + self.timeout_s
+
+    def complete(
+        self,
+        ok: bool,
+        result: Any = None,
+        error: str | None = None,
+        *,
+        timed_out: bool = False,
+    ) -> bool:
+        """Store the outcome once; later completions (e.g. after a timeout) are ignored."""
+        with self._lock:
+            if self.done.is_set():
+                return False
+            self.ok = ok
+            self.result = result
+            self.error = error
+            self.timed_out = timed_out
+            self.finished_at = time.monotonic()
+            self.done.set()
+        return True
+
+    def release_limiter(self) -> None:
+        """Give back the rate-limit slot; called once the underlying call has returned."""
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+_WorkItem = tuple[ToolJob, Tool, Optional[Callable[[], None]], Optional[RateLimiter]]
+
+
+class ToolExecutor:
+    """Runs tool calls concurrently and signals each completion through a callback.
+
+    Synchronous tools run on a small pool of daemon threads so a stuck tool never
+    blocks interpreter exit. Tools with an async `acall` are awaited on a shared
+    event loop thread instead of occupying a worker.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._queue: queue.Queue[_WorkItem | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+    def __enter__(self) -> ToolExecutor:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def submit(
+        self,
+        job: ToolJob,
+        tool: Tool,
+        on_done: Callable[[], None] | None = None,
+        limiter: RateLimiter | None = None,
+    ) -> ToolJob:
+        """Queue a call; `limiter` is acquired before it starts, so waits never count
+        towards the job's timeout."""
+        acall = async_handler(tool)
+        if acall is not None:
+            loop = self._ensure_loop()
+            job._future = asyncio.run_coroutine_threadsafe(
+                _run_async(job, acall, limiter), loop
+            )
+            job._future.add_done_callback(lambda done: self._finish_async(job, done, on_done))
+            return job
+        self._ensure_workers()
+        self._queue.put((job, tool, on_done, limiter))
+        return job
+
+    def expire(self, job: ToolJob) -> bool:
+        """Fail a job that ran past its deadline; see `abandon`."""
+        timeout_ms = int((job.timeout_s or 0) * 1000)
+        return self.abandon(job, f"Tool timed out after {timeout_ms} ms", timed_out=True)
+
+    def abandon(self, job: ToolJob, error: str, *, timed_out: bool = False) -> bool:
+        """Fail a job that is still running and release the worker it held.
+
+        Async calls are cancelled. A synchronous call cannot be interrupted, so its
+        worker is abandoned (it exits once the call returns) and a fresh worker takes
+        its place. Its rate-limit slot stays taken until the call actually returns, so
+        `max_in_flight` also bounds abandoned calls.
+        """
+        if not job.complete(False, error=error, timed_out=timed_out):
+            return False
+        if job._future is not None:
+            job._future.cancel()
+        elif job._worker is not None:
+            with self._lock:
+                if job._worker in self._workers:
+                    self._workers.remove(job._worker)
+            if not self._queue.empty():
+                self._ensure_workers()
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+            loop, self._loop = self._loop, None
+        for _ in workers:
+            self._queue.put(None)
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if len(self._workers) >= self.max_workers:
+                return
+            worker = threading.Thread(
+                target=self._work,
+                name=f"runledger-tool-{next(_WORKER_IDS)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=_run_loop,
+                    args=(loop,),
+                    name=_ASYNC_WORKER_NAME,
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _work(self) -> None:
+        worker = threading.current_thread()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            job, tool, on_done, limiter = item
+            job._worker = worker
+            _acquire(job, limiter)
+            job.started_at = time.monotonic()
+            try:
+                completed = job.complete(True, call_tool(tool, job.args))
+            except Exception as exc:
+                completed = job.complete(False, error=str(exc))
+            finally:
+                job.release_limiter()
+            if completed and on_done is not None:
+                on_done()
+            with self._lock:
+                if worker not in self._workers:
+                    # Expired while running; a replacement worker already took over.
+                    return
+
+    def _finish_async(
+        self,
+        job: ToolJob,
+        future: Future[Any],
+        on_done: Callable[[], None] | None,
+    ) -> None:
+        if future.cancelled():
+            return
+        try:
+            completed = job.complete(True, future.result())
+        except BaseException as exc:
+            completed = job.complete(False, error=str(exc) or type(exc).__name__)
+        if completed and on_done is not None:
+            on_done()
+
+
+def rate_limit_blocked_s(jobs: Iterable[ToolJob], now: float) -> float:
+    """Time during which at least one job waited on a rate limiter and none was running.
+
+    Overlapping waits count once, and waits while another call ran are not idle time.
+    """
+    waiting: list[tuple[float, float]] = []
+    running: list[tuple[float, float]] = []
+    for job in jobs:
+        if job.rate_limit_started_at is not None:
+            end = (
+                job.rate_limit_started_at + job.rate_limit_wait_s
+                if job.started_at is not None
+                else now
+            )
+            waiting.append((job.rate_limit_started_at, end))
+        if job.started_at is not None:
+            running.append((job.started_at, job.finished_at or now))
+    busy = _merge(running)
+    blocked = 0.0
+    for start, end in _merge(waiting):
+        covered = sum(max(0.0, min(end, b_end) - max(start, b_start)) for b_start, b_end in busy)
+        blocked += end - start - covered
+    return blocked
+
+
+def _merge(intervals: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    merged: list[tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        elif end > start:
+            merged.append((start, end))
+    return merged
+
+
+def _acquire(job: ToolJob, limiter: RateLimiter | None) -> None:
+    if limiter is None:
+        return
+    job.rate_limit_started_at = time.monotonic()
+    job.rate_limit_wait_s = limiter.acquire()
+    job._release = limiter.release
+
+
+async def _run_async(
+    job: ToolJob,
+    acall: Callable[[dict[str, Any]], Any],
+    limiter: RateLimiter | None,
+) -> Any:
+    if limiter is not None:
+        # The limiter blocks, so wait for it off the event loop.
+        await asyncio.to_thread(_acquire, job, limiter)
+    job.started_at = time.monotonic()
+    try:
+        return await acall(job.args)
+    finally:
+        job.release_limiter()
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
@@ -28,9 +28,17 @@ class CaseResult:
     tokens_out: int | None = None
     cost_usd: float | None = None
     steps: int | None = None
+    rate_limit_wait_ms: int = 0
+    timings: dict[str, float | None] | None = None
+    cpu_user_s: float | None = None
+    cpu_sys_s: float | None = None
+    peak_rss_mb: float | None = None
+    ctx_switches: int | None = None
     replay_cassette_path: str | None = None
     replay_cassette_sha256: str | None = None
     failure: Failure | None = None
+    # Per-repetition values under `run --repeat`, keyed by field name (see SAMPLE_FIELDS).
+    samples: dict[str, list[float]] | None = None
 
 
 @dataclass(frozen=True)
@@ -45,3 +53,5 @@ class SuiteResult:
     total_tool_calls: int
     total_tool_errors: int
     total_wall_ms: int
+    tool_cache: dict[str, Any] | None = None
+    repeat: int = 1
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import deque
+import threading
+from typing import Deque, Sequence
+
+from .subprocess import AgentProcess
+
+
+class AgentPool:
+    """Agents started ahead of time so a case does not wait on interpreter start-up.
+
+    The protocol gives each agent process a single task, so agents are never reused;
+    `acquire` hands out a started agent and immediately starts its replacement, which
+    boots while the current case runs.
+    """
+
+    def __init__(self, command: Sequence[str], size: int = 1):
+        self.command = list(command)
+        self.size = size
+        self._idle: Deque[AgentProcess] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> AgentProcess:
+        with self._lock:
+            agent = self._idle.popleft() if self._idle else None
+        if agent is not None and not agent.alive():
+            # Died while idle (e.g. a crash on import); let the case spawn its own.
+            agent.close()
+            agent = None
+        if agent is None:
+            agent = AgentProcess(self.command)
+        self.fill()
+        return agent
+
+    def fill(self) -> None:
+        with self._lock:
+            while not self._closed and len(self._idle) < self.size:
+                agent = AgentProcess(self.command)
+                agent.start()
+                self._idle.append(agent)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for agent in idle:
+            agent.close()
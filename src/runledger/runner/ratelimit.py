@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Mapping
+
+from runledger.config.models import RateLimitSpec, ToolOptionsSpec
+
+
+class RateLimiter:
+    """Token bucket (`rps` refill, `burst` capacity) combined with an in-flight cap."""
+
+    def __init__(
+        self,
+        rps: float | None = None,
+        burst: int = 1,
+        max_in_flight: int | None = None,
+    ):
+        self.rps = rps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+    @classmethod
+    def from_spec(cls, spec: RateLimitSpec) -> RateLimiter:
+        return cls(rps=spec.rps, burst=spec.burst, max_in_flight=spec.max_in_flight)
+
+    def acquire(self) -> float:
+        """Block until a call may start; returns the seconds spent waiting."""
+        start = time.monotonic()
+        if self._slots is not None:
+            self._slots.acquire()
+        if self.rps is not None:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(
+                        float(self.burst),
+                        self._tokens + (now - self._updated) * self.rps,
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    delay = (1 - self._tokens) / self.rps
+                time.sleep(delay)
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+
+def build_rate_limiters(tool_options: Mapping[str, ToolOptionsSpec]) -> dict[str, RateLimiter]:
+    return {
+        name: RateLimiter.from_spec(options.rate_limit)
+        for name, options in tool_options.items()
+        if options.rate_limit is not None
+    }
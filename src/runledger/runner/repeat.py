@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Iterable
+
+from .models import CaseResult
+
+# CaseResult fields whose per-repetition values are kept as samples.
+SAMPLE_FIELDS = ("wall_ms", "tool_calls", "tokens_out", "cost_usd")
+
+
+def merge_repeats(results: Iterable[CaseResult]) -> list[CaseResult]:
+    """Collapse repetitions of each case into one result carrying per-run `samples`.
+
+    A case passes only if every repetition passed. The result reported for it is its
+    first failing repetition, or otherwise the one with the (lower) median wall time.
+    """
+    runs_by_case: dict[str, list[CaseResult]] = {}
+    for result in results:
+        runs_by_case.setdefault(result.case_id, []).append(result)
+    merged: list[CaseResult] = []
+    for runs in runs_by_case.values():
+        failed = [run for run in runs if not run.passed]
+        if failed:
+            chosen = failed[0]
+        else:
+            chosen = sorted(runs, key=lambda run: run.wall_ms)[(len(runs) - 1) // 2]
+        samples = {
+            name: [getattr(run, name) for run in runs]
+            for name in SAMPLE_FIELDS
+            if all(getattr(run, name) is not None for run in runs)
+        }
+        merged.append(replace(chosen, samples=samples))
+    return merged
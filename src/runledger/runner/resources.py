@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+import os
+from pathlib import Path
+import sys
+import threading
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    cpu_user_s: float
+    cpu_sys_s: float
+    peak_rss_mb: float
+    ctx_switches: int
+
+    @property
+    def cpu_ms(self) -> float:
+        return (self.cpu_user_s + self.cpu_sys_s) * 1000
+
+
+def from_rusage(rusage: object) -> ResourceUsage:
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    maxrss = float(getattr(rusage, "ru_maxrss"))
+    peak_rss_mb = maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+    return ResourceUsage(
+        cpu_user_s=round(float(getattr(rusage, "ru_utime")), 6),
+        cpu_sys_s=round(float(getattr(rusage, "ru_stime")), 6),
+        peak_rss_mb=round(peak_rss_mb, 3),
+        ctx_switches=int(getattr(rusage, "ru_nvcsw")) + int(getattr(rusage, "ru_nivcsw")),
+    )
+
+
+def current_rss_mb() -> float | None:
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+def merge_usage(
+    rusage: ResourceUsage | None,
+    sampled: ResourceUsage | None,
+    parent_rss_mb: float | None,
+) -> ResourceUsage | None:
+    """Prefer exact rusage, but take peak RSS from /proc when rusage cannot be trusted.
+
+    A forked child inherits the parent's high-water mark until exec, so a ru_maxrss at or
+    below the parent's RSS at spawn time says nothing about the agent itself.
+    """
+    if rusage is None:
+        return sampled
+    if sampled is not None and parent_rss_mb is not None and rusage.peak_rss_mb <= parent_rss_mb:
+        return replace(rusage, peak_rss_mb=sampled.peak_rss_mb)
+    return rusage
+
+
+class ProcSampler:
+    """Polls `/proc/<pid>` while a child runs.
+
+    It supplies peak RSS when ru_maxrss is ambiguous, and everything when rusage is
+    unavailable (e.g. something else reaped the child). It tracks the latest CPU and
+    context-switch counters and the highest RSS it has seen.
+    """
+
+    def __init__(self, pid: int, interval_s: float = 0.1):
+        self.pid = pid
+        self.interval_s = interval_s
+        self._proc = Path(f"/proc/{pid}")
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._latest: ResourceUsage | None = None
+
+    @staticmethod
+    def available() -> bool:
+        return Path("/proc/self/stat").exists()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="runledger-proc-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> ResourceUsage | None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        return self._latest
+
+    def _run(self) -> None:
+        while True:
+            if not self.sample():
+                return
+            if self._stop.wait(self.interval_s):
+                return
+
+    def sample(self) -> bool:
+        try:
+            stat = (self._proc / "stat").read_text()
+            status = (self._proc / "status").read_text()
+        except OSError:
+            return False
+        # The command name in field 2 may contain spaces, so split after its closing paren.
+        fields = stat[stat.rindex(")") + 2 :].split()
+        utime, stime = int(fields[11]), int(fields[12])
+        values: dict[str, int] = {}
+        for line in status.splitlines():
+            key, _, rest = line.partition(":")
+            parts = rest.split()
+            if parts and parts[0].isdigit():
+                values[key] = int(parts[0])
+        rss_kb = max(values.get("VmHWM", 0), values.get("VmRSS", 0))
+        previous = self._latest
+        peak_rss_mb = max(rss_kb / 1024, previous.peak_rss_mb if previous else 0.0)
+        self._latest = ResourceUsage(
+            cpu_user_s=utime / _CLOCK_TICKS,
+            cpu_sys_s=stime / _CLOCK_TICKS,
+            peak_rss_mb=round(peak_rss_mb, 3),
+            ctx_switches=values.get("voluntary_ctxt_switches", 0)
+            + values.get("nonvoluntary_ctxt_switches", 0),
+        )
+        return True
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass
 import json
+import os
 import queue
 import subprocess
 import threading
@@ -12,6 +13,8 @@ from typing import Deque, Sequence
 from runledger.protocol.jsonl import JsonlParseError, write_jsonl_line
 from runledger.protocol.messages import ProtocolMessage, parse_message
 
+from .resources import ProcSampler, ResourceUsage, current_rss_mb, from_rusage, merge_usage
+
 
 @dataclass
 class AgentProcessError(Exception):
@@ -36,6 +39,11 @@ class AgentProcess:
         self._stdout_thread: threading.Thread | None = None
         self._stderr_thread: threading.Thread | None = None
         self._stdout_closed = object()
+        self._sampler: ProcSampler | None = None
+        self._rusage: ResourceUsage | None = None
+        self._parent_rss_mb: float | None = None
+        self.resource_usage: ResourceUsage | None = None
+        self._wakeup = object()
 
     def __enter__(self) -> "AgentProcess":
         self.start()
@@ -47,6 +55,7 @@ class AgentProcess:
     def start(self) -> None:
         if self._process is not None:
             return
+        self._parent_rss_mb = current_rss_mb()
         self._process = subprocess.Popen(
             self._command,
             stdin=subprocess.PIPE,
@@ -62,16 +71,31 @@ class AgentProcess:
         self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
         self._stdout_thread.start()
         self._stderr_thread.start()
+        if ProcSampler.available():
+            self._sampler = ProcSampler(self._process.pid)
+            self._sampler.start()
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def alive(self) -> bool:
+        return self._process is not None and self._reap(0) is None
 
     def close(self) -> None:
         if self._process is None:
             return
-        if self._process.poll() is None:
+        if self._sampler is not None:
+            # One last look before the child is reaped and /proc/<pid> disappears.
+            self._sampler.sample()
+        if self._reap(0) is None:
             self._process.terminate()
-            try:
-                self._process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
+            if self._reap(2) is None:
                 self._process.kill()
+                self._reap(None)
+        sampled = self._sampler.stop() if self._sampler is not None else None
+        self.resource_usage = merge_usage(self._rusage, sampled, self._parent_rss_mb)
+        self._sampler = None
         if self._stdout_thread is not None:
             self._stdout_thread.join(timeout=1)
         if self._stderr_thread is not None:
@@ -87,33 +111,81 @@ class AgentProcess:
         write_jsonl_line(process.stdin, message)
         process.stdin.flush()
 
-    def recv(self) -> ProtocolMessage:
-        process = self._require_process()
-        if self._stdout_thread is None:
-            raise AgentProcessError("Agent stdout is unavailable", self._stderr_tail_list())
+    def recv(self, stop_at: float | None = None) -> ProtocolMessage | None:
+        """Wait for the next message, raising after the protocol timeout.
 
+        With `stop_at` (a `time.monotonic()` value) it returns None once that passes first.
+        """
         deadline = time.monotonic() + self._timeout_s
         while True:
-            remaining = deadline - time.monotonic()
+            now = time.monotonic()
+            remaining = deadline - now
             if remaining <= 0:
                 raise AgentProcessError(
                     "Case timeout waiting for agent message",
                     self._stderr_tail_list(),
                 )
+            if stop_at is not None:
+                if now >= stop_at:
+                    return None
+                remaining = min(remaining, stop_at - now)
+            message = self.poll(remaining)
+            if message is not None:
+                return message
+
+    def poll(self, timeout_s: float) -> ProtocolMessage | None:
+        """Wait up to `timeout_s` for a message; returns None on timeout or `wake()`."""
+        process = self._require_process()
+        if self._stdout_thread is None:
+            raise AgentProcessError("Agent stdout is unavailable", self._stderr_tail_list())
+        try:
+            item = self._stdout_queue.get(timeout=max(timeout_s, 0.0))
+        except queue.Empty:
+            if self._reap(0) is not None and self._stdout_queue.empty():
+                raise AgentProcessError(
+                    f"Agent exited early with code {process.returncode}",
+                    self._stderr_tail_list(),
+                )
+            return None
+        if item is self._wakeup:
+            return None
+        if item is self._stdout_closed:
+            raise AgentProcessError("Agent stdout closed unexpectedly", self._stderr_tail_list())
+        if isinstance(item, Exception):
+            raise AgentProcessError(str(item), self._stderr_tail_list()) from item
+        return item
+
+    def wake(self) -> None:
+        """Interrupt a pending `poll()`; safe to call from any thread."""
+        self._stdout_queue.put(self._wakeup)
+
+    def _reap(self, timeout_s: float | None) -> int | None:
+        """Wait up to `timeout_s` (None = forever) for the child to exit; returns its code.
+
+        Reaping through `os.wait4` rather than `Popen.wait` also yields the child's rusage.
+        """
+        process = self._require_process()
+        if process.returncode is not None:
+            return process.returncode
+        if not hasattr(os, "wait4"):
             try:
-                item = self._stdout_queue.get(timeout=remaining)
-            except queue.Empty:
-                if process.poll() is not None:
-                    raise AgentProcessError(
-                        f"Agent exited early with code {process.returncode}",
-                        self._stderr_tail_list(),
-                    )
-                continue
-            if item is self._stdout_closed:
-                raise AgentProcessError("Agent stdout closed unexpectedly", self._stderr_tail_list())
-            if isinstance(item, Exception):
-                raise AgentProcessError(str(item), self._stderr_tail_list()) from item
-            return item
+                return process.wait(timeout=timeout_s)
+            except subprocess.TimeoutExpired:
+                return None
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        while True:
+            try:
+                pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere; Popen reports what it knows.
+                return process.wait()
+            if pid:
+                process.returncode = os.waitstatus_to_exitcode(status)
+                self._rusage = from_rusage(rusage)
+                return process.returncode
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.005)
 
     def _require_process(self) -> subprocess.Popen[str]:
         if self._process is None:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+# Per-case timing keys. `spawn_ms`, `agent_ms`, `tool_wait_ms`, `assertions_ms` and
+# `harness_ms` partition the case's wall time and are what reports stack; the others
+# overlap them (`tool_ms` and `rate_limit_wait_ms` fall within `tool_wait_ms`).
+TIMING_FIELDS = (
+    "spawn_ms",
+    "first_message_ms",
+    "agent_ms",
+    "tool_wait_ms",
+    "tool_ms",
+    "rate_limit_wait_ms",
+    "assertions_ms",
+    "harness_ms",
+)
+
+
+def ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+@dataclass
+class CaseTimer:
+    """Accumulates monotonic durations while a case runs.
+
+    `agent_s` is time blocked on the agent with no tool call in flight and
+    `tool_wait_s` is time blocked while at least one was; `tool_s` sums individual
+    call durations, so it can exceed `tool_wait_s` when calls overlap.
+    """
+
+    spawn_s: float = 0.0
+    first_message_s: float | None = None
+    agent_s: float = 0.0
+    tool_wait_s: float = 0.0
+    tool_s: float = 0.0
+    rate_limit_wait_s: float = 0.0
+    assertions_s: float = 0.0
+    _wait_start: float | None = None
+    _wait_on_tools: bool = False
+
+    def begin_wait(self, *, tools_in_flight: bool) -> None:
+        self._wait_start = time.monotonic()
+        self._wait_on_tools = tools_in_flight
+
+    def end_wait(self) -> None:
+        """Charge the wait started by `begin_wait`; a no-op if none is open."""
+        if self._wait_start is None:
+            return
+        elapsed = time.monotonic() - self._wait_start
+        self._wait_start = None
+        if self._wait_on_tools:
+            self.tool_wait_s += elapsed
+        else:
+            self.agent_s += elapsed
+
+    def as_dict(self, wall_s: float) -> dict[str, float | None]:
+        accounted = self.spawn_s + self.agent_s + self.tool_wait_s + self.assertions_s
+        return {
+            "spawn_ms": ms(self.spawn_s),
+            "first_message_ms": (
+                ms(self.first_message_s) if self.first_message_s is not None else None
+            ),
+            "agent_ms": ms(self.agent_s),
+            "tool_wait_ms": ms(self.tool_wait_s),
+            "tool_ms": ms(self.tool_s),
+            "rate_limit_wait_ms": ms(self.rate_limit_wait_s),
+            "assertions_ms": ms(self.assertions_s),
+            "harness_ms": ms(max(0.0, wall_s - accounted)),
+        }
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from runledger.protocol.messages import Usage
+
+USAGE_FIELDS = ("tokens_in", "tokens_out", "cost_usd", "steps")
+
+
+@dataclass
+class UsageTotals:
+    """Sums the usage increments an agent reports; a field stays None until reported."""
+
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    cost_usd: float | None = None
+    steps: int | None = None
+
+    def add(self, report: Usage) -> None:
+        for name in USAGE_FIELDS:
+            value = getattr(report, name)
+            if value is None:
+                continue
+            current = getattr(self, name)
+            total = value if current is None else current + value
+            if name == "cost_usd":
+                total = round(total, 9)
+            setattr(self, name, total)
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import importlib
+import json
+import os
+from pathlib import Path
+import socketserver
+import stat
+import sys
+import threading
+import warnings
+from typing import Any, Callable, Iterable, Iterator, List, Literal, Mapping, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from runledger.artifacts.run_artifacts import BaselineComparisonError, write_run_artifacts
+from runledger.cassette.index_cache import CassetteIndexCache
+from runledger.config.loader import iter_cases, load_suite
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.config.selection import CaseFilter, build_case_filter
+from runledger.runner.engine import run_suite
+from runledger.runner.models import CaseResult, SuiteResult
+from runledger.runner.pool import AgentPool
+from runledger.tools.registry import (
+    Tool,
+    resolve_tools,
+    setup_tools,
+    teardown_tools,
+    tool_module_file,
+)
+
+DEFAULT_PORT = 8765
+
+
+class RunRequest(BaseModel):
+    """Body of `POST /run`; fields mirror the `runledger run` options."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    suite: str
+    mode: Optional[Literal["replay", "record", "live", "hybrid"]] = None
+    case: Optional[str] = None
+    select: List[str] = []
+    exclude: List[str] = []
+    tags: Optional[str] = None
+    changed_since: Optional[str] = None
+    repeat: int = Field(default=1, ge=1)
+    baseline: Optional[str] = None
+    output_dir: Optional[str] = None
+
+
+class SuiteSession:
+    """A suite kept warm between runs: config, set-up tools, replay indexes and agents.
+
+    The suite is reloaded (and its tools and agents recycled) when suite.yaml changes,
+    and its tools when the `tool_module` source file does. Runs against one session are
+    serialized by `lock`.
+    """
+
+    def __init__(self, suite_path: Path, *, pool_size: int = 1):
+        self.suite_path = suite_path
+        self.suite_dir = suite_path if suite_path.is_dir() else suite_path.parent
+        self.suite_file = suite_path if suite_path.is_file() else suite_path / "suite.yaml"
+        self.pool_size = pool_size
+        self.lock = threading.Lock()
+        self.cassette_indexes = CassetteIndexCache()
+        self.runs = 0
+        self._suite: SuiteConfig | None = None
+        self._stamp: tuple[int, int] | None = None
+        self._tools: dict[str, Tool] | None = None
+        self._tools_error: str | None = None
+        self._tools_stamp: tuple[int, int] | None = None
+        self._pool: AgentPool | None = None
+
+    def suite(self) -> SuiteConfig:
+        info = self.suite_file.stat()
+        stamp = (info.st_mtime_ns, info.st_size)
+        if self._suite is None or stamp != self._stamp:
+            suite = load_suite(self.suite_path)
+            self._release()
+            self._suite, self._stamp = suite, stamp
+            self._start_pool(suite)
+        return self._suite
+
+    def recycle_agents(self) -> None:
+        """Replace pre-started agents, e.g. after the agent's own files changed."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if self._suite is not None:
+            self._start_pool(self._suite)
+
+    def reload_tools(self) -> None:
+        """Tear down the set-up tools and re-import `tool_module` on next use."""
+        self._teardown_tools()
+        if self._suite is not None and self._suite.tool_module:
+            sys.modules.pop(self._suite.tool_module, None)
+            importlib.invalidate_caches()
+
+    def _start_pool(self, suite: SuiteConfig) -> None:
+        if self.pool_size > 0:
+            self._pool = AgentPool(suite.agent_command, self.pool_size)
+            self._pool.fill()
+
+    def cases(
+        self,
+        suite: SuiteConfig,
+        *,
+        case_filter: CaseFilter | None = None,
+        case: str | None = None,
+    ) -> Iterator[CaseConfig]:
+        """The suite's cases; case files are parsed and validated before this returns."""
+        cases = iter_cases(self.suite_dir, suite.cases_path, case_filter=case_filter)
+        if case is not None:
+            cases = (item for item in cases if item.id == case)
+        return cases
+
+    def run(
+        self,
+        suite: SuiteConfig,
+        cases: Iterable[CaseConfig],
+        *,
+        on_case: Callable[[CaseResult], None] | None = None,
+        repeat: int = 1,
+    ) -> SuiteResult:
+        self.runs += 1
+        return run_suite(
+            suite,
+            cases,
+            tools=self.tools(suite),
+            agent_pool=self._pool,
+            cassette_indexes=self.cassette_indexes,
+            on_case=on_case,
+            repeat=repeat,
+        )
+
+    def tools(self, suite: SuiteConfig) -> Mapping[str, Tool] | None:
+        """The suite's set-up tools, or None in replay mode.
+
+        A failed setup is remembered until suite.yaml or the tool module changes, so
+        later runs report it again without calling `setup()` a second time.
+        """
+        if suite.mode == "replay":
+            return None
+        stamp = _tool_module_stamp(suite)
+        if stamp != self._tools_stamp and (self._tools is not None or self._tools_error):
+            self.reload_tools()
+        if self._tools_error is not None:
+            raise RuntimeError(self._tools_error)
+        if self._tools is None:
+            self._tools_stamp = stamp
+            try:
+                tools = resolve_tools(suite.tool_registry, suite.tool_module)
+                setup_tools(tools)
+            except Exception as exc:
+                self._tools_error = f"Failed to set up tools: {exc}"
+                raise RuntimeError(self._tools_error) from exc
+            self._tools = tools
+        return self._tools
+
+    def _release(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self._teardown_tools()
+        self.cassette_indexes.clear()
+
+    def _teardown_tools(self) -> None:
+        if self._tools is not None:
+            for error in teardown_tools(self._tools):
+                warnings.warn(f"Tool teardown failed: {error}", RuntimeWarning, stacklevel=2)
+            self._tools = None
+        self._tools_error = None
+
+    def close(self) -> None:
+        with self.lock:
+            self._release()
+
+
+def _tool_module_stamp(suite: SuiteConfig) -> tuple[int, int] | None:
+    path = tool_module_file(suite.tool_module) if suite.tool_module else None
+    try:
+        info = path.stat() if path is not None else None
+    except OSError:
+        return None
+    return (info.st_mtime_ns, info.st_size) if info is not None else None
+
+
+def _suite_key(suite_path: Path) -> Path:
+    resolved = suite_path.resolve()
+    if resolved.name == "suite.yaml" and resolved.is_file():
+        return resolved.parent
+    return resolved
+
+
+class ServeState:
+    """Sessions for the suites a server was started with, keyed by resolved suite path.
+
+    Only these suites can be run: a request names a suite, and running it executes the
+    suite's `agent_command` as the server's user.
+    """
+
+    def __init__(self, suites: Iterable[Path], *, pool_size: int = 1):
+        self.pool_size = pool_size
+        self._sessions: dict[Path, SuiteSession] = {}
+        for suite_path in suites:
+            key = _suite_key(suite_path)
+            self._sessions.setdefault(key, SuiteSession(key, pool_size=pool_size))
+        self._lock = threading.Lock()
+
+    def session(self, suite_path: Path) -> SuiteSession | None:
+        """The session for `suite_path`, or None if this server does not serve it."""
+        with self._lock:
+            return self._sessions.get(_suite_key(suite_path))
+
+    def sessions(self) -> list[SuiteSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def close(self) -> None:
+        for session in self.sessions():
+            session.close()
+
+
+def _case_line(result: CaseResult) -> dict[str, Any]:
+    return {
+        "type": "case",
+        "case_id": result.case_id,
+        "passed": result.passed,
+        "wall_ms": result.wall_ms,
+        "tool_calls": result.tool_calls,
+        "failure": result.failure.type if result.failure else None,
+        "message": result.failure.message if result.failure else None,
+    }
+
+
+def _host_name(header: str) -> str:
+    if header.startswith("["):
+        return header[1 : header.find("]")] if "]" in header else header
+    return header.rsplit(":", 1)[0] if header.count(":") == 1 else header
+
+
+def _inside_suite(session: SuiteSession, value: str, option: str) -> Path:
+    """Resolve a request path against the suite directory and refuse anything outside it."""
+    suite_dir = session.suite_dir.resolve()
+    path = Path(value)
+    resolved = (path if path.is_absolute() else suite_dir / path).resolve()
+    if resolved != suite_dir and suite_dir not in resolved.parents:
+        raise ValueError(f"{option} must be inside the suite directory {suite_dir}")
+    return resolved
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "runledger-serve"
+    server: Any
+
+    def _host_allowed(self) -> bool:
+        # A web page can make the browser send simple requests to localhost; a foreign
+        # Host header (e.g. via DNS rebinding) gives such requests away.
+        allowed = getattr(self.server, "allowed_hosts", None)
+        if allowed is None:
+            return True
+        host = self.headers.get("Host")
+        return host is not None and _host_name(host.strip()).lower() in allowed
+
+    def address_string(self) -> str:
+        # Unix-socket peers have no (host, port) address.
+        address = self.client_address
+        return address[0] if isinstance(address, tuple) and address else "local"
+
+    def do_GET(self) -> None:
+        if not self._host_allowed():
+            self._send_json(403, {"type": "error", "message": "Host not allowed"})
+            return
+        if self.path != "/health":
+            self._send_json(404, {"type": "error", "message": f"Unknown path: {self.path}"})
+            return
+        sessions = self.server.state.sessions()
+        self._send_json(
+            200,
+            {
+                "status": "ok",
+                "suites": [
+                    {"suite": str(session.suite_path), "runs": session.runs}
+                    for session in sessions
+                ],
+            },
+        )
+
+    def do_POST(self) -> None:
+        if self.path != "/run":
+            self._send_json(404, {"type": "error", "message": f"Unknown path: {self.path}"})
+            return
+        if not self._host_allowed():
+            self._send_json(403, {"type": "error", "message": "Host not allowed"})
+            return
+        if self.headers.get_content_type() != "application/json":
+            # Browsers only send JSON cross-origin after a CORS preflight, which is refused.
+            message = "Content-Type must be application/json"
+            self._send_json(415, {"type": "error", "message": message})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = RunRequest.model_validate(json.loads(self.rfile.read(length) or b"{}"))
+        except (ValueError, ValidationError) as exc:
+            self._send_json(400, {"type": "error", "message": f"Invalid run request: {exc}"})
+            return
+        session = self.server.state.session(Path(request.suite))
+        if session is None:
+            message = f"Suite not served by this server: {request.suite}"
+            self._send_json(403, {"type": "error", "message": message})
+            return
+        with session.lock:
+            self._run(session, request)
+
+    def _run(self, session: SuiteSession, request: RunRequest) -> None:
+        try:
+            suite = session.suite()
+        except Exception as exc:
+            self._send_json(400, {"type": "error", "message": f"Failed to load suite: {exc}"})
+            return
+        if request.mode is not None:
+            suite = suite.model_copy(update={"mode": request.mode})
+        try:
+            case_filter = build_case_filter(
+                suite,
+                session.suite_dir,
+                select=request.select,
+                exclude=request.exclude,
+                tags=request.tags,
+                changed_since=request.changed_since,
+            )
+        except ValueError as exc:
+            self._send_json(400, {"type": "error", "message": f"Invalid case selection: {exc}"})
+            return
+        try:
+            output_dir = (
+                _inside_suite(session, request.output_dir, "output_dir")
+                if request.output_dir
+                else Path(suite.output_dir or "runledger_out")
+            )
+            baseline = (
+                _inside_suite(session, request.baseline, "baseline")
+                if request.baseline
+                else (Path(suite.baseline_path) if suite.baseline_path else None)
+            )
+        except ValueError as exc:
+            self._send_json(400, {"type": "error", "message": f"Invalid run request: {exc}"})
+            return
+        try:
+            cases = session.cases(suite, case_filter=case_filter, case=request.case)
+        except Exception as exc:
+            self._send_json(400, {"type": "error", "message": f"Failed to load cases: {exc}"})
+            return
+        try:
+            session.tools(suite)
+        except Exception as exc:
+            self._send_json(400, {"type": "error", "message": str(exc)})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            suite_result = session.run(
+                suite,
+                cases,
+                on_case=lambda result: self._emit(_case_line(result)),
+                repeat=request.repeat,
+            )
+        except Exception as exc:
+            self._emit({"type": "error", "message": f"Failed to run suite: {exc}"})
+            return
+        if request.case is not None and not suite_result.cases:
+            self._emit({"type": "error", "message": f"Case not found: {request.case}"})
+            return
+        if not suite_result.cases:
+            self._emit({"type": "run_end", "passed": True, "total_cases": 0, "run_dir": None})
+            return
+
+        try:
+            artifacts = write_run_artifacts(
+                output_dir,
+                suite=suite,
+                suite_path=session.suite_file,
+                suite_result=suite_result,
+                baseline_path=baseline,
+            )
+        except BaselineComparisonError as exc:
+            message = f"Failed to load baseline or compute diff: {exc}"
+            self._emit({"type": "error", "message": message})
+            return
+        regression = artifacts.regression
+        self._emit(
+            {
+                "type": "run_end",
+                "passed": artifacts.passed,
+                "run_id": artifacts.run_id,
+                "run_dir": str(artifacts.run_dir),
+                "total_cases": suite_result.total_cases,
+                "passed_cases": suite_result.passed_cases,
+                "failed_cases": suite_result.failed_cases,
+                "regression_passed": regression.get("passed") if regression else None,
+            }
+        )
+
+    def _emit(self, payload: dict[str, Any]) -> None:
+        # A client that hangs up mid-run does not stop the run or its artifacts.
+        try:
+            self.wfile.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        except OSError:
+            pass
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    state: ServeState,
+    *,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """An HTTP server for `state`, on a Unix socket when `socket_path` is given.
+
+    Over TCP, only requests whose Host header names a loopback address or `host` are served.
+    The Unix socket is only accessible to its owner (mode 0600).
+    """
+    server: socketserver.BaseServer
+    allowed_hosts: set[str] | None = None
+    if socket_path is not None:
+        if socket_path.exists() and stat.S_ISSOCK(socket_path.stat().st_mode):
+            # Left behind by a server that did not shut down cleanly.
+            os.unlink(socket_path)
+        # Bind under a restrictive umask so the socket is never reachable by other users.
+        previous_umask = os.umask(0o177)
+        try:
+            server = _UnixHTTPServer(str(socket_path), _Handler)
+        finally:
+            os.umask(previous_umask)
+        os.chmod(socket_path, 0o600)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+        server.daemon_threads = True
+        allowed_hosts = {"localhost", "127.0.0.1", "::1", host.lower()}
+    setattr(server, "state", state)
+    setattr(server, "allowed_hosts", allowed_hosts)
+    return server
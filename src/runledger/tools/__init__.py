@@ -1,3 +1,27 @@
-from .registry import FunctionTool, Tool, load_tool_module, resolve_tools
+from .cache import CachedTool, ToolResultCache, get_tool_cache
+from .registry import (
+    AsyncFunctionTool,
+    FunctionTool,
+    Tool,
+    call_tool,
+    load_tool_module,
+    resolve_tools,
+    setup_tools,
+    teardown_tools,
+    tool_module_file,
+)
 
-__all__ = ["FunctionTool", "Tool", "load_tool_module", "resolve_tools"]
+__all__ = [
+    "AsyncFunctionTool",
+    "CachedTool",
+    "FunctionTool",
+    "Tool",
+    "ToolResultCache",
+    "call_tool",
+    "get_tool_cache",
+    "load_tool_module",
+    "resolve_tools",
+    "setup_tools",
+    "teardown_tools",
+    "tool_module_file",
+]
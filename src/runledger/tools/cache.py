@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Mapping
+
+from runledger.config.models import ToolCacheSpec, ToolOptionsSpec
+from runledger.util.canonical_json import canonical_dumps
+
+from .registry import Tool, call_tool
+
+
+def _cache_key(tool_name: str, args: dict[str, Any]) -> str:
+    payload = f"{tool_name}\0{canonical_dumps(args)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CacheItem:
+    tool: str
+    payload: str
+    expires_at: float | None
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(self.payload.encode("utf-8"))
+
+
+class ToolResultCache:
+    """Memoizes successful tool results keyed by tool name and canonical args.
+
+    The in-memory layer is an LRU bounded by the total size of the serialized results.
+    When a directory is configured, results are also written there so later processes
+    can reuse them until their TTL runs out.
+    """
+
+    def __init__(self, max_bytes: int, directory: Path | None = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._items: OrderedDict[str, _CacheItem] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def _count(self, tool_name: str, counter: str) -> None:
+        by_tool = self._stats.setdefault(tool_name, {"hits": 0, "misses": 0, "evictions": 0})
+        by_tool[counter] += 1
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._stats.items()}
+
+    def get(self, tool_name: str, args: dict[str, Any]) -> tuple[bool, Any]:
+        key = _cache_key(tool_name, args)
+        now = time.time()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item.expires_at is not None and item.expires_at <= now:
+                self._discard(key)
+                item = None
+            if item is None:
+                item = self._read_disk(key, now)
+                if item is not None:
+                    self._insert(key, item)
+            if item is None:
+                self._count(tool_name, "misses")
+                return False, None
+            self._items.move_to_end(key)
+            self._count(tool_name, "hits")
+        # Decode per hit so callers never share (and mutate) a cached object.
+        return True, json.loads(item.payload)
+
+    def put(
+        self,
+        tool_name: str,
+        args: dict[str, Any],
+        result: Any,
+        ttl_s: float | None,
+    ) -> None:
+        try:
+            payload = json.dumps(result, ensure_ascii=False, sort_keys=True)
+        except (TypeError, ValueError):
+            return
+        key = _cache_key(tool_name, args)
+        expires_at = None if ttl_s is None else time.time() + ttl_s
+        item = _CacheItem(tool=tool_name, payload=payload, expires_at=expires_at)
+        with self._lock:
+            self._insert(key, item)
+        self._write_disk(key, item)
+
+    def _insert(self, key: str, item: _CacheItem) -> None:
+        if key in self._items:
+            self._discard(key)
+        if item.size > self.max_bytes:
+            return
+        self._items[key] = item
+        self._bytes += item.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self._bytes -= evicted.size
+            self._count(evicted.tool, "evictions")
+
+    def _discard(self, key: str) -> None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._bytes -= item.size
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> _CacheItem | None:
+        path = self._disk_path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            item = _CacheItem(
+                tool=data["tool"],
+                payload=data["payload"],
+                expires_at=data.get("expires_at"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if item.expires_at is not None and item.expires_at <= now:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return item
+
+    def _write_disk(self, key: str, item: _CacheItem) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {"tool": item.tool, "payload": item.payload, "expires_at": item.expires_at}
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+@dataclass(frozen=True)
+class CachedTool:
+    tool: Tool
+    cache: ToolResultCache
+    ttl_s: float | None
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+    def call(self, args: dict[str, Any]) -> dict[str, Any]:
+        hit, result = self.cache.get(self.name, args)
+        if hit:
+            return result
+        result = call_tool(self.tool, args)
+        self.cache.put(self.name, args, result, self.ttl_s)
+        return result
+
+
+_CACHES: dict[tuple[int, str | None], ToolResultCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_tool_cache(spec: ToolCacheSpec) -> ToolResultCache:
+    """Return the process-wide cache for these settings, creating it on first use."""
+    key = (spec.max_bytes, spec.path)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            directory = Path(spec.path) if spec.path else None
+            cache = ToolResultCache(spec.max_bytes, directory)
+            _CACHES[key] = cache
+        return cache
+
+
+def wrap_cached_tools(
+    tools: Mapping[str, Tool],
+    cache: ToolResultCache,
+    spec: ToolCacheSpec,
+    tool_options: Mapping[str, ToolOptionsSpec],
+) -> dict[str, Tool]:
+    wrapped: dict[str, Tool] = {}
+    for name, tool in tools.items():
+        options = tool_options.get(name)
+        ttl_s = options.cache_ttl_s if options is not None else None
+        if ttl_s is None:
+            ttl_s = spec.default_ttl_s
+        # Caching is opt-in: a tool needs a non-zero TTL from its options or the cache default.
+        if not ttl_s:
+            wrapped[name] = tool
+        else:
+            wrapped[name] = CachedTool(tool=tool, cache=cache, ttl_s=ttl_s)
+    return wrapped
+
+
+def diff_stats(
+    before: Mapping[str, Mapping[str, int]],
+    after: Mapping[str, Mapping[str, int]],
+) -> dict[str, Any]:
+    by_tool: dict[str, dict[str, int]] = {}
+    for tool_name, counts in after.items():
+        previous = before.get(tool_name, {})
+        delta = {key: value - previous.get(key, 0) for key, value in counts.items()}
+        if any(delta.values()):
+            by_tool[tool_name] = delta
+    totals = {
+        key: sum(counts[key] for counts in by_tool.values())
+        for key in ("hits", "misses", "evictions")
+    }
+    return {**totals, "by_tool": by_tool}
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
+import importlib.util
+import inspect
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Protocol
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Protocol
 
 
 class Tool(Protocol):
@@ -12,6 +16,25 @@ class Tool(Protocol):
         ...
 
 
+def async_handler(tool: object) -> Callable[[dict[str, Any]], Awaitable[Any]] | None:
+    """Return the tool's `acall` coroutine function, if it defines one."""
+    acall = getattr(tool, "acall", None)
+    if acall is not None and inspect.iscoroutinefunction(acall):
+        return acall
+    return None
+
+
+def call_tool(tool: object, args: dict[str, Any]) -> Any:
+    """Call a tool synchronously, driving `acall` to completion for async-only tools."""
+    call = getattr(tool, "call", None)
+    if call is not None:
+        return call(args)
+    acall = async_handler(tool)
+    if acall is None:
+        raise TypeError(f"Tool {getattr(tool, 'name', tool)!r} has no call or acall")
+    return asyncio.run(acall(args))
+
+
 @dataclass(frozen=True)
 class FunctionTool:
     name: str
@@ -21,12 +44,23 @@ class FunctionTool:
         return self.handler(args)
 
 
+@dataclass(frozen=True)
+class AsyncFunctionTool:
+    name: str
+    handler: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+    async def acall(self, args: dict[str, Any]) -> dict[str, Any]:
+        return await self.handler(args)
+
+
 def _coerce_tool(name: str, value: object) -> Tool:
-    if isinstance(value, FunctionTool):
-        return value
+    if isinstance(value, (FunctionTool, AsyncFunctionTool)):
+        return value  # type: ignore[return-value]
+    if inspect.iscoroutinefunction(value):
+        return AsyncFunctionTool(name=name, handler=value)  # type: ignore[return-value]
     if callable(value):
         return FunctionTool(name=name, handler=value)
-    if hasattr(value, "call"):
+    if hasattr(value, "call") or async_handler(value) is not None:
         tool = value
         if getattr(tool, "name", None) is None:
             setattr(tool, "name", name)
@@ -47,6 +81,17 @@ def load_tool_module(module_path: str) -> dict[str, Tool]:
     return tools
 
 
+def tool_module_file(module_path: str) -> Path | None:
+    """Source file of a tool module, or None if it has none or cannot be found."""
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.has_location or not spec.origin:
+        return None
+    return Path(spec.origin).resolve()
+
+
 def resolve_tools(allowed: Iterable[str], module_path: str | None) -> dict[str, Tool]:
     tools = load_tool_module("runledger.tools.builtin")
     if module_path:
@@ -56,3 +101,50 @@ def resolve_tools(allowed: Iterable[str], module_path: str | None) -> dict[str,
     if missing:
         raise ValueError(f"Tools not found in registry: {', '.join(sorted(missing))}")
     return {name: tools[name] for name in allowed_list}
+
+
+def _unique_tools(tools: Mapping[str, Tool]) -> list[Tool]:
+    # A tool object registered under several names still gets one setup/teardown.
+    seen: dict[int, Tool] = {}
+    for tool in tools.values():
+        seen.setdefault(id(tool), tool)
+    return list(seen.values())
+
+
+def setup_tools(tools: Mapping[str, Tool]) -> None:
+    """Call each tool's optional `setup()` hook.
+
+    If a hook fails, that tool and the ones already set up are torn down, so whatever the
+    failing hook acquired before raising is released, and then the error propagates.
+    """
+    ready: list[Tool] = []
+    for tool in _unique_tools(tools):
+        ready.append(tool)
+        setup = getattr(tool, "setup", None)
+        if callable(setup):
+            try:
+                setup()
+            except Exception:
+                _teardown_all(ready)
+                raise
+
+
+def teardown_tools(tools: Mapping[str, Tool]) -> list[str]:
+    """Call each tool's optional `teardown()` hook in reverse setup order.
+
+    A failing hook does not stop the others; its error is returned as "<tool>: <message>".
+    """
+    return _teardown_all(_unique_tools(tools))
+
+
+def _teardown_all(tools: list[Tool]) -> list[str]:
+    errors: list[str] = []
+    for tool in reversed(tools):
+        teardown = getattr(tool, "teardown", None)
+        if not callable(teardown):
+            continue
+        try:
+            teardown()
+        except Exception as exc:
+            errors.append(f"{getattr(tool, 'name', tool)}: {exc}")
+    return errors
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import time
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from runledger.config.loader import CASE_FILE_SUFFIXES
+from runledger.config.models import SuiteConfig
+from runledger.config.selection import build_case_filter
+from runledger.runner.models import CaseResult
+from runledger.serve import SuiteSession
+from runledger.tools.registry import tool_module_file
+
+# Never watched: VCS metadata, bytecode and the runner's own parse cache.
+IGNORED_DIRS = frozenset({".git", "__pycache__", ".runledger_cache", ".pytest_cache"})
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_ISDIR = 0x40000000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT = struct.Struct("iIII")
+# Editors save in bursts (write, chmod, rename); wait this long for the rest of one.
+_SETTLE_S = 0.05
+
+
+def _iter_files(root: Path) -> Iterator[Path]:
+    if root.is_file():
+        yield root
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+        for name in filenames:
+            yield Path(dirpath, name)
+
+
+def _snapshot(roots: Iterable[Path]) -> dict[Path, tuple[int, int]]:
+    stamps: dict[Path, tuple[int, int]] = {}
+    for root in roots:
+        for path in _iter_files(root):
+            try:
+                info = path.stat()
+            except OSError:
+                continue
+            stamps[path] = (info.st_mtime_ns, info.st_size)
+    return stamps
+
+
+class PollWatcher:
+    """Finds changed files by comparing mtimes and sizes every `interval_s`."""
+
+    kind = "polling"
+
+    def __init__(self, roots: Iterable[Path], interval_s: float = 0.5):
+        self.interval_s = interval_s
+        self._roots: list[Path] = []
+        self._stamps: dict[Path, tuple[int, int]] = {}
+        for root in roots:
+            self.add(root)
+
+    def add(self, root: Path) -> None:
+        root = root.resolve()
+        if root not in self._roots:
+            self._roots.append(root)
+            self._stamps.update(_snapshot([root]))
+
+    def poll(self, timeout_s: float) -> set[Path]:
+        """Changed, added or removed files; empty if nothing changed within `timeout_s`."""
+        deadline = time.monotonic() + timeout_s
+        while True:
+            current = _snapshot(self._roots)
+            changed = {
+                path
+                for path in current.keys() | self._stamps.keys()
+                if current.get(path) != self._stamps.get(path)
+            }
+            self._stamps = current
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval_s, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def _libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise OSError("inotify is only available on Linux")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class InotifyWatcher:
+    """Linux inotify through ctypes: no polling, and changes are reported by name.
+
+    Directory roots are watched recursively (new subdirectories included); file roots
+    watch their parent directory so atomic saves via rename are still seen.
+    """
+
+    kind = "inotify"
+
+    def __init__(self, roots: Iterable[Path]):
+        self._libc = _libc()
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        # Per watched directory: the file names that matter, or None for all of them.
+        self._names: dict[Path, Optional[set[str]]] = {}
+        try:
+            for root in roots:
+                self.add(root)
+        except OSError:
+            self.close()
+            raise
+
+    def add(self, root: Path) -> None:
+        root = root.resolve()
+        if root.is_dir():
+            for dirpath, dirnames, _ in os.walk(root):
+                dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+                self._watch(Path(dirpath), None)
+        else:
+            self._watch(root.parent, {root.name})
+
+    def _watch(self, directory: Path, names: Optional[set[str]]) -> None:
+        if directory in self._names:
+            known = self._names[directory]
+            if known is None:
+                return
+            names = None if names is None else known | names
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {directory}: {os.strerror(errno)}")
+        self._dirs[wd] = directory
+        self._names[directory] = names
+
+    def poll(self, timeout_s: float) -> set[Path]:
+        """Changed files; empty if nothing relevant changed within `timeout_s`."""
+        if not select.select([self._fd], [], [], max(timeout_s, 0.0))[0]:
+            return set()
+        changed: set[Path] = set()
+        while True:
+            try:
+                changed |= self._parse(os.read(self._fd, 65536))
+            except BlockingIOError:
+                pass
+            if not select.select([self._fd], [], [], _SETTLE_S)[0]:
+                return changed
+
+    def _parse(self, data: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            start = offset + _EVENT.size
+            name = os.fsdecode(data[start : start + length].rstrip(b"\0"))
+            offset = start + length
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            names = self._names.get(directory)
+            if names is not None and name not in names:
+                continue
+            path = directory / name
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and name not in IGNORED_DIRS:
+                    try:
+                        self.add(path)
+                    except OSError:
+                        # Gone again, or out of watches; existing watches keep working.
+                        pass
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+Watcher = Union[PollWatcher, InotifyWatcher]
+
+
+def open_watcher(
+    roots: Iterable[Path], *, interval_s: float = 0.5, force_poll: bool = False
+) -> Watcher:
+    """inotify where the platform has it, otherwise mtime polling."""
+    roots = list(roots)
+    if not force_poll:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            # Not Linux, no libc symbol, or out of inotify watches.
+            pass
+    return PollWatcher(roots, interval_s)
+
+
+def agent_files(command: Sequence[str]) -> list[Path]:
+    """Files named on the agent command line, minus the Python interpreter itself."""
+    interpreter = Path(sys.executable).resolve()
+    files: list[Path] = []
+    for part in command:
+        path = Path(part)
+        if path.is_file():
+            resolved = path.resolve()
+            if resolved != interpreter and not resolved.name.startswith("python"):
+                files.append(resolved)
+    return files
+
+
+@dataclass
+class WatchIteration:
+    results: list[CaseResult]
+    full: bool
+    # Files the run itself wrote (record/hybrid cassettes), not to be treated as edits.
+    written: set[Path] = field(default_factory=set)
+
+
+class SuiteWatch:
+    """Re-runs the cases a set of changed files can affect, on a warm `SuiteSession`.
+
+    Changes to suite.yaml, the agent's files, the tool module's source or `extra_paths`,
+    and deleted case files, re-run the selection in full; otherwise only cases whose case
+    file, cassette or schema changed are run.
+    """
+
+    def __init__(
+        self,
+        session: SuiteSession,
+        *,
+        mode: str | None = None,
+        select: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        tags: str | None = None,
+        extra_paths: Sequence[Path] = (),
+    ):
+        self.session = session
+        self.mode = mode
+        self.select = tuple(select)
+        self.exclude = tuple(exclude)
+        self.tags = tags
+        self.extra_paths = tuple(path.resolve() for path in extra_paths)
+        self.latest: dict[str, CaseResult] = {}
+        self._agent_files: list[Path] = []
+        self._tool_files: list[Path] = []
+
+    def suite(self) -> SuiteConfig:
+        suite = self.session.suite()
+        self._agent_files = agent_files(suite.agent_command)
+        tool_file = tool_module_file(suite.tool_module) if suite.tool_module else None
+        self._tool_files = [tool_file] if tool_file is not None else []
+        if self.mode is not None:
+            suite = suite.model_copy(update={"mode": self.mode})
+        return suite
+
+    def roots(self) -> list[Path]:
+        self.suite()
+        return [
+            self.session.suite_dir.resolve(),
+            *self._agent_files,
+            *self._tool_files,
+            *self.extra_paths,
+        ]
+
+    def run(
+        self,
+        changed: set[Path] | None = None,
+        on_case: Callable[[CaseResult], None] | None = None,
+    ) -> WatchIteration:
+        """Run everything (`changed=None`) or just the cases `changed` affects."""
+        agent_changed = bool(changed) and any(path in changed for path in self._agent_files)
+        tools_changed = bool(changed) and any(path in changed for path in self._tool_files)
+        suite = self.suite()
+        if agent_changed:
+            self.session.recycle_agents()
+        if tools_changed:
+            self.session.reload_tools()
+        full = changed is None or agent_changed or tools_changed or self._needs_full_run(changed)
+        case_filter = build_case_filter(
+            suite,
+            self.session.suite_dir,
+            select=self.select,
+            exclude=self.exclude,
+            tags=self.tags,
+            changed=None if full else frozenset(changed or ()),
+        )
+        cases = self.session.cases(suite, case_filter=case_filter)
+        result = self.session.run(suite, cases, on_case=on_case)
+        if full:
+            self.latest = {}
+        self.latest.update((case.case_id, case) for case in result.cases)
+        written: set[Path] = set()
+        if suite.mode in {"record", "hybrid"}:
+            written = {
+                Path(case.replay_cassette_path).resolve()
+                for case in result.cases
+                if case.replay_cassette_path
+            }
+        return WatchIteration(results=result.cases, full=full, written=written)
+
+    def cassette_dirs(self) -> set[Path]:
+        """Directories of cassettes used so far that live outside the suite directory."""
+        suite_dir = self.session.suite_dir.resolve()
+        dirs: set[Path] = set()
+        for case in self.latest.values():
+            if case.replay_cassette_path:
+                directory = Path(case.replay_cassette_path).resolve().parent
+                if directory != suite_dir and suite_dir not in directory.parents:
+                    dirs.add(directory)
+        return dirs
+
+    def _needs_full_run(self, changed: set[Path]) -> bool:
+        if self.session.suite_file.resolve() in changed:
+            return True
+        for path in changed:
+            # A deleted case file takes its cases with it; a full run drops them from `latest`.
+            if path.suffix in CASE_FILE_SUFFIXES and not path.exists():
+                return True
+            if any(path == root or root in path.parents for root in self.extra_paths):
+                return True
+        return False
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runledger.artifacts.trace_events import write_trace_events
+from runledger.runner.models import CaseResult
+
+
+def _case() -> CaseResult:
+    t0 = 1_700_000_000.0
+    trace = [
+        {"type": "task_start", "case_id": "t1", "timestamp": t0, "agent_pid": 4242},
+        {
+            "type": "tool_call",
+            "case_id": "t1",
+            "timestamp": t0 + 0.1,
+            "name": "search_docs",
+            "call_id": "c1",
+            "args": {"q": "x"},
+            "agent_ms": 90.0,
+        },
+        {
+            "type": "log",
+            "case_id": "t1",
+            "timestamp": t0 + 0.15,
+            "level": "info",
+            "message": "thinking",
+            "agent_ms": 50.0,
+        },
+        {
+            "type": "tool_result",
+            "case_id": "t1",
+            "timestamp": t0 + 0.3,
+            "call_id": "c1",
+            "ok": True,
+            "duration_ms": 180.0,
+            "worker": "runledger-tool-1",
+        },
+        {"type": "case_end", "case_id": "t1", "timestamp": t0 + 0.5, "wall_ms": 520},
+    ]
+    return CaseResult(
+        case_id="t1",
+        passed=True,
+        output={},
+        trace=trace,
+        wall_ms=520,
+        tool_calls=1,
+        tool_errors=0,
+    )
+
+
+def test_trace_events_tracks_and_spans(tmp_path: Path) -> None:
+    path = write_trace_events(tmp_path / "trace.json", [_case()])
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+    names = {
+        (event["pid"], event["tid"]): event["args"]["name"]
+        for event in events
+        if event["ph"] == "M" and event["name"] == "thread_name"
+    }
+    assert names == {(1, 1): "cases", (4242, 4242): "agent", (1, 2): "runledger-tool-1"}
+
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert spans["t1"]["ts"] == 0 and spans["t1"]["dur"] == 520_000
+    assert spans["turn -> search_docs"]["pid"] == 4242
+    assert spans["turn -> search_docs"]["ts"] == 30_000
+    assert spans["search_docs"]["tid"] == 2
+    assert spans["search_docs"]["ts"] == 140_000 and spans["search_docs"]["dur"] == 180_000
+
+    instants = [event for event in events if event["ph"] == "i"]
+    assert [event["name"] for event in instants] == ["log: info"]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import builtins
+import hashlib
+import io
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+from runledger.cassette.bundle import CassetteBundle, write_bundle
+from runledger.cassette.match import find_match
+from runledger.cassette.rules import compile_match_rules
+from runledger.config.models import CaseConfig, MatchRuleSpec, SuiteConfig, ToolOptionsSpec
+from runledger.runner.engine import run_suite
+
+
+def test_bundle_serves_lookups_without_cassette_files(tmp_path: Path) -> None:
+    cassettes_dir = tmp_path / "cassettes"
+    cassettes_dir.mkdir()
+    first = cassettes_dir / "a.jsonl"
+    second = cassettes_dir / "b.jsonl"
+    first.write_text(
+        '{"tool":"search_docs","args":{"q":"a","cursor":"1"},"ok":true,"result":{"n":1}}\n',
+        encoding="utf-8",
+    )
+    second.write_text(
+        '{"tool":"search_docs","args":{"q":"b"},"ok":false,"error":"boom"}\n',
+        encoding="utf-8",
+    )
+    first_sha = hashlib.sha256(first.read_bytes()).hexdigest()
+    rules = compile_match_rules(
+        {"search_docs": ToolOptionsSpec(match=MatchRuleSpec(ignore_paths=["cursor"]))}
+    )
+    bundle_path = tmp_path / "cassettes.rlbundle"
+
+    assert write_bundle(bundle_path, [first, second, first], rules) == 2
+    first.unlink()
+    second.unlink()
+
+    with CassetteBundle(bundle_path) as bundle:
+        index = bundle.index_for(first, rules)
+        assert index is not None
+        assert index.sha256 == first_sha
+        match = find_match(index, "search_docs", {"q": "a", "cursor": "2"})
+        assert match is not None and match.result == {"n": 1}
+
+        # Without the rules the stored keys are stale, so lookups fall back to decoding entries.
+        strict = bundle.index_for(first)
+        assert strict is not None
+        assert find_match(strict, "search_docs", {"q": "a", "cursor": "2"}) is None
+
+        errored = bundle.index_for(second, rules)
+        assert errored is not None and errored.entry_at(0).error == "boom"
+        assert bundle.index_for(tmp_path / "missing.jsonl") is None
+
+
+def test_bundle_steps_aside_for_cassettes_edited_since(tmp_path: Path) -> None:
+    edited = tmp_path / "edited.jsonl"
+    touched = tmp_path / "touched.jsonl"
+    for path in (edited, touched):
+        path.write_text(
+            '{"tool":"search_docs","args":{"q":"a"},"ok":true,"result":{"n":1}}\n',
+            encoding="utf-8",
+        )
+    bundle_path = tmp_path / "cassettes.rlbundle"
+    write_bundle(bundle_path, [edited, touched])
+
+    edited.write_text(
+        '{"tool":"search_docs","args":{"q":"a"},"ok":true,"result":{"n":22}}\n',
+        encoding="utf-8",
+    )
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    with CassetteBundle(bundle_path) as bundle:
+        trusted = bundle.index_for(edited)
+        assert trusted is not None and trusted.entry_at(0).result == {"n": 1}
+    with CassetteBundle(bundle_path, check_stale=True) as bundle:
+        assert bundle.index_for(edited) is None
+        assert bundle.index_for(touched) is not None
+
+
+_AGENT = """
+import json
+import sys
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        call = {"type": "tool_call", "name": "search_docs", "call_id": "c1", "args": {"q": "a"}}
+        print(json.dumps(call), flush=True)
+    elif msg["type"] == "tool_result":
+        print(json.dumps({"type": "final_output", "output": msg["result"]}), flush=True)
+        break
+"""
+
+
+def test_bundled_replay_never_touches_cassette_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    cassettes = [tmp_path / f"t{index}.jsonl" for index in range(3)]
+    for path in cassettes:
+        path.write_text(
+            '{"tool":"search_docs","args":{"q":"a"},"ok":true,"result":{"n":1}}\n',
+            encoding="utf-8",
+        )
+    bundle_path = tmp_path / "cassettes.rlbundle"
+    write_bundle(bundle_path, cassettes)
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="replay",
+        cases_path="cases",
+        tool_registry=["search_docs"],
+        cassette_bundle=str(bundle_path),
+    )
+    cases = [
+        CaseConfig(id=path.stem, input={}, cassette=str(path.resolve())) for path in cassettes
+    ]
+
+    touched: list[str] = []
+    real_open, real_stat = io.open, os.stat
+
+    def tracking_open(file, *args, **kwargs):
+        touched.append(os.fspath(file) if isinstance(file, (str, os.PathLike)) else "")
+        return real_open(file, *args, **kwargs)
+
+    def tracking_stat(path, *args, **kwargs):
+        touched.append(os.fspath(path) if isinstance(path, (str, os.PathLike)) else "")
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(io, "open", tracking_open)
+    monkeypatch.setattr(builtins, "open", tracking_open)
+    monkeypatch.setattr(os, "stat", tracking_stat)
+    result = run_suite(suite, cases)
+    monkeypatch.undo()
+
+    assert result.passed, [case.failure for case in result.cases]
+    assert not {str(path.resolve()) for path in cassettes} & {
+        str(Path(item).resolve()) for item in touched if item
+    }
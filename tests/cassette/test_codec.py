@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from runledger.cassette.codec import compress_cassette
+from runledger.cassette.loader import load_cassette
+from runledger.cassette.models import CassetteEntry
+from runledger.cassette.writer import CassetteWriter, append_entry, reset_cassette
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.xz"])
+def test_append_and_load_roundtrip(tmp_path: Path, suffix: str) -> None:
+    cassette_path = tmp_path / f"t1{suffix}"
+    reset_cassette(cassette_path)
+    append_entry(cassette_path, CassetteEntry(tool="search_docs", args={"q": "a"}, ok=True))
+    append_entry(
+        cassette_path,
+        CassetteEntry(tool="search_docs", args={"q": "b"}, ok=False, error="x"),
+    )
+
+    entries = load_cassette(cassette_path)
+
+    assert [entry.args["q"] for entry in entries] == ["a", "b"]
+    assert entries[1].error == "x"
+
+
+def test_compress_cassette_replaces_source(tmp_path: Path) -> None:
+    cassette_path = tmp_path / "t1.jsonl"
+    append_entry(cassette_path, CassetteEntry(tool="search_docs", args={"q": "a"}, ok=True))
+
+    gz_path = compress_cassette(cassette_path, "gz")
+    xz_path = compress_cassette(gz_path, "xz")
+
+    assert xz_path.name == "t1.jsonl.xz"
+    assert not cassette_path.exists()
+    assert not gz_path.exists()
+    assert load_cassette(xz_path)[0].args == {"q": "a"}
+
+
+def test_writer_compresses_a_recorded_case_in_one_member(tmp_path: Path) -> None:
+    cassette_path = tmp_path / "t1.jsonl.gz"
+    append_entry(cassette_path, CassetteEntry(tool="search_docs", args={"q": "old"}, ok=True))
+
+    writer = CassetteWriter(cassette_path, reset=True)
+    for query in ("a", "b", "c"):
+        writer.append(CassetteEntry(tool="search_docs", args={"q": query}, ok=True))
+    # Nothing is written until the case ends.
+    assert [entry.args["q"] for entry in load_cassette(cassette_path)] == ["old"]
+    writer.close()
+
+    assert [entry.args["q"] for entry in load_cassette(cassette_path)] == ["a", "b", "c"]
+    data = cassette_path.read_bytes()
+    # A single gzip member header, not one per entry.
+    assert data.count(b"\x1f\x8b\x08") == 1
@@ -3,7 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 
 from runledger.cassette.loader import load_cassette
-from runledger.cassette.match import find_match, format_mismatch_error
+from runledger.cassette.match import CassetteIndex, find_match, format_mismatch_error
+from runledger.cassette.rules import compile_match_rules
+from runledger.config.models import MatchRuleSpec, ToolOptionsSpec
 
 
 def _write_cassette(path: Path) -> None:
@@ -44,3 +46,53 @@ def test_format_mismatch_error_includes_available_entries(tmp_path: Path) -> Non
     assert "Requested tool: missing_tool" in message
     assert "Closest matches" in message
     assert "search_docs" in message
+
+
+def test_match_rules_normalize_volatile_args(tmp_path: Path) -> None:
+    cassette_path = tmp_path / "t1.jsonl"
+    cassette_path.write_text(
+        '{"tool":"search_docs","args":{"q":"reset","cursor":"abc","since":"2025-01-01T10:00:00Z",'
+        '"score":0.501},"ok":true,"result":{"hits":[]}}\n',
+        encoding="utf-8",
+    )
+    rules = compile_match_rules(
+        {
+            "search_docs": ToolOptionsSpec(
+                match=MatchRuleSpec(
+                    ignore_paths=["$.cursor"],
+                    normalizers=[{"pattern": r"\d{4}-\d{2}-\d{2}T[\d:]+Z", "replacement": "<ts>"}],
+                    numeric_tolerance=0.01,
+                )
+            )
+        }
+    )
+    index = CassetteIndex(load_cassette(cassette_path), rules)
+    requested = {"q": "reset", "cursor": "xyz", "since": "2026-10-19T08:30:00Z", "score": 0.499}
+
+    assert find_match(index, "search_docs", requested) is not None
+    assert find_match(load_cassette(cassette_path), "search_docs", requested, rules) is not None
+    assert find_match(index, "search_docs", {**requested, "q": "other"}) is None
+    assert find_match(load_cassette(cassette_path), "search_docs", requested) is None
+
+
+def test_numeric_tolerance_matches_by_distance(tmp_path: Path) -> None:
+    cassette_path = tmp_path / "t1.jsonl"
+    cassette_path.write_text(
+        '{"tool":"quote","args":{"rate":0.149,"n":[1.0,2]},"ok":true,"result":{"id":1}}\n'
+        '{"tool":"quote","args":{"rate":0.4,"n":[1.0,2]},"ok":true,"result":{"id":2}}\n',
+        encoding="utf-8",
+    )
+    rules = compile_match_rules(
+        {"quote": ToolOptionsSpec(match=MatchRuleSpec(numeric_tolerance=0.1))}
+    )
+    entries = load_cassette(cassette_path)
+    index = CassetteIndex(entries, rules)
+
+    # 0.149 and 0.151 round to different multiples of 0.1 but are 0.002 apart.
+    for candidates in (index, entries):
+        match = find_match(candidates, "quote", {"rate": 0.151, "n": [1, 2.05]}, rules)
+        assert match is not None and match.result == {"id": 1}
+        match = find_match(candidates, "quote", {"rate": 0.35, "n": [1, 2]}, rules)
+        assert match is not None and match.result == {"id": 2}
+        assert find_match(candidates, "quote", {"rate": 0.27, "n": [1, 2]}, rules) is None
+        assert find_match(candidates, "quote", {"rate": 0.15, "n": [1]}, rules) is None
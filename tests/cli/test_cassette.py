@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+
+def _run_cli(args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env.setdefault("PYTHONPATH", str(cwd / "src"))
+    return subprocess.run(
+        [sys.executable, "-m", "runledger", *args],
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        env=env,
+    )
+
+
+def _copy_demo_suite(root: Path, tmp_path: Path) -> Path:
+    suite_dir = tmp_path / "demo"
+    shutil.copytree(root / "examples" / "evals" / "demo", suite_dir)
+    suite_yaml = suite_dir / "suite.yaml"
+    suite = yaml.safe_load(suite_yaml.read_text(encoding="utf-8"))
+    suite["agent_command"] = [sys.executable, str(root / "examples" / "demo_agent_py" / "agent.py")]
+    suite.pop("baseline_path", None)
+    suite_yaml.write_text(yaml.safe_dump(suite, sort_keys=False), encoding="utf-8")
+    return suite_dir
+
+
+def test_cassette_compress_updates_cases_and_replays(tmp_path: Path) -> None:
+    root = Path(__file__).resolve().parents[2]
+    suite_dir = _copy_demo_suite(root, tmp_path)
+
+    result = _run_cli(["cassette", "compress", str(suite_dir), "--format", "xz"], cwd=root)
+
+    assert result.returncode == 0, result.stdout
+    assert (suite_dir / "cassettes" / "t1.jsonl.xz").is_file()
+    assert not (suite_dir / "cassettes" / "t1.jsonl").exists()
+    case_text = (suite_dir / "cases" / "t1.yaml").read_text(encoding="utf-8")
+    assert "cassette: cassettes/t1.jsonl.xz" in case_text
+    assert 'description: "triage a login ticket"' in case_text
+
+    replay = _run_cli(
+        ["run", str(suite_dir), "--mode", "replay", "--output-dir", str(tmp_path / "out")],
+        cwd=root,
+    )
+    assert replay.returncode == 0, replay.stdout
+
+
+def test_cassette_gc_drops_unused_entries(tmp_path: Path) -> None:
+    root = Path(__file__).resolve().parents[2]
+    suite_dir = _copy_demo_suite(root, tmp_path)
+    cassette_path = suite_dir / "cassettes" / "t1.jsonl"
+    original = cassette_path.read_text(encoding="utf-8")
+    cassette_path.write_text(
+        original
+        + '{"args":{"q":"stale"},"ok":true,"result":{"hits":[]},"tool":"search_docs"}\n',
+        encoding="utf-8",
+    )
+
+    result = _run_cli(["cassette", "gc", str(suite_dir)], cwd=root)
+
+    assert result.returncode == 0, result.stdout
+    assert "Removed 1 unused entries" in result.stdout
+    assert cassette_path.read_text(encoding="utf-8") == original
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules the lightweight commands must never load; each costs tens of milliseconds.
+_HEAVY_MODULES = {
+    "jinja2",
+    "jsonschema",
+    "yaml",
+    "runledger.artifacts",
+    "runledger.assertions",
+    "runledger.cassette",
+    "runledger.runner.engine",
+    "runledger.tools",
+}
+
+
+def _imported_modules(args: list[str], cwd: Path) -> set[str]:
+    env = os.environ.copy()
+    env.setdefault("PYTHONPATH", str(cwd / "src"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "runledger", *args],
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_diff_and_promote_skip_heavy_imports(tmp_path: Path) -> None:
+    root = Path(__file__).resolve().parents[2]
+    summary = root / "tests" / "golden" / "summary.json"
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    payload = json.loads(summary.read_text(encoding="utf-8"))
+    (run_dir / "summary.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    commands = [
+        ["diff", "--baseline", str(summary), "--run", str(run_dir)],
+        ["baseline", "promote", "--from", str(run_dir), "--to", str(tmp_path / "b.json")],
+    ]
+    for args in commands:
+        # Which modules load is deterministic; how long they take depends on the machine.
+        modules = _imported_modules(args, root)
+        assert not modules & _HEAVY_MODULES, (args[0], sorted(modules & _HEAVY_MODULES))
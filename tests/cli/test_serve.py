@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import socket
+import stat
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from runledger.serve import ServeState, SuiteSession, make_server
+
+AGENT = """
+import json
+import sys
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        call = {"type": "tool_call", "name": "search_docs", "call_id": "c1", "args": {"q": "x"}}
+        print(json.dumps(call), flush=True)
+    elif msg["type"] == "tool_result":
+        print(json.dumps({"type": "final_output", "output": {"status": "ok"}}), flush=True)
+        break
+"""
+
+FLAKY_TOOLS = """
+from pathlib import Path
+
+LOG = Path({log!r})
+
+
+class SearchDocs:
+    def setup(self):
+        with LOG.open("a") as out:
+            out.write("setup\\n")
+        raise RuntimeError("no database")
+
+    def teardown(self):
+        with LOG.open("a") as out:
+            out.write("teardown\\n")
+
+    def call(self, args):
+        return {{"hits": []}}
+
+
+TOOLS = {{"search_docs": SearchDocs()}}
+"""
+
+
+def _write_suite(root: Path) -> None:
+    (root / "agent.py").write_text(AGENT, encoding="utf-8")
+    (root / "suite.yaml").write_text(
+        json.dumps(
+            {
+                "suite_name": "served",
+                "agent_command": [sys.executable, "agent.py"],
+                "mode": "replay",
+                "cases_path": "cases",
+                "tool_registry": ["search_docs"],
+            }
+        ),
+        encoding="utf-8",
+    )
+    entry = {"tool": "search_docs", "args": {"q": "x"}, "ok": True, "result": {"hits": []}}
+    (root / "cassettes").mkdir()
+    (root / "cassettes" / "t1.jsonl").write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    (root / "cases").mkdir()
+    (root / "cases" / "t1.yaml").write_text(
+        "id: t1\ninput: {}\ncassette: cassettes/t1.jsonl\n", encoding="utf-8"
+    )
+
+
+def _post(
+    url: str, payload: dict[str, object], headers: dict[str, str] | None = None
+) -> list[dict[str, object]]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers=headers or {"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return [json.loads(line) for line in response.read().splitlines() if line]
+
+
+def _rejected(url: str, payload: dict[str, object], headers: dict[str, str] | None = None) -> int:
+    with pytest.raises(urllib.error.HTTPError) as info:
+        _post(url, payload, headers)
+    return info.value.code
+
+
+def test_serve_streams_cases_and_keeps_suite_warm(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    _write_suite(suite_dir)
+    state = ServeState([suite_dir], pool_size=1)
+    server = make_server(state, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    request = {"suite": str(suite_dir), "output_dir": "out"}
+    try:
+        first = _post(f"{base_url}/run", request)
+        second = _post(f"{base_url}/run", request)
+        with urllib.request.urlopen(f"{base_url}/health", timeout=5) as response:
+            health = json.loads(response.read())
+        indexed = len(state.session(suite_dir).cassette_indexes)
+    finally:
+        server.shutdown()
+        server.server_close()
+        state.close()
+
+    for lines in (first, second):
+        assert [line["type"] for line in lines] == ["case", "run_end"]
+        assert lines[0]["case_id"] == "t1" and lines[0]["passed"] is True
+        run_dir = Path(str(lines[1]["run_dir"]))
+        assert suite_dir / "out" in run_dir.parents
+        assert (run_dir / "summary.json").is_file()
+    assert first[1]["run_dir"] != second[1]["run_dir"]
+    assert health["suites"] == [{"suite": str(suite_dir.resolve()), "runs": 2}]
+    assert indexed == 1
+
+
+def test_serve_rejects_cross_site_and_unsafe_requests(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "suite"
+    other_dir = tmp_path / "other"
+    for directory in (suite_dir, other_dir):
+        directory.mkdir()
+        _write_suite(directory)
+    state = ServeState([suite_dir], pool_size=0)
+    server = make_server(state, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/run"
+    request = {"suite": str(suite_dir)}
+    try:
+        assert _rejected(url, request, {"Content-Type": "text/plain"}) == 415
+        rebound = {"Content-Type": "application/json", "Host": "attacker.example:8765"}
+        assert _rejected(url, request, rebound) == 403
+        assert _rejected(url, {**request, "output_dir": str(tmp_path / "elsewhere")}) == 400
+        assert _rejected(url, {**request, "baseline": "../baseline.json"}) == 400
+        assert _rejected(url, {**request, "changed_since": "--output=pwned"}) == 400
+        assert _rejected(url, {"suite": str(other_dir)}) == 403
+        assert _rejected(url, {"suite": str(other_dir / "suite.yaml")}) == 403
+    finally:
+        server.shutdown()
+        server.server_close()
+        state.close()
+    assert not (tmp_path / "elsewhere").exists()
+    assert [session.runs for session in state.sessions()] == [0]
+    assert not (other_dir / "runledger_out").exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_serve_unix_socket_is_owner_only(tmp_path: Path) -> None:
+    socket_path = tmp_path / "serve.sock"
+    state = ServeState([tmp_path], pool_size=0)
+    server = make_server(state, socket_path=socket_path)
+    try:
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+    finally:
+        server.server_close()
+        state.close()
+
+
+def test_serve_reports_failed_tool_setup_once(tmp_path: Path, monkeypatch) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    _write_suite(suite_dir)
+    suite_file = suite_dir / "suite.yaml"
+    suite = json.loads(suite_file.read_text(encoding="utf-8"))
+    suite.update({"mode": "live", "tool_module": "flaky_setup_tools"})
+    suite_file.write_text(json.dumps(suite), encoding="utf-8")
+    log = tmp_path / "lifecycle.log"
+    (tmp_path / "flaky_setup_tools.py").write_text(
+        FLAKY_TOOLS.format(log=str(log)), encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    state = ServeState([suite_dir], pool_size=0)
+    server = make_server(state, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/run"
+    request = {"suite": str(suite_dir), "output_dir": "out"}
+    try:
+        errors = []
+        for _ in range(2):
+            with pytest.raises(urllib.error.HTTPError) as info:
+                _post(url, request)
+            assert info.value.code == 400
+            errors.append(json.loads(info.value.read())["message"])
+    finally:
+        server.shutdown()
+        server.server_close()
+        state.close()
+        sys.modules.pop("flaky_setup_tools", None)
+
+    assert errors == ["Failed to set up tools: no database"] * 2
+    assert log.read_text(encoding="utf-8").split() == ["setup", "teardown"]
+    assert not (suite_dir / "out").exists()
+
+
+def test_session_reloads_tools_when_tool_module_changes(tmp_path: Path, monkeypatch) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    _write_suite(suite_dir)
+    suite_file = suite_dir / "suite.yaml"
+    suite = json.loads(suite_file.read_text(encoding="utf-8"))
+    suite.update({"mode": "live", "tool_module": "edited_serve_tools"})
+    suite_file.write_text(json.dumps(suite), encoding="utf-8")
+    tool_file = tmp_path / "edited_serve_tools.py"
+    source = "TOOLS = {{'search_docs': lambda args: {{'version': {version}}}}}\n"
+    tool_file.write_text(source.format(version=1), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    session = SuiteSession(suite_dir, pool_size=0)
+    try:
+        first = session.tools(session.suite())
+        tool_file.write_text(source.format(version=22), encoding="utf-8")
+        second = session.tools(session.suite())
+    finally:
+        session.close()
+        sys.modules.pop("edited_serve_tools", None)
+
+    assert first is not None and first["search_docs"].call({}) == {"version": 1}
+    assert second is not None and second["search_docs"].call({}) == {"version": 22}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from functools import partial
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+from runledger.serve import SuiteSession
+from runledger.watch import InotifyWatcher, PollWatcher, SuiteWatch
+
+AGENT = """
+import json
+import sys
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        call = {"type": "tool_call", "name": "search_docs", "call_id": "c1", "args": {"q": "x"}}
+        print(json.dumps(call), flush=True)
+    elif msg["type"] == "tool_result":
+        print(json.dumps({"type": "final_output", "output": {"status": "ok"}}), flush=True)
+        break
+"""
+
+
+def _write_suite(root: Path) -> None:
+    (root / "agent.py").write_text(AGENT, encoding="utf-8")
+    (root / "suite.yaml").write_text(
+        json.dumps(
+            {
+                "suite_name": "watched",
+                "agent_command": [sys.executable, "agent.py"],
+                "mode": "replay",
+                "cases_path": "cases",
+                "tool_registry": ["search_docs"],
+            }
+        ),
+        encoding="utf-8",
+    )
+    entry = {"tool": "search_docs", "args": {"q": "x"}, "ok": True, "result": {"hits": []}}
+    for case_id in ("a", "b"):
+        (root / "cassettes").mkdir(exist_ok=True)
+        (root / "cassettes" / f"{case_id}.jsonl").write_text(
+            json.dumps(entry) + "\n", encoding="utf-8"
+        )
+        (root / "cases").mkdir(exist_ok=True)
+        (root / "cases" / f"{case_id}.yaml").write_text(
+            f"id: {case_id}\ninput: {{}}\ncassette: cassettes/{case_id}.jsonl\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.mark.parametrize(
+    "open_watcher",
+    [
+        partial(PollWatcher, interval_s=0.05),
+        pytest.param(
+            InotifyWatcher,
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+            ),
+        ),
+    ],
+)
+def test_watchers_report_changed_files(tmp_path: Path, open_watcher) -> None:
+    (tmp_path / "cases").mkdir()
+    (tmp_path / ".runledger_cache").mkdir()
+    case_file = tmp_path / "cases" / "a.yaml"
+    case_file.write_text("id: a\n", encoding="utf-8")
+    watcher = open_watcher([tmp_path])
+    try:
+        assert watcher.poll(0.1) == set()
+        (tmp_path / ".runledger_cache" / "cases.json").write_text("{}", encoding="utf-8")
+        case_file.write_text("id: a\ninput: {}\n", encoding="utf-8")
+        (tmp_path / "cases" / "new").mkdir()
+        assert watcher.poll(2.0) == {case_file.resolve()}
+        nested = tmp_path / "cases" / "new" / "b.yaml"
+        nested.write_text("id: b\n", encoding="utf-8")
+        assert watcher.poll(2.0) == {nested.resolve()}
+    finally:
+        watcher.close()
+
+
+def test_suite_watch_reruns_only_affected_cases(tmp_path: Path, monkeypatch) -> None:
+    _write_suite(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    session = SuiteSession(tmp_path)
+    suite_watch = SuiteWatch(session)
+    try:
+        first = suite_watch.run()
+        assert first.full and [case.case_id for case in first.results] == ["a", "b"]
+
+        second = suite_watch.run({(tmp_path / "cassettes" / "b.jsonl").resolve()})
+        assert not second.full
+        assert [(case.case_id, case.passed) for case in second.results] == [("b", True)]
+        assert sorted(suite_watch.latest) == ["a", "b"]
+
+        third = suite_watch.run({(tmp_path / "agent.py").resolve()})
+        assert third.full and len(third.results) == 2
+    finally:
+        session.close()
+
+
+def test_suite_watch_reloads_changed_tool_module(tmp_path: Path, monkeypatch) -> None:
+    _write_suite(tmp_path)
+    suite_file = tmp_path / "suite.yaml"
+    suite = json.loads(suite_file.read_text(encoding="utf-8"))
+    suite_file.write_text(json.dumps({**suite, "tool_module": "watched_tools"}), encoding="utf-8")
+    tool_file = tmp_path / "watched_tools.py"
+    source = (
+        "from pathlib import Path\n\n"
+        "def search_docs(args):\n"
+        "    with Path('calls.log').open('a') as log:\n"
+        "        log.write('{version}\\n')\n"
+        "    return {{'hits': []}}\n\n"
+        "TOOLS = {{'search_docs': search_docs}}\n"
+    )
+    tool_file.write_text(source.format(version="v1"), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Same-size rewrites within one second would otherwise reuse the stale bytecode.
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.delitem(sys.modules, "watched_tools", raising=False)
+    session = SuiteSession(tmp_path)
+    suite_watch = SuiteWatch(session, mode="live", select=["a"])
+    try:
+        assert tool_file.resolve() in suite_watch.roots()
+        suite_watch.run()
+        tool_file.write_text(source.format(version="v2"), encoding="utf-8")
+        second = suite_watch.run({tool_file.resolve()})
+    finally:
+        session.close()
+        sys.modules.pop("watched_tools", None)
+
+    assert second.full and [case.case_id for case in second.results] == ["a"]
+    assert (tmp_path / "calls.log").read_text(encoding="utf-8").split() == ["v1", "v2"]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 import yaml
 
-from runledger.config.loader import load_cases, load_suite
+from runledger.config import loader
+from runledger.config.loader import iter_cases, load_cases, load_suite
 
 
 def _write_yaml(path: Path, data: dict) -> None:
@@ -50,3 +52,126 @@ def test_load_cases_orders_and_resolves_cassettes(tmp_path: Path) -> None:
 
     assert [case.id for case in cases] == ["a", "b"]
     assert cases[0].cassette == str((suite_dir / "cassettes/a.jsonl").resolve())
+
+
+def test_load_cases_reuses_parsed_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    suite_dir = tmp_path / "demo"
+    cases_dir = suite_dir / "cases"
+    cases_dir.mkdir(parents=True)
+    _write_yaml(cases_dir / "a.yaml", {"id": "a", "input": {}, "cassette": "a.jsonl"})
+    _write_yaml(cases_dir / "b.yaml", {"id": "b", "input": {}, "cassette": "b.jsonl"})
+    load_cases(suite_dir, "cases")
+    assert (suite_dir / ".runledger_cache" / "cases.json").is_file()
+
+    parsed: list[str] = []
+    original = loader._load_yaml_documents
+    monkeypatch.setattr(
+        loader, "_load_yaml_documents", lambda path: parsed.append(path.name) or original(path)
+    )
+    _write_yaml(cases_dir / "b.yaml", {"id": "b2", "input": {"q": 1}, "cassette": "b.jsonl"})
+
+    cases = load_cases(suite_dir, "cases")
+
+    assert parsed == ["b.yaml"]
+    assert [case.id for case in cases] == ["a", "b2"]
+    assert cases[0].cassette == str((suite_dir / "a.jsonl").resolve())
+
+
+def test_iter_cases_streams_multi_doc_yaml_and_jsonl(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "demo"
+    cases_dir = suite_dir / "cases"
+    cases_dir.mkdir(parents=True)
+    (cases_dir / "a.yaml").write_text(
+        "id: a1\ninput: {}\ncassette: a1.jsonl\n---\nid: a2\ninput: {}\ncassette: a2.jsonl\n",
+        encoding="utf-8",
+    )
+    (cases_dir / "b.jsonl").write_text(
+        '{"id": "b1", "input": {"q": 1}, "cassette": "b1.jsonl"}\n'
+        "\n"
+        "not json\n",
+        encoding="utf-8",
+    )
+
+    cases = iter_cases(suite_dir, "cases")
+
+    assert [next(cases).id for _ in range(3)] == ["a1", "a2", "b1"]
+    with pytest.raises(ValueError, match="line 3"):
+        next(cases)
+    dataset = load_cases(suite_dir, "cases/a.yaml")
+    assert [case.cassette for case in dataset] == [
+        str((suite_dir / "a1.jsonl").resolve()),
+        str((suite_dir / "a2.jsonl").resolve()),
+    ]
+
+
+def test_matrix_cases_expand_in_order_with_typed_params(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "demo"
+    cases_dir = suite_dir / "cases"
+    cases_dir.mkdir(parents=True)
+    _write_yaml(
+        cases_dir / "greet.yaml",
+        {
+            "id": "greet",
+            "matrix": {"lang": ["en", "fr"], "limit": [1, 5]},
+            "input": {"prompt": "Say hi in ${lang}", "limit": "${limit}", "raw": "${other}"},
+            "cassette": "cassettes/greet-${lang}-${limit}.jsonl",
+        },
+    )
+
+    cases = iter_cases(suite_dir, "cases")
+    first = next(cases)
+    rest = list(cases)
+
+    assert [case.id for case in [first, *rest]] == [
+        "greet[lang=en,limit=1]",
+        "greet[lang=en,limit=5]",
+        "greet[lang=fr,limit=1]",
+        "greet[lang=fr,limit=5]",
+    ]
+    assert first.input == {"prompt": "Say hi in en", "limit": 1, "raw": "${other}"}
+    assert rest[-1].cassette == str((suite_dir / "cassettes/greet-fr-5.jsonl").resolve())
+
+    _write_yaml(
+        cases_dir / "greet.yaml",
+        {
+            "id": "greet-${lang}",
+            "matrix": {"lang": ["en", "fr"], "limit": [1, 5]},
+            "input": {},
+            "cassette": "cassettes/${lang}-${limit}.jsonl",
+        },
+    )
+    assert [case.id for case in load_cases(suite_dir, "cases")] == [
+        "greet-en[limit=1]",
+        "greet-en[limit=5]",
+        "greet-fr[limit=1]",
+        "greet-fr[limit=5]",
+    ]
+
+    _write_yaml(
+        cases_dir / "greet.yaml",
+        {"id": "g", "matrix": {"lang": ["en"]}, "input": {}, "cassette": "g.jsonl"},
+    )
+    with pytest.raises(ValueError, match=r"\$\{lang\}"):
+        load_cases(suite_dir, "cases")
+
+    for missing_id in ({}, {"id": 7}):
+        _write_yaml(
+            cases_dir / "greet.yaml",
+            {**missing_id, "matrix": {"lang": ["en"]}, "input": {}, "cassette": "${lang}.jsonl"},
+        )
+        with pytest.raises(ValueError, match=r"CaseConfig\nid\n"):
+            load_cases(suite_dir, "cases")
+
+
+def test_iter_cases_rejects_broken_yaml_before_yielding(tmp_path: Path) -> None:
+    cases_dir = tmp_path / "cases"
+    cases_dir.mkdir()
+    _write_yaml(cases_dir / "a.yaml", {"id": "a", "input": {}, "cassette": "a.jsonl"})
+    (cases_dir / "b.yaml").write_text("id: b\ninput: [unclosed\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid YAML in .*b.yaml"):
+        iter_cases(tmp_path, "cases")
+
+    _write_yaml(cases_dir / "b.yaml", {"id": "b", "input": {}})
+    with pytest.raises(ValueError, match="cassette"):
+        iter_cases(tmp_path, "cases")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+from runledger.config import loader
+from runledger.config.loader import iter_cases
+from runledger.config.selection import CaseFilter, compile_tag_expression, git_changed_paths
+
+
+def _write_case(cases_dir: Path, case_id: str, tags: list[str]) -> None:
+    data = {"id": case_id, "input": {}, "cassette": f"cassettes/{case_id}.jsonl", "tags": tags}
+    (cases_dir / f"{case_id}.yaml").write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def test_select_exclude_and_tag_expressions(tmp_path: Path) -> None:
+    cases_dir = tmp_path / "cases"
+    cases_dir.mkdir()
+    _write_case(cases_dir, "billing-refund", ["smoke"])
+    _write_case(cases_dir, "billing-invoice", ["smoke", "slow"])
+    _write_case(cases_dir, "account-reset", ["smoke"])
+    _write_case(cases_dir, "account-delete", [])
+
+    def ids(case_filter: CaseFilter) -> list[str]:
+        return [case.id for case in iter_cases(tmp_path, "cases", case_filter=case_filter)]
+
+    assert ids(CaseFilter(select=("billing-*",), exclude=("tag:slow",))) == ["billing-refund"]
+    assert ids(CaseFilter(tags=compile_tag_expression("smoke and not (slow or billing)"))) == [
+        "account-reset",
+        "billing-refund",
+    ]
+    assert ids(CaseFilter(select=("tag:slow", "account-d*"))) == [
+        "account-delete",
+        "billing-invoice",
+    ]
+    with pytest.raises(ValueError):
+        compile_tag_expression("smoke and")
+
+
+def test_changed_since_selects_cases_by_file_and_cassette(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    cases_dir = tmp_path / "cases"
+    (tmp_path / "cassettes").mkdir()
+    cases_dir.mkdir()
+    for case_id in ("a", "b", "c"):
+        _write_case(cases_dir, case_id, [])
+        (tmp_path / "cassettes" / f"{case_id}.jsonl").write_text("", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+
+    _write_case(cases_dir, "a", ["edited"])
+    (tmp_path / "cassettes" / "b.jsonl").write_text("{}\n", encoding="utf-8")
+    _write_case(cases_dir, "d", [])
+
+    parsed: list[str] = []
+    parse = loader._load_yaml_documents
+    monkeypatch.setattr(
+        loader, "_load_yaml_documents", lambda path: parsed.append(path.name) or parse(path)
+    )
+    case_filter = CaseFilter(changed=git_changed_paths("HEAD", tmp_path))
+    selected = [
+        case.id
+        for case in iter_cases(tmp_path, "cases", use_cache=False, case_filter=case_filter)
+    ]
+    assert selected == ["a", "b", "d"]
+    # c.yaml neither changed nor names a changed file, so it is never parsed.
+    assert parsed == ["a.yaml", "b.yaml", "d.yaml"]
@@ -3,8 +3,15 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 from runledger.baseline.models import BaselineSummary
-from runledger.config.models import RegressionSpec
+from runledger.config.models import (
+    CaseRegressionSpec,
+    MetricGateSpec,
+    RegressionSpec,
+    SignificanceSpec,
+)
 from runledger.regression import compute_regression
 
 
@@ -15,6 +22,8 @@ def _summary(
     wall_p95: float,
     case_status: str = "pass",
     case_id: str = "t1",
+    extra_metrics: dict[str, dict[str, float]] | None = None,
+    cases: list[dict[str, object]] | None = None,
 ) -> BaselineSummary:
     payload = {
         "schema_version": 1,
@@ -40,10 +49,12 @@ def _summary(
                     "p95": wall_p95,
                     "mean": wall_mean,
                     "max": wall_p95,
-                }
+                },
+                **(extra_metrics or {}),
             },
         },
-        "cases": [
+        "cases": cases
+        or [
             {
                 "id": case_id,
                 "status": case_status,
@@ -80,3 +91,216 @@ def test_regression_checks_and_case_diffs() -> None:
     assert check_status["max_p95_wall_ms_delta_pct"] == "fail"
     assert result["case_diffs"]["missing_in_current"] == ["t1"]
     assert result["case_diffs"]["new_in_current"] == ["t2"]
+
+
+def test_regression_gates_on_timing_breakdown() -> None:
+    def timing(agent_p95: float, tool_p95: float) -> dict[str, dict[str, float]]:
+        return {
+            "agent_ms": {"mean": agent_p95, "p95": agent_p95},
+            "tool_wait_ms": {"mean": tool_p95, "p95": tool_p95},
+        }
+
+    baseline = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=timing(600, 300)
+    )
+    current = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=timing(610, 450)
+    )
+    thresholds = RegressionSpec(
+        max_p95_timing_delta_pct={"agent_ms": 0.1, "tool_wait_ms": 0.1, "spawn_ms": 0.1}
+    )
+
+    result = compute_regression(
+        baseline=baseline,
+        current=current,
+        thresholds=thresholds,
+        baseline_path=Path("baselines/demo.json"),
+    )
+
+    check_status = {check["id"]: check["status"] for check in result["checks"]}
+    assert check_status["max_p95_timing_delta_pct.agent_ms"] == "pass"
+    assert check_status["max_p95_timing_delta_pct.tool_wait_ms"] == "fail"
+    assert check_status["max_p95_timing_delta_pct.spawn_ms"] == "skipped"
+    assert result["passed"] is False
+    assert result["metrics"]["timings"]["tool_wait_ms"]["p95"]["delta_pct"] == 0.5
+
+
+def test_regression_gates_on_mean_cost() -> None:
+    def usage(tokens_out: float, cost_usd: float) -> dict[str, dict[str, float]]:
+        return {
+            "tokens_out": {"mean": tokens_out, "p95": tokens_out},
+            "cost_usd": {"mean": cost_usd, "p95": cost_usd},
+        }
+
+    baseline = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=usage(500, 0.01)
+    )
+    current = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=usage(520, 0.013)
+    )
+    thresholds = RegressionSpec(max_avg_tokens_out_delta_pct=0.1, max_avg_cost_usd_delta_pct=0.2)
+
+    result = compute_regression(
+        baseline=baseline,
+        current=current,
+        thresholds=thresholds,
+        baseline_path=Path("baselines/demo.json"),
+    )
+
+    check_status = {check["id"]: check["status"] for check in result["checks"]}
+    assert check_status["max_avg_tokens_out_delta_pct"] == "pass"
+    assert check_status["max_avg_cost_usd_delta_pct"] == "fail"
+    assert result["passed"] is False
+    assert "tokens_in" not in result["metrics"]["usage"]
+
+
+def test_regression_gates_on_significance() -> None:
+    def case(case_id: str, wall_ms: int, samples: list[int] | None = None) -> dict[str, object]:
+        payload: dict[str, object] = {
+            "id": case_id,
+            "status": "pass",
+            "wall_ms": wall_ms,
+            "tool_calls": 1,
+            "tool_errors": 0,
+            "assertions": {"total": 1, "failed": 0},
+        }
+        if samples is not None:
+            payload["samples"] = {"wall_ms": samples}
+        return payload
+
+    noisy_before = [1000, 1100, 900, 1050, 950]
+    noisy_after = [1010, 1090, 910, 1040, 960]
+    baseline_cases = [case(f"c{i:02d}", 1000) for i in range(28)]
+    baseline_cases += [
+        case("noisy", 1000, noisy_before),
+        case("slow", 1000, [1000, 1010, 1020, 1030, 1040]),
+    ]
+    # One case blows up; the rest are unchanged.
+    current_cases = [case("c00", 5000)] + [case(f"c{i:02d}", 1000) for i in range(1, 28)]
+    current_cases += [
+        case("noisy", 1000, noisy_after),
+        case("slow", 1300, [1300, 1310, 1320, 1330, 1340]),
+    ]
+    baseline = _summary(pass_rate=1.0, wall_mean=1000, wall_p95=1000, cases=baseline_cases)
+    current = _summary(pass_rate=1.0, wall_mean=1143, wall_p95=1300, cases=current_cases)
+    thresholds = RegressionSpec(
+        max_avg_wall_ms_delta_pct=0.1, significance=SignificanceSpec(resamples=500)
+    )
+
+    result = compute_regression(
+        baseline=baseline,
+        current=current,
+        thresholds=thresholds,
+        baseline_path=Path("baselines/demo.json"),
+    )
+
+    checks = {check["id"]: check for check in result["checks"]}
+    mean_check = checks["max_avg_wall_ms_delta_pct"]
+    # The point delta is over the threshold, but not across resampled cases.
+    assert mean_check["delta_pct"] > 0.1
+    assert mean_check["method"] == "bootstrap"
+    assert mean_check["ci"][0] <= 0.1 < mean_check["ci"][1]
+    assert mean_check["status"] == "pass"
+    case_check = checks["case_wall_ms_significance"]
+    assert case_check["cases_tested"] == 2
+    assert [item["id"] for item in case_check["regressed"]] == ["slow"]
+    assert case_check["status"] == "fail" and result["passed"] is False
+
+
+def test_regression_ranks_per_case_regressions() -> None:
+    def case(case_id: str, wall_ms: int, search_calls: int) -> dict[str, object]:
+        return {
+            "id": case_id,
+            "status": "pass",
+            "wall_ms": wall_ms,
+            "tool_calls": search_calls + 1,
+            "tool_errors": 0,
+            "tool_calls_by_name": {"search_docs": search_calls, "lookup": 1},
+            "assertions": {"total": 1, "failed": 0},
+        }
+
+    baseline_cases = [case(f"c{i}", 1000, 1) for i in range(50)] + [case("tiny", 10, 1)]
+    current_cases = [case(f"c{i}", 1000, 1) for i in range(47)]
+    current_cases += [case("c47", 1600, 1), case("c48", 5000, 4), case("c49", 2000, 2)]
+    current_cases += [case("tiny", 40, 1)]
+    baseline = _summary(pass_rate=1.0, wall_mean=1000, wall_p95=1000, cases=baseline_cases)
+    current = _summary(pass_rate=1.0, wall_mean=1100, wall_p95=2000, cases=current_cases)
+    thresholds = RegressionSpec(
+        max_avg_wall_ms_delta_pct=0.5,
+        per_case=CaseRegressionSpec(
+            max_wall_ms_delta_pct=0.5,
+            min_wall_ms_delta=100,
+            max_tool_calls_delta=0,
+            max_tool_calls_by_name_delta=2,
+            top_n=2,
+        ),
+    )
+
+    result = compute_regression(
+        baseline=baseline,
+        current=current,
+        thresholds=thresholds,
+        baseline_path=Path("baselines/demo.json"),
+    )
+
+    checks = {check["id"]: check for check in result["checks"]}
+    # The suite mean hides the regressions; the per-case checks do not.
+    assert checks["max_avg_wall_ms_delta_pct"]["status"] == "pass"
+    wall = checks["case_wall_ms_delta_pct"]
+    assert wall["status"] == "fail" and wall["regressed_total"] == 3
+    assert [(item["id"], item["delta_pct"]) for item in wall["regressed"]] == [
+        ("c48", 4.0),
+        ("c49", 1.0),
+    ]
+    calls = checks["case_tool_calls_delta"]
+    assert [(item["id"], item["delta"]) for item in calls["regressed"]] == [("c48", 3), ("c49", 1)]
+    by_name = checks["case_tool_calls_by_name_delta"]
+    assert by_name["regressed"] == [
+        {"id": "c48", "tool": "search_docs", "baseline": 1, "current": 4, "delta": 3}
+    ]
+    assert result["passed"] is False
+
+
+def test_regression_evaluates_declarative_metric_gates() -> None:
+    def metrics(tool_calls_p95: float, cost_mean: float) -> dict[str, dict[str, float]]:
+        return {
+            "tool_calls": {"mean": 2.0, "p95": tool_calls_p95},
+            "cost_usd": {"mean": cost_mean, "p95": cost_mean},
+        }
+
+    baseline = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=metrics(4, 0.05)
+    )
+    current = _summary(
+        pass_rate=1.0, wall_mean=1000, wall_p95=1000, extra_metrics=metrics(6, 0.06)
+    )
+    thresholds = RegressionSpec.model_validate(
+        {
+            "max_avg_cost_usd_delta_pct": 0.5,
+            "gates": [
+                {"metric": "tool_calls", "stat": "p95", "max_delta_pct": 0.25},
+                {"metric": "cost_usd", "stat": "mean", "max_abs": 0.02},
+                {"metric": "steps", "max_delta_pct": 0.1, "id": "steps_gate"},
+            ],
+        }
+    )
+
+    result = compute_regression(
+        baseline=baseline,
+        current=current,
+        thresholds=thresholds,
+        baseline_path=Path("baselines/demo.json"),
+    )
+
+    checks = {check["id"]: check for check in result["checks"]}
+    assert checks["max_avg_wall_ms_delta_pct"]["status"] == "skipped"
+    assert checks["max_avg_cost_usd_delta_pct"]["status"] == "pass"
+    assert checks["gates.tool_calls.p95"]["status"] == "fail"
+    assert checks["gates.tool_calls.p95"]["delta_pct"] == 0.5
+    assert checks["gates.cost_usd.mean"]["status"] == "pass"
+    assert checks["gates.cost_usd.mean"]["delta"] == pytest.approx(0.01)
+    assert checks["steps_gate"]["status"] == "skipped"
+    assert result["warnings"] == ["Gate steps_gate: no 'steps' metric in either summary."]
+    assert result["passed"] is False
+    with pytest.raises(ValueError, match="needs max_delta_pct or max_abs"):
+        MetricGateSpec(metric="tokens_out")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from runledger.regression.stats import (
+    _bootstrap_numpy,
+    _bootstrap_stdlib,
+    benjamini_hochberg,
+    bootstrap_delta_cis,
+    mann_whitney_greater,
+)
+
+
+def test_mann_whitney_and_benjamini_hochberg() -> None:
+    assert mann_whitney_greater(range(1, 9), range(5, 13)) == pytest.approx(0.00666, abs=1e-4)
+    assert mann_whitney_greater([5.0] * 6, [5.0] * 6) == 1.0
+    assert benjamini_hochberg([0.01, 0.04, 0.03, 0.5]) == pytest.approx(
+        [0.04, 0.0533333, 0.0533333, 0.5]
+    )
+
+
+def test_bootstrap_intervals_cover_a_uniform_slowdown() -> None:
+    rng = random.Random(1)
+    baseline = [rng.uniform(100, 2000) for _ in range(500)]
+    current = [value * 1.2 * rng.uniform(0.95, 1.05) for value in baseline]
+
+    intervals = bootstrap_delta_cis(baseline, current, resamples=300)
+
+    for stat in ("mean", "p95"):
+        low, high = intervals[stat]
+        assert low < 0.2 < high
+        assert high - low < 0.1
+    assert bootstrap_delta_cis([1.0], [2.0]) == {"mean": None, "p95": None}
+
+
+def test_bootstrap_draws_the_same_resamples_with_and_without_numpy() -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    baseline = [rng.uniform(100, 2000) for _ in range(37)]
+    current = [value * rng.uniform(0.8, 1.4) for value in baseline]
+
+    stdlib = _bootstrap_stdlib(baseline, current, 200, 3)
+    vectorized = _bootstrap_numpy(baseline, current, 200, 3)
+
+    assert vectorized["p95"] == stdlib["p95"]
+    assert vectorized["mean"] == pytest.approx(stdlib["mean"], rel=1e-12)
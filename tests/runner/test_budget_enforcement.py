@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_case
+
+_RUNAWAY_AGENT = """
+import itertools
+import json
+import json
+import sys
+
+def send(payload):
+    sys.stdout.write(json.dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+json.loads(sys.stdin.readline())
+for index in itertools.count():
+    send({"type": "tool_call", "name": "ping", "call_id": f"c{index}", "args": {"n": index}})
+    json.loads(sys.stdin.readline())
+"""
+
+_STUCK_AGENT = """
+import json
+import json
+import sys
+import time
+
+json.loads(sys.stdin.readline())
+time.sleep(60)
+"""
+
+
+def _suite(tmp_path: Path, agent: str, budgets: dict[str, int]) -> SuiteConfig:
+    (tmp_path / "agent.py").write_text(agent, encoding="utf-8")
+    return SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=["ping"],
+        tool_module="ping_tools",
+        budgets=budgets,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _ping_tools(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "ping_tools.py").write_text(
+        "CALLS = []\n"
+        "def ping(args):\n"
+        "    CALLS.append(args['n'])\n"
+        "    return {'pong': args['n']}\n"
+        "TOOLS = {'ping': ping}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop("ping_tools", None)
+
+
+def test_runaway_tool_loop_is_stopped_at_the_budget(tmp_path: Path) -> None:
+    suite = _suite(tmp_path, _RUNAWAY_AGENT, {"max_tool_calls": 3})
+    case = CaseConfig(id="t1", input={}, cassette=str(tmp_path / "t1.jsonl"))
+
+    result = run_case(suite, case)
+
+    assert result.failure is not None and result.failure.type == "budget_exceeded"
+    assert result.tool_calls == 4
+    # The call that broke the budget is traced but never executed.
+    assert sys.modules["ping_tools"].CALLS == [0, 1, 2]
+    event = next(event for event in result.trace if event["type"] == "budget_failure")
+    assert event["terminated"] is True
+    assert event["failures"] == [{"field": "max_tool_calls", "limit": 3, "actual": 4}]
+    assert [event["type"] for event in result.trace][-1] == "case_end"
+
+
+def test_stuck_agent_is_terminated_at_max_wall_ms(tmp_path: Path) -> None:
+    suite = _suite(tmp_path, _STUCK_AGENT, {"max_wall_ms": 300})
+    case = CaseConfig(id="t1", input={}, cassette=str(tmp_path / "t1.jsonl"))
+
+    started = time.monotonic()
+    result = run_case(suite, case)
+
+    assert time.monotonic() - started < 5
+    assert result.failure is not None and result.failure.type == "budget_exceeded"
+    assert "max_wall_ms limit=300" in result.failure.message
+
+
+_WAITING_AGENT = """
+import json
+import json
+import sys
+import time
+
+json.loads(sys.stdin.readline())
+call = {"type": "tool_call", "name": "block", "call_id": "c1", "args": {}}
+sys.stdout.write(json.dumps(call) + "\\n")
+sys.stdout.flush()
+time.sleep(60)
+"""
+
+
+def test_budget_breach_does_not_wait_for_calls_in_flight(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "blocking_tools.py").write_text(
+        "import threading\n"
+        "RELEASE = threading.Event()\n"
+        "FINISHED = []\n"
+        "def block(args):\n"
+        "    RELEASE.wait(60)\n"
+        "    FINISHED.append(True)\n"
+        "    return {'released': True}\n"
+        "TOOLS = {'block': block}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.delitem(sys.modules, "blocking_tools", raising=False)
+    suite = _suite(tmp_path, _WAITING_AGENT, {"max_wall_ms": 300}).model_copy(
+        update={"mode": "record", "tool_registry": ["block"], "tool_module": "blocking_tools"}
+    )
+    cassette_path = tmp_path / "t1.jsonl"
+    case = CaseConfig(id="t1", input={}, cassette=str(cassette_path))
+
+    try:
+        result = run_case(suite, case)
+        # The case ended while the call (which has no timeout_ms) was still blocked.
+        assert sys.modules["blocking_tools"].FINISHED == []
+    finally:
+        tools = sys.modules.get("blocking_tools")
+        if tools is not None:
+            tools.RELEASE.set()
+
+    assert result.failure is not None and result.failure.type == "budget_exceeded"
+    recorded = [json.loads(line) for line in cassette_path.read_text().splitlines()]
+    assert [(entry["tool"], entry["ok"]) for entry in recorded] == [("block", False)]
+    assert recorded[0]["error"].startswith("Tool call abandoned")
@@ -20,3 +20,14 @@ def test_check_budgets_detects_exceeding_values() -> None:
 
     fields = {entry["field"] for entry in failures}
     assert fields == {"max_wall_ms", "max_tool_calls", "max_tool_errors"}
+
+
+def test_check_budgets_resource_limits() -> None:
+    budget = BudgetSpec(max_rss_mb=64, max_cpu_ms=500)
+    failures = check_budgets(
+        budget, wall_ms=1, tool_calls=0, tool_errors=0, peak_rss_mb=80.5, cpu_ms=120.0
+    )
+    assert failures == [{"field": "max_rss_mb", "limit": 64, "actual": 80.5}]
+
+    # Missing measurements (no /proc, no rusage) never fail a budget.
+    assert check_budgets(budget, wall_ms=1, tool_calls=0, tool_errors=0) == []
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_case
+
+_AGENT = """
+import json
+import sys
+
+def send(payload):
+    sys.stdout.write(json.dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+results = {}
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        # Completion order c1, c2, c0: each call waits for the one named in "after".
+        for index, after in enumerate([2, None, 1]):
+            name = "slow_async" if index == 1 else "slow"
+            args = {"after": after, "n": index}
+            send({"type": "tool_call", "name": name, "call_id": f"c{index}", "args": args})
+    elif msg["type"] == "tool_result":
+        results[msg["call_id"]] = msg["result"]["n"]
+        if len(results) == 3:
+            send({"type": "final_output", "output": {"results": results}})
+            break
+"""
+
+_TOOLS = """
+import asyncio
+import threading
+import time
+
+# Every call blocks until all three are running, so a serial executor fails the case.
+STARTED = threading.Barrier(3, timeout=10)
+DONE = [threading.Event() for _ in range(3)]
+
+def slow(args):
+    STARTED.wait()
+    if args["after"] is not None:
+        DONE[args["after"]].wait(10)
+        # Leave the earlier call time to hand its result back first.
+        time.sleep(0.1)
+    DONE[args["n"]].set()
+    return {"n": args["n"]}
+
+async def slow_async(args):
+    return await asyncio.to_thread(slow, args)
+
+TOOLS = {"slow": slow, "slow_async": slow_async}
+"""
+
+
+def test_parallel_tool_calls_complete_out_of_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    (tmp_path / "parallel_tools.py").write_text(_TOOLS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="record",
+        cases_path="cases",
+        tool_registry=["slow", "slow_async"],
+        tool_module="parallel_tools",
+    )
+    cassette_path = tmp_path / "t1.jsonl"
+    case = CaseConfig(id="t1", input={}, cassette=str(cassette_path))
+
+    result = run_case(suite, case)
+
+    assert result.passed, result.failure
+    assert result.output == {"results": {"c0": 0, "c1": 1, "c2": 2}}
+    calls = [event for event in result.trace if event["type"] == "tool_call"]
+    completed = [event for event in result.trace if event["type"] == "tool_result"]
+    assert [event["call_id"] for event in completed] == ["c1", "c2", "c0"]
+    # All three were issued before any result came back.
+    assert max(event["timestamp"] for event in calls) <= completed[0]["timestamp"]
+    recorded = [json.loads(line)["args"]["n"] for line in cassette_path.read_text().splitlines()]
+    assert recorded == [0, 1, 2]
+
+
+_TIMEOUT_AGENT = """
+import json
+import sys
+
+def send(payload):
+    sys.stdout.write(json.dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+errors = {}
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        for index, name in enumerate(["slow", "slow_async"]):
+            args = {"n": index}
+            send({"type": "tool_call", "name": name, "call_id": f"c{index}", "args": args})
+    elif msg["type"] == "tool_result":
+        errors[msg["call_id"]] = msg["error"]
+        if len(errors) == 2:
+            send({"type": "final_output", "output": {"errors": errors}})
+            break
+"""
+
+
+_TIMEOUT_TOOLS = """
+import asyncio
+import threading
+
+RELEASE = threading.Event()
+FINISHED = []
+
+def slow(args):
+    RELEASE.wait(30)
+    FINISHED.append(args["n"])
+    return {"n": args["n"]}
+
+async def slow_async(args):
+    await asyncio.sleep(30)
+    FINISHED.append(args["n"])
+    return {"n": args["n"]}
+
+TOOLS = {"slow": slow, "slow_async": slow_async}
+"""
+
+
+def test_tool_timeout_is_reported_as_tool_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "agent.py").write_text(_TIMEOUT_AGENT, encoding="utf-8")
+    (tmp_path / "timeout_tools.py").write_text(_TIMEOUT_TOOLS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=["slow", "slow_async"],
+        tool_module="timeout_tools",
+        tool_options={"slow": {"timeout_ms": 200}, "slow_async": {"timeout_ms": 300}},
+    )
+    case = CaseConfig(id="t1", input={}, cassette=str(tmp_path / "t1.jsonl"))
+
+    try:
+        result = run_case(suite, case)
+        # The case finished while both calls were still blocked.
+        assert sys.modules["timeout_tools"].FINISHED == []
+    finally:
+        tools = sys.modules.get("timeout_tools")
+        if tools is not None:
+            tools.RELEASE.set()
+
+    assert result.passed, result.failure
+    assert result.output == {
+        "errors": {
+            "c0": "Tool timed out after 200 ms",
+            "c1": "Tool timed out after 300 ms",
+        }
+    }
+    assert result.tool_errors_by_name == {"slow": 1, "slow_async": 1}
+    results = [event for event in result.trace if event["type"] == "tool_result"]
+    assert [event.get("error_type") for event in results] == ["tool_timeout", "tool_timeout"]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_case
+from runledger.runner.executor import ToolExecutor, ToolJob, rate_limit_blocked_s
+from runledger.runner.ratelimit import RateLimiter
+from runledger.tools.registry import FunctionTool
+
+
+def test_rate_limiter_bucket_and_in_flight_cap() -> None:
+    limiter = RateLimiter(rps=20, burst=2)
+    waits = [limiter.acquire() for _ in range(4)]
+    assert waits[0] < 0.01 and waits[1] < 0.01
+    assert sum(waits) >= 0.08
+
+    capped = RateLimiter(max_in_flight=1)
+    capped.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (capped.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.1)
+    capped.release()
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_blocked_time_counts_overlapping_waits_once() -> None:
+    def job(waited_from: float, wait_s: float, ran_until: float) -> ToolJob:
+        return ToolJob(
+            call_id="c",
+            name="ping",
+            args={},
+            rate_limit_started_at=waited_from,
+            rate_limit_wait_s=wait_s,
+            started_at=waited_from + wait_s,
+            finished_at=ran_until,
+        )
+
+    # Three calls wait from t=0 for 1 s each, then run together until t=1.5.
+    assert rate_limit_blocked_s([job(0, 1, 1.5) for _ in range(3)], now=2) == pytest.approx(1)
+    # A wait while another call is running is not idle time.
+    assert rate_limit_blocked_s([job(0, 0, 2), job(0.5, 2, 3)], now=3) == pytest.approx(0.5)
+
+
+def test_expired_call_keeps_its_in_flight_slot_until_it_returns() -> None:
+    release = threading.Event()
+    limiter = RateLimiter(max_in_flight=1)
+    executor = ToolExecutor(max_workers=2)
+    try:
+        stuck = ToolJob(call_id="c1", name="slow", args={}, timeout_s=0.01)
+        executor.submit(stuck, FunctionTool("slow", lambda args: release.wait(5)), limiter=limiter)
+        while stuck.started_at is None:
+            time.sleep(0.005)
+        assert executor.expire(stuck)
+        follower = ToolJob(call_id="c2", name="slow", args={})
+        executor.submit(follower, FunctionTool("slow", lambda args: "ok"), limiter=limiter)
+        assert not follower.done.wait(0.2)
+        release.set()
+        assert follower.done.wait(2) and follower.result == "ok"
+    finally:
+        release.set()
+        executor.close()
+
+
+_AGENT = """
+import json
+import sys
+
+def send(payload):
+    sys.stdout.write(json.dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+seen = 0
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        for index in range(3):
+            call = {"type": "tool_call", "name": "ping", "call_id": f"c{index}"}
+            send({**call, "args": {"n": index}})
+    else:
+        seen += 1
+        if seen == 3:
+            send({"type": "final_output", "output": {"ok": True}})
+            break
+"""
+
+
+def test_rate_limit_wait_is_traced_and_excluded_from_wall_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    (tmp_path / "ping_tools.py").write_text(
+        "TOOLS = {'ping': lambda args: {'pong': args['n']}}\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=["ping"],
+        tool_module="ping_tools",
+        tool_options={"ping": {"rate_limit": {"rps": 4, "burst": 1}}},
+        budgets={"max_wall_ms": 450},
+    )
+    case = CaseConfig(id="t1", input={}, cassette=str(tmp_path / "t1.jsonl"))
+
+    started = time.monotonic()
+    result = run_case(suite, case)
+
+    assert time.monotonic() - started >= 0.5
+    assert result.passed, result.failure
+    # Waits of 0, 250 and 500 ms overlap: the case was held up for ~500 ms, not 750.
+    assert 450 <= result.rate_limit_wait_ms < 700
+    results = [event for event in result.trace if event["type"] == "tool_result"]
+    waits = [event["rate_limit_wait_ms"] for event in results]
+    assert len(waits) == 3 and max(waits) >= 450
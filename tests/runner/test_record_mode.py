@@ -6,6 +6,7 @@ from pathlib import Path
 
 from runledger.config.models import CaseConfig, SuiteConfig
 from runledger.runner.engine import run_case
+from runledger.runner.timings import TIMING_FIELDS
 
 
 def _write_agent(path: Path) -> None:
@@ -63,3 +64,37 @@ def test_record_mode_writes_cassette(tmp_path: Path) -> None:
     entry = json.loads(lines[0])
     assert entry["tool"] == "search_docs"
     assert entry["args"] == {"q": "hello"}
+
+    timings = result.timings
+    assert timings is not None
+    assert set(timings) == set(TIMING_FIELDS)
+    assert timings["first_message_ms"] is not None and timings["first_message_ms"] > 0
+    partition = ("spawn_ms", "agent_ms", "tool_wait_ms", "assertions_ms", "harness_ms")
+    assert abs(sum(timings[name] for name in partition) - result.wall_ms) <= 1.5
+    tool_result = next(event for event in result.trace if event["type"] == "tool_result")
+    assert tool_result["duration_ms"] >= 0
+    assert all("agent_ms" in event for event in result.trace if event["type"] == "tool_call")
+
+
+def test_hybrid_mode_records_only_missing_calls(tmp_path: Path) -> None:
+    agent_path = tmp_path / "agent.py"
+    _write_agent(agent_path)
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(agent_path)],
+        mode="hybrid",
+        cases_path="cases",
+        tool_registry=["search_docs"],
+    )
+    cassette_path = tmp_path / "cassettes" / "t1.jsonl"
+    case = CaseConfig(id="t1", input={"prompt": "hi"}, cassette=str(cassette_path))
+
+    first = run_case(suite, case)
+    assert first.passed
+    assert [event["type"] for event in first.trace].count("cassette_append") == 1
+
+    second = run_case(suite, case)
+    assert second.passed
+    assert "cassette_append" not in [event["type"] for event in second.trace]
+    assert len(cassette_path.read_text(encoding="utf-8").splitlines()) == 1
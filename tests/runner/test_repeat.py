@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_suite
+from runledger.runner.models import CaseResult, Failure
+from runledger.runner.repeat import merge_repeats
+
+
+def _result(case_id: str, wall_ms: int, *, passed: bool = True) -> CaseResult:
+    return CaseResult(
+        case_id=case_id,
+        passed=passed,
+        output=None,
+        trace=[],
+        wall_ms=wall_ms,
+        tool_calls=1,
+        tool_errors=0,
+        tokens_out=10 if case_id == "a" else None,
+        failure=None if passed else Failure(type="assertion_failed", message="boom"),
+    )
+
+
+def test_merge_repeats_keeps_samples_and_any_failure() -> None:
+    runs = [
+        _result("a", 30),
+        _result("b", 5),
+        _result("a", 10),
+        _result("b", 7, passed=False),
+        _result("a", 20),
+        _result("b", 6),
+    ]
+
+    merged = merge_repeats(runs)
+
+    assert [case.case_id for case in merged] == ["a", "b"]
+    steady, flaky = merged
+    assert steady.passed and steady.wall_ms == 20
+    assert steady.samples == {
+        "wall_ms": [30, 10, 20],
+        "tool_calls": [1, 1, 1],
+        "tokens_out": [10, 10, 10],
+    }
+    assert not flaky.passed and flaky.wall_ms == 7
+    assert flaky.samples is not None and flaky.samples["wall_ms"] == [5, 7, 6]
+
+
+_AGENT = """
+import json
+import sys
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        print(json.dumps({"type": "final_output", "output": {"ok": True}}), flush=True)
+        break
+"""
+
+
+def test_on_case_gets_each_case_once_merged(tmp_path: Path) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=[],
+    )
+    cases = [
+        CaseConfig(id=case_id, input={}, cassette=str(tmp_path / f"{case_id}.jsonl"))
+        for case_id in ("a", "b")
+    ]
+    streamed: list[CaseResult] = []
+
+    result = run_suite(suite, cases, on_case=streamed.append, repeat=3)
+
+    assert [case.case_id for case in streamed] == ["a", "b"]
+    assert streamed == result.cases
+    assert all(case.samples is not None and len(case.samples["wall_ms"]) == 3 for case in streamed)
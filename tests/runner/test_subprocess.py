@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
 
 from runledger.runner.subprocess import AgentProcess
@@ -50,3 +51,16 @@ def test_agent_process_roundtrip(tmp_path: Path) -> None:
         final = agent.recv()
         assert final.type == "final_output"
         assert final.output["status"] == "ok"
+
+
+def test_agent_process_reports_resource_usage() -> None:
+    code = "import time; block = bytearray(80 * 1024 * 1024); time.sleep(0.3)"
+    agent = AgentProcess([sys.executable, "-c", code], timeout_s=2)
+    with agent:
+        time.sleep(0.5)
+
+    usage = agent.resource_usage
+    assert usage is not None
+    assert usage.peak_rss_mb > 60
+    assert usage.cpu_ms > 0
+    assert usage.ctx_switches > 0
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_case, run_suite
+
+_AGENT = """
+import json
+import sys
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg["type"] == "task_start":
+        call = {"type": "tool_call", "name": "lookup", "call_id": "c1", "args": {}}
+        sys.stdout.write(json.dumps(call) + "\\n")
+    else:
+        final = {"type": "final_output", "output": msg["result"]}
+        sys.stdout.write(json.dumps(final) + "\\n")
+        sys.stdout.flush()
+        break
+    sys.stdout.flush()
+"""
+
+_TOOLS = """
+EVENTS = []
+
+
+class Lookup:
+    def __init__(self):
+        EVENTS.append("init")
+        self.pool = None
+
+    def setup(self):
+        EVENTS.append("setup")
+        self.pool = "pool"
+
+    def teardown(self):
+        EVENTS.append("teardown")
+        self.pool = None
+
+    def call(self, args):
+        return {"pool": self.pool}
+
+
+TOOLS = {"lookup": Lookup()}
+"""
+
+
+def test_tools_are_set_up_once_per_suite(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    (tmp_path / "lifecycle_tools.py").write_text(_TOOLS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=["lookup"],
+        tool_module="lifecycle_tools",
+    )
+    cases = [
+        CaseConfig(id=f"t{index}", input={}, cassette=str(tmp_path / f"t{index}.jsonl"))
+        for index in range(3)
+    ]
+
+    result = run_suite(suite, cases)
+
+    assert result.passed
+    assert [case.output for case in result.cases] == [{"pool": "pool"}] * 3
+    events = sys.modules["lifecycle_tools"].EVENTS
+    assert events == ["init", "setup", "teardown"]
+
+
+def test_failing_teardown_keeps_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    (tmp_path / "broken_teardown_tools.py").write_text(
+        _TOOLS.replace('EVENTS.append("teardown")', 'raise RuntimeError("pool already closed")'),
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="live",
+        cases_path="cases",
+        tool_registry=["lookup"],
+        tool_module="broken_teardown_tools",
+    )
+    case = CaseConfig(id="t0", input={}, cassette=str(tmp_path / "t0.jsonl"))
+
+    with pytest.warns(RuntimeWarning, match="Tool teardown failed: lookup: pool already closed"):
+        result = run_suite(suite, [case])
+    assert result.passed and result.total_cases == 1
+
+    alone = run_case(suite, case)
+    assert alone.failure is not None
+    assert alone.failure.type == "tool_teardown_error"
+    assert alone.failure.message == "lookup: pool already closed"
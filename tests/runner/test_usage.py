@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from runledger.config.models import CaseConfig, SuiteConfig
+from runledger.runner.engine import run_case
+
+_AGENT = """
+import json
+import sys
+
+def send(payload):
+    sys.stdout.write(json.dumps(payload) + "\\n")
+    sys.stdout.flush()
+
+json.loads(sys.stdin.readline())
+send({"type": "usage", "tokens_in": 100, "tokens_out": 40, "cost_usd": 0.002, "steps": 1})
+send({"type": "usage", "tokens_in": 120, "tokens_out": 40, "cost_usd": 0.002, "steps": 1})
+usage = {"tokens_out": 30, "cost_usd": 0.001, "steps": 1}
+send({"type": "final_output", "output": {"ok": True}, "usage": usage})
+"""
+
+
+def test_reported_usage_is_summed_and_budgeted(tmp_path: Path) -> None:
+    (tmp_path / "agent.py").write_text(_AGENT, encoding="utf-8")
+    suite = SuiteConfig(
+        suite_name="demo",
+        agent_command=[sys.executable, str(tmp_path / "agent.py")],
+        mode="record",
+        cases_path="cases",
+        tool_registry=[],
+        budgets={"max_tokens_out": 100, "max_cost_usd": 0.01},
+    )
+    case = CaseConfig(id="t1", input={}, cassette=str(tmp_path / "t1.jsonl"))
+
+    result = run_case(suite, case)
+
+    assert (result.tokens_in, result.tokens_out, result.steps) == (220, 110, 3)
+    assert result.cost_usd == 0.005
+    assert result.failure is not None and result.failure.type == "budget_exceeded"
+    budget_event = next(event for event in result.trace if event["type"] == "budget_failure")
+    assert budget_event["failures"] == [{"field": "max_tokens_out", "limit": 100, "actual": 110}]
+    assert [event["type"] for event in result.trace].count("usage") == 2
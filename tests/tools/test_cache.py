@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from runledger.config.models import ToolCacheSpec, ToolOptionsSpec
+from runledger.tools import cache as cache_module
+from runledger.tools.cache import CachedTool, ToolResultCache, wrap_cached_tools
+from runledger.tools.registry import FunctionTool
+
+
+def test_cache_hits_expire_and_evict_by_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ToolResultCache(max_bytes=40)
+
+    cache.put("search", {"q": "a"}, {"hits": "aaaa"}, ttl_s=10)
+    assert cache.get("search", {"q": "a"}) == (True, {"hits": "aaaa"})
+
+    now[0] += 11
+    assert cache.get("search", {"q": "a"}) == (False, None)
+
+    cache.put("search", {"q": "a"}, {"hits": "aaaa"}, ttl_s=None)
+    cache.put("search", {"q": "b"}, {"hits": "bbbb"}, ttl_s=None)
+    cache.put("search", {"q": "c"}, {"hits": "cccc"}, ttl_s=None)
+    assert cache.get("search", {"q": "a"}) == (False, None)
+    assert cache.get("search", {"q": "c"})[0] is True
+
+    assert cache.stats()["search"] == {"hits": 2, "misses": 2, "evictions": 1}
+
+
+def test_cached_tool_reuses_disk_results(tmp_path: Path) -> None:
+    calls: list[dict] = []
+
+    def lookup(args: dict) -> dict:
+        calls.append(args)
+        return {"value": args["id"]}
+
+    spec = ToolCacheSpec(path=str(tmp_path / "cache"))
+    tools = {"lookup": FunctionTool(name="lookup", handler=lookup)}
+    options = {"lookup": ToolOptionsSpec(cache_ttl_s=60)}
+
+    first = wrap_cached_tools(tools, ToolResultCache(1024, tmp_path / "cache"), spec, options)
+    second = wrap_cached_tools(tools, ToolResultCache(1024, tmp_path / "cache"), spec, options)
+
+    assert isinstance(first["lookup"], CachedTool)
+    assert first["lookup"].call({"id": 1}) == {"value": 1}
+    assert second["lookup"].call({"id": 1}) == {"value": 1}
+    assert len(calls) == 1
+    assert wrap_cached_tools(tools, ToolResultCache(1024), spec, {})["lookup"] is tools["lookup"]